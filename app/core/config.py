@@ -10,21 +10,107 @@ class Config:
     APP_ENV = os.getenv("APP_ENV", "development")
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
+    # SERVER (python -m scripts.serve)
+    HOST = os.getenv("HOST", "0.0.0.0")
+    PORT = int(os.getenv("PORT", 8000))
+    WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", 0))  # worker processes; 0 → one per allotted core
+    # Tables/indexes at startup; elsewhere run `python -m scripts.migrate` once per deploy
+    AUTO_MIGRATE = os.getenv("AUTO_MIGRATE", "true" if APP_ENV == "development" else "false").lower() == "true"
+    # Periodic jobs run in one process per host (file lock); false → none here
+    RUN_SCHEDULER = os.getenv("RUN_SCHEDULER", "true").lower() == "true"
+    SCHEDULER_LOCK_FILE = os.getenv("SCHEDULER_LOCK_FILE", "/tmp/political-voting-scheduler.lock")
+
     # DATABASE
+    # Full SQLAlchemy URLs override the DB_* parts (e.g. sqlite+aiosqlite:///./primary.db)
+    DATABASE_URL = os.getenv("DATABASE_URL")
+    READ_DATABASE_URL = os.getenv("READ_DATABASE_URL")
     DB_USERNAME = os.getenv("DB_USERNAME")
     DB_PASSWORD = os.getenv("DB_PASSWORD")
     DB_HOST = os.getenv("DB_HOST")
     DB_PORT = os.getenv("DB_PORT", "3306")
     DB_NAME = os.getenv("DB_NAME")
 
+    # CONNECTION POOL (per process)
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 20))
+    DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", 30))
+    # Keep below MySQL wait_timeout so idle connections are replaced before the server drops them
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+    DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "false").lower() == "true"
+
     # JWT
     SECRET_KEY = os.getenv("SECRET_KEY")
     ALGORITHM = os.getenv("ALGORITHM", "HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 60))
 
+    # PASSWORD HASHING
+    BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", 12))
+    PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", 2))
+
+    # AUTH CACHE
+    ADMIN_CACHE_TTL_SECONDS = int(os.getenv("ADMIN_CACHE_TTL_SECONDS", 30))
+    ADMIN_CACHE_MAX_SIZE = int(os.getenv("ADMIN_CACHE_MAX_SIZE", 1024))
+    TOKEN_CACHE_MAX_SIZE = int(os.getenv("TOKEN_CACHE_MAX_SIZE", 10000))
+
+    # OTP
+    OTP_BACKEND = os.getenv("OTP_BACKEND", "database")  # database | memory
+    OTP_TTL_SECONDS = int(os.getenv("OTP_TTL_SECONDS", 300))
+    OTP_MAX_SENDS = int(os.getenv("OTP_MAX_SENDS", 3))
+    OTP_RATE_WINDOW_SECONDS = int(os.getenv("OTP_RATE_WINDOW_SECONDS", 900))
+    OTP_PURGE_INTERVAL_MINUTES = int(os.getenv("OTP_PURGE_INTERVAL_MINUTES", 10))
+
+    # GEOGRAPHY CACHE (ward → location names, per process)
+    GEOGRAPHY_CACHE_TTL_SECONDS = int(os.getenv("GEOGRAPHY_CACHE_TTL_SECONDS", 3600))
+    GEOGRAPHY_CACHE_MAX_SIZE = int(os.getenv("GEOGRAPHY_CACHE_MAX_SIZE", 200000))
+
+    # NOMINATION STATS
+    # Reviews and new candidates update the counters directly; the repair
+    # recount only corrects drift (0 = never, run it by hand instead)
+    NOMINATION_STATS_REPAIR_HOURS = int(os.getenv("NOMINATION_STATS_REPAIR_HOURS", 24))
+
+    # BACKGROUND JOBS (jobs table + worker on every replica)
+    JOB_WORKER_CONCURRENCY = int(os.getenv("JOB_WORKER_CONCURRENCY", 4))  # per process, all kinds
+    JOB_POLL_SECONDS = int(os.getenv("JOB_POLL_SECONDS", 2))
+    JOB_STALE_SECONDS = int(os.getenv("JOB_STALE_SECONDS", 120))  # no heartbeat → re-queued
+    JOB_RETRY_BASE_SECONDS = int(os.getenv("JOB_RETRY_BASE_SECONDS", 30))  # doubles per attempt
+    JOB_PROGRESS_INTERVAL_SECONDS = float(os.getenv("JOB_PROGRESS_INTERVAL_SECONDS", 1.0))
+    JOB_SHUTDOWN_GRACE_SECONDS = int(os.getenv("JOB_SHUTDOWN_GRACE_SECONDS", 20))
+
+    # CPU EXECUTOR (process pool for TF-IDF search and NumPy analytics)
+    CPU_WORKERS = int(os.getenv("CPU_WORKERS", 2))  # 0 → default thread executor (dev/tests)
+    CPU_MAX_PENDING = int(os.getenv("CPU_MAX_PENDING", 16))  # queued + running per app process
+    CPU_QUEUE_TIMEOUT_SECONDS = float(os.getenv("CPU_QUEUE_TIMEOUT_SECONDS", 2.0))  # then 503
+    CPU_TASK_TIMEOUT_SECONDS = float(os.getenv("CPU_TASK_TIMEOUT_SECONDS", 30.0))  # then 504
+
+    # HEALTH PROBES (/health/live, /health/ready)
+    HEALTH_CACHE_SECONDS = float(os.getenv("HEALTH_CACHE_SECONDS", 5.0))  # readiness result reuse
+    HEALTH_DB_TIMEOUT_SECONDS = float(os.getenv("HEALTH_DB_TIMEOUT_SECONDS", 1.0))
+    HEALTH_TICK_MAX_AGE_SECONDS = int(os.getenv("HEALTH_TICK_MAX_AGE_SECONDS", 30))  # job worker polls every JOB_POLL_SECONDS
+    HEALTH_OTP_BACKLOG_MAX = int(os.getenv("HEALTH_OTP_BACKLOG_MAX", 50))  # queued OTP emails
+
+    # METRICS
+    METRICS_TOKEN = os.getenv("METRICS_TOKEN")  # unset → /metrics is open (keep it off the public ingress)
+
+    # QUERY INSTRUMENTATION
+    SLOW_QUERY_MS = int(os.getenv("SLOW_QUERY_MS", 200))
+    N_PLUS_ONE_THRESHOLD = int(os.getenv("N_PLUS_ONE_THRESHOLD", 5))
+    QUERY_DEBUG_HEADER = os.getenv(
+        "QUERY_DEBUG_HEADER", "true" if APP_ENV == "development" else "false"
+    ).lower() == "true"
+
+    # PROFILING (pyinstrument, on demand or sampled)
+    PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "true").lower() == "true"
+    PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", 0.0))  # e.g. 0.001 in production
+    PROFILE_DIR = os.getenv("PROFILE_DIR", "profiles")
+    PROFILE_MAX_FILES = int(os.getenv("PROFILE_MAX_FILES", 50))
+
     # EMAIL
     SMTP_HOST = os.getenv("SMTP_HOST", "smtp.gmail.com")
     SMTP_PORT = int(os.getenv("SMTP_PORT", 587))
     SMTP_USER = os.getenv("SMTP_USER")
     SMTP_PASSWORD = os.getenv("SMTP_PASSWORD")
     FROM_EMAIL = os.getenv("FROM_EMAIL")
+    SMTP_TIMEOUT_SECONDS = int(os.getenv("SMTP_TIMEOUT_SECONDS", 10))
+    SMTP_KEEPALIVE_SECONDS = int(os.getenv("SMTP_KEEPALIVE_SECONDS", 60))
+    EMAIL_OTP_WORKERS = int(os.getenv("EMAIL_OTP_WORKERS", 1))
+    EMAIL_BULK_WORKERS = int(os.getenv("EMAIL_BULK_WORKERS", 2))
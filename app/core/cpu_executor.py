@@ -0,0 +1,176 @@
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable
+
+from app.core.config import Config
+from app.core.metrics import Counter, Gauge, Histogram
+
+logger = logging.getLogger(__name__)
+
+
+class CpuExecutorBusy(Exception):
+    """No slot became free within CPU_QUEUE_TIMEOUT_SECONDS"""
+
+
+class CpuTaskTimeout(Exception):
+    """The task did not finish within its timeout"""
+
+
+# =========================================================
+# METRICS
+# =========================================================
+
+CPU_TASK_DURATION = Histogram(
+    "cpu_task_duration_seconds", "CPU executor task time (queue wait excluded) by task and outcome",
+    ("task", "status"),
+)
+CPU_TASKS_REJECTED = Counter(
+    "cpu_tasks_rejected_total", "CPU executor tasks refused because every slot stayed busy", ("task",)
+)
+
+
+# =========================================================
+# WORKER PROCESS SIDE
+# =========================================================
+
+def _warm_worker():
+    """Pool initializer: pay the heavy imports once per worker, not per task"""
+    import numpy  # noqa: F401
+    import sklearn.feature_extraction.text  # noqa: F401
+    import sklearn.metrics.pairwise  # noqa: F401
+
+
+def _ping() -> bool:
+    return True
+
+
+# =========================================================
+# EXECUTOR
+# =========================================================
+
+class CpuExecutor:
+    """
+    Process pool for CPU-bound work (TF-IDF search, NumPy analytics)
+    so it runs on other cores instead of stalling this event loop.
+
+    Workers are spawned at app startup and kept warm; module-level
+    state in a worker (e.g. fitted search indexes) survives between
+    tasks. At most `max_pending` tasks are queued or running: further
+    callers wait up to CPU_QUEUE_TIMEOUT_SECONDS for a slot, then get
+    CpuExecutorBusy. Functions and arguments must be picklable.
+
+    workers=0 runs tasks on the default thread executor instead
+    (development, tests, single-core hosts).
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._pool: ProcessPoolExecutor | None = None
+        self._slots = asyncio.Semaphore(max_pending)
+        self._in_flight = 0
+        self._warmup: list[Future] = []
+
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _ensure_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # spawn: never fork a process that has an event loop and threads
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_worker,
+            )
+        return self._pool
+
+    def start(self) -> list[Future]:
+        """
+        Spawn and warm every worker now rather than on the first request.
+        Does not wait: workers import sklearn in the background while the
+        app is already serving. Returns the warm-up futures.
+        """
+        if not self.workers:
+            return []
+        pool = self._ensure_pool()
+        self._warmup = [pool.submit(_ping) for _ in range(self.workers)]
+        return self._warmup
+
+    def warm_state(self) -> str:
+        """"warm", "warming" or "failed" (a worker could not start)"""
+        if any(f.done() and not f.cancelled() and f.exception() for f in self._warmup):
+            return "failed"
+        return "warm" if all(f.done() for f in self._warmup) else "warming"
+
+    async def stop(self):
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            await asyncio.to_thread(pool.shutdown, wait=True, cancel_futures=True)
+
+    def _submit(self, fn: Callable, args: tuple) -> Future:
+        if not self.workers:
+            return asyncio.get_running_loop().run_in_executor(None, fn, *args)
+        return self._ensure_pool().submit(fn, *args)
+
+    async def run(self, fn: Callable, *args, timeout: float | None = None) -> Any:
+        """
+        fn(*args) on a worker process. Raises CpuExecutorBusy (no slot)
+        or CpuTaskTimeout (default CPU_TASK_TIMEOUT_SECONDS).
+        """
+        task = getattr(fn, "__name__", type(fn).__name__)
+        timeout = Config.CPU_TASK_TIMEOUT_SECONDS if timeout is None else timeout
+
+        try:
+            await asyncio.wait_for(self._slots.acquire(), Config.CPU_QUEUE_TIMEOUT_SECONDS)
+        except TimeoutError:
+            CPU_TASKS_REJECTED.inc(task)
+            raise CpuExecutorBusy("CPU executor is busy, retry shortly") from None
+
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        status = "error"
+        try:
+            future = self._submit(fn, args)
+        except BaseException:
+            self._slots.release()
+            raise
+
+        # The slot is held until the work really ends, even when the
+        # caller gave up on it, so timeouts cannot overload the pool.
+        self._in_flight += 1
+
+        def release(_):
+            loop.call_soon_threadsafe(self._release)
+
+        future.add_done_callback(release)
+
+        try:
+            result = await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+            status = "ok"
+            return result
+        except TimeoutError:
+            status = "timeout"
+            raise CpuTaskTimeout(f"{task} did not finish within {timeout:g}s") from None
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM-killed); start a fresh pool next time
+            logger.error("CPU executor pool broke while running %s; recreating it", task)
+            self._pool = None
+            raise
+        finally:
+            CPU_TASK_DURATION.observe(time.perf_counter() - started, task, status)
+
+    def _release(self):
+        self._in_flight -= 1
+        self._slots.release()
+
+
+cpu_executor = CpuExecutor(Config.CPU_WORKERS, Config.CPU_MAX_PENDING)
+
+Gauge(
+    "cpu_executor_in_flight", "CPU executor tasks queued or running in this process",
+    function=lambda: {(): cpu_executor.in_flight()},
+)
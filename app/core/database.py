@@ -1,27 +1,138 @@
 import logging
+import threading
+import time
+
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     AsyncSession,
     async_sessionmaker,
 )
-from sqlalchemy import text
+from fastapi import Request
+from sqlalchemy import text, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import Config
+from app.core.metrics import Gauge
+from app.core.query_stats import instrument_engine
 
 logger = logging.getLogger(__name__)
 
-DATABASE_URL = (
+DATABASE_URL = Config.DATABASE_URL or (
     f"mysql+aiomysql://{Config.DB_USERNAME}:"
     f"{Config.DB_PASSWORD}@{Config.DB_HOST}:"
     f"{Config.DB_PORT}/{Config.DB_NAME}"
 )
 
-engine = create_async_engine(
-    DATABASE_URL,
-    echo=False,
-    pool_pre_ping=True,
-    future=True,
-)
+# Empty → reads stay on the primary
+READ_DATABASE_URL = Config.READ_DATABASE_URL
+
+# Request header forcing the primary for reads that must see the caller's own writes
+CONSISTENT_READ_HEADER = "X-Consistent-Read"
+
+
+# =========================================================
+# INSTRUMENTED POOL
+# =========================================================
+
+class PoolMetrics:
+    """Cumulative checkout counters of one pool"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record(self, waited: float, timed_out: bool = False):
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that times every checkout. The wait includes opening a new
+    overflow connection when the pool is empty.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.metrics.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.metrics.record(time.perf_counter() - start)
+        return connection
+
+
+def _create_engine(url: str):
+    created = create_async_engine(
+        url,
+        echo=False,
+        poolclass=InstrumentedPool,
+        pool_size=Config.DB_POOL_SIZE,
+        max_overflow=Config.DB_MAX_OVERFLOW,
+        pool_timeout=Config.DB_POOL_TIMEOUT,
+        pool_recycle=Config.DB_POOL_RECYCLE,
+        pool_pre_ping=Config.DB_POOL_PRE_PING,
+        future=True,
+    )
+    instrument_engine(created)
+    return created
+
+
+engine = _create_engine(DATABASE_URL)
+
+# Read replica; the same engine as the primary when no replica is configured
+read_engine = _create_engine(READ_DATABASE_URL) if READ_DATABASE_URL else engine
+
+
+def pool_stats(target=None) -> dict:
+    """Snapshot of an engine pool for sizing it per replica"""
+
+    pool = (target or engine).pool
+    metrics = pool.metrics
+    checkouts = metrics.checkouts
+
+    return {
+        "pool_size": pool.size(),
+        "max_overflow": Config.DB_MAX_OVERFLOW,
+        "timeout_seconds": Config.DB_POOL_TIMEOUT,
+        "recycle_seconds": Config.DB_POOL_RECYCLE,
+        "in_use": pool.checkedout(),
+        "idle": pool.checkedin(),
+        # QueuePool counts overflow from -pool_size; clamp to connections beyond pool_size
+        "overflow": max(pool.overflow(), 0),
+        "checkouts": checkouts,
+        "timeouts": metrics.timeouts,
+        "wait_ms_avg": round(metrics.wait_seconds_total / checkouts * 1000, 3) if checkouts else 0,
+        "wait_ms_max": round(metrics.wait_seconds_max * 1000, 3),
+    }
+
+
+def _pool_gauge(key: str):
+    def collect():
+        engines = {"primary": engine}
+        if read_engine is not engine:
+            engines["read"] = read_engine
+        return {(name,): pool_stats(target)[key] for name, target in engines.items()}
+    return collect
+
+
+Gauge("db_pool_connections_in_use", "Connections checked out of the pool", ("pool",), function=_pool_gauge("in_use"))
+Gauge("db_pool_connections_idle", "Idle connections in the pool", ("pool",), function=_pool_gauge("idle"))
+Gauge("db_pool_overflow", "Connections open beyond pool_size", ("pool",), function=_pool_gauge("overflow"))
+
 
 # STANDARD ASYNC SESSION MAKER
 async_session_maker = async_sessionmaker(
@@ -30,6 +141,13 @@ async_session_maker = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# READ-ONLY SESSION MAKER (replica)
+read_session_maker = async_sessionmaker(
+    bind=read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
 
 #  Dependency for FastAPI routes
 async def get_db():
@@ -37,11 +155,37 @@ async def get_db():
         yield session
 
 
+def read_session_maker_for(request: Request) -> async_sessionmaker:
+    """
+    Routing rules for reads:
+    - non GET/HEAD requests always use the primary
+    - X-Consistent-Read: 1|true forces the primary (read-your-writes)
+    - everything else goes to the replica
+    """
+
+    if request.method not in ("GET", "HEAD"):
+        return async_session_maker
+
+    if request.headers.get(CONSISTENT_READ_HEADER, "").lower() in ("1", "true", "yes"):
+        return async_session_maker
+
+    return read_session_maker
+
+
+#  Dependency for read-only routes
+async def get_read_db(request: Request):
+    async with read_session_maker_for(request)() as session:
+        yield session
+
+
 # ✅ DB connection check
 async def check_database_connection():
     try:
         async with engine.connect() as conn:
             await conn.execute(text("SELECT 1"))
+        if read_engine is not engine:
+            async with read_engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
         logger.info("Database connection successful")
     except Exception as e:
         logger.error("Database connection failed")
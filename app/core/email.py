@@ -1,24 +1,181 @@
+import asyncio
+import logging
+import queue
 import smtplib
+import threading
+from concurrent.futures import Future
 from email.mime.text import MIMEText
-import asyncio
 
 from app.core.config import Config
+from app.core.metrics import Gauge
 
-async def send_email(to_email: str, subject: str, body: str):
+logger = logging.getLogger(__name__)
+
+
+# Lanes: OTP mail never waits behind bulk notification traffic
+OTP_LANE = "otp"
+BULK_LANE = "bulk"
+
+_STOP = object()
+
+
+class SMTPConnection:
     """
-    Async SMTP email sender.
-    Runs blocking SMTP in background thread.
+    One long-lived SMTP session (connect + STARTTLS + login once).
+
+    A dropped connection is re-opened and the message retried once.
     """
 
-    def _send():
+    def __init__(self):
+        self._server: smtplib.SMTP | None = None
+
+    def connect(self):
+        server = smtplib.SMTP(Config.SMTP_HOST, Config.SMTP_PORT, timeout=Config.SMTP_TIMEOUT_SECONDS)
+        server.starttls()
+        server.login(Config.SMTP_USER, Config.SMTP_PASSWORD)
+        self._server = server
+
+    def close(self):
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        self._server = None
+
+    def keepalive(self):
+        """NOOP while idle so the next message skips the handshake"""
+        if self._server is None:
+            return
+        try:
+            self._server.noop()
+        except (smtplib.SMTPException, OSError):
+            self._server = None
+
+    def send(self, to_email: str, subject: str, body: str):
         msg = MIMEText(body, "plain", "utf-8")
         msg["Subject"] = subject
         msg["From"] = Config.FROM_EMAIL
         msg["To"] = to_email
 
-        with smtplib.SMTP(Config.SMTP_HOST, Config.SMTP_PORT) as server:
-            server.starttls()
-            server.login(Config.SMTP_USER, Config.SMTP_PASSWORD)
-            server.sendmail(Config.FROM_EMAIL, [to_email], msg.as_string())
+        for attempt in range(2):
+            if self._server is None:
+                self.connect()
+            try:
+                self._server.sendmail(Config.FROM_EMAIL, [to_email], msg.as_string())
+                return
+            except (smtplib.SMTPServerDisconnected, OSError):
+                self._server = None
+                if attempt:
+                    raise
+
+
+class EmailQueue:
+    """
+    Background SMTP sender.
+
+    Each lane has its own queue and worker threads, and every worker keeps
+    its own warm SMTP connection. Workers start on first use.
+    """
+
+    def __init__(self, workers: dict[str, int]):
+        self._workers = workers
+        self._queues = {lane: queue.Queue() for lane in workers}
+        self._threads: list[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            if self._threads:
+                return
+            for lane, count in self._workers.items():
+                for i in range(count):
+                    thread = threading.Thread(
+                        target=self._run,
+                        args=(lane,),
+                        name=f"email-{lane}-{i}",
+                        daemon=True,
+                    )
+                    thread.start()
+                    self._threads.append(thread)
+
+    def stop(self, timeout: float = 10.0):
+        """Send what is already queued, then close the connections"""
+        with self._lock:
+            threads, self._threads = self._threads, []
+            for lane, count in self._workers.items():
+                for _ in range(count):
+                    self._queues[lane].put(_STOP)
+        for thread in threads:
+            thread.join(timeout)
+
+    def submit(self, to_email: str, subject: str, body: str, lane: str = BULK_LANE) -> Future:
+        self.start()
+        future = Future()
+        self._queues[lane].put((future, to_email, subject, body))
+        return future
+
+    def qsize(self, lane: str | None = None) -> int:
+        if lane:
+            return self._queues[lane].qsize()
+        return sum(q.qsize() for q in self._queues.values())
+
+    def _run(self, lane: str):
+        connection = SMTPConnection()
+        jobs = self._queues[lane]
+
+        if lane == OTP_LANE:
+            try:
+                connection.connect()
+            except Exception:
+                logger.warning("OTP SMTP connection could not be pre-opened", exc_info=True)
+
+        while True:
+            try:
+                job = jobs.get(timeout=Config.SMTP_KEEPALIVE_SECONDS)
+            except queue.Empty:
+                connection.keepalive()
+                continue
+
+            if job is _STOP:
+                connection.close()
+                return
+
+            future, to_email, subject, body = job
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                connection.send(to_email, subject, body)
+            except Exception as exc:
+                logger.error("Email to %s failed (%s lane): %s", to_email, lane, exc)
+                future.set_exception(exc)
+            else:
+                future.set_result(True)
+
+
+email_queue = EmailQueue({
+    OTP_LANE: Config.EMAIL_OTP_WORKERS,
+    BULK_LANE: Config.EMAIL_BULK_WORKERS,
+})
+
+
+Gauge(
+    "email_queue_depth", "Emails waiting to be sent", ("lane",),
+    function=lambda: {(lane,): email_queue.qsize(lane) for lane in (OTP_LANE, BULK_LANE)},
+)
+
+
+def queue_otp_email(to_email: str, subject: str, body: str) -> Future:
+    """Fire-and-forget: returns immediately, delivery happens on the OTP lane"""
+    return email_queue.submit(to_email, subject, body, OTP_LANE)
+
+
+async def send_email(to_email: str, subject: str, body: str):
+    """
+    Async SMTP email sender.
+    Queued on the bulk lane; resolves once the message is sent.
+    """
 
-    await asyncio.to_thread(_send)
+    await asyncio.wrap_future(email_queue.submit(to_email, subject, body, BULK_LANE))
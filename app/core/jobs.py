@@ -0,0 +1,394 @@
+import asyncio
+import json
+import logging
+import os
+import socket
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import Config
+from app.core.database import async_session_maker
+from app.core.metrics import Counter as MetricCounter, Gauge, Histogram, JOB_BUCKETS
+from app.models.models import Job
+
+logger = logging.getLogger(__name__)
+
+
+QUEUED = "QUEUED"
+RUNNING = "RUNNING"
+SUCCEEDED = "SUCCEEDED"
+FAILED = "FAILED"
+CANCELLED = "CANCELLED"
+FINISHED = (SUCCEEDED, FAILED, CANCELLED)
+
+
+class JobCancelled(Exception):
+    """Raised from JobContext.progress once cancellation was requested"""
+
+
+# =========================================================
+# METRICS
+# =========================================================
+
+BACKGROUND_JOB_DURATION = Histogram(
+    "background_job_duration_seconds", "Background job run time by kind and outcome",
+    ("kind", "status"), buckets=JOB_BUCKETS,
+)
+BACKGROUND_JOB_RETRIES = MetricCounter(
+    "background_job_retries_total", "Background job attempts that failed and were re-queued", ("kind",)
+)
+
+
+# =========================================================
+# REGISTRY
+# =========================================================
+
+Handler = Callable[["JobContext", dict], Awaitable[dict | None]]
+
+
+@dataclass(frozen=True)
+class JobType:
+    kind: str
+    handler: Handler
+    concurrency: int      # running at once per worker process
+    max_attempts: int     # 1 for work that must not repeat (e.g. sending email)
+
+
+_job_types: dict[str, JobType] = {}
+
+
+def job_handler(kind: str, concurrency: int = 1, max_attempts: int = 3):
+    """
+    Register an async handler(ctx, payload) -> JSON-able result for a
+    job kind. Handlers may be retried, so keep them idempotent or use
+    max_attempts=1.
+    """
+    def register(handler: Handler) -> Handler:
+        _job_types[kind] = JobType(kind, handler, concurrency, max_attempts)
+        return handler
+    return register
+
+
+def _utcnow() -> datetime:
+    return datetime.utcnow()
+
+
+def _jsonable(value):
+    return json.loads(json.dumps(value, default=str)) if value is not None else None
+
+
+def job_to_dict(job: Job) -> dict:
+    return {
+        "job_id": job.job_id,
+        "kind": job.kind,
+        "status": job.status,
+        "progress": round(job.progress or 0, 4),
+        "progress_message": job.progress_message,
+        "attempts": job.attempts,
+        "max_attempts": job.max_attempts,
+        "cancel_requested": job.cancel_requested,
+        "result": job.result,
+        "error": job.error,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+        "status_url": f"/jobs/{job.job_id}",
+    }
+
+
+# =========================================================
+# ENQUEUE / CANCEL
+# =========================================================
+
+async def enqueue(db: AsyncSession, kind: str, payload: dict, created_by: int | None = None) -> Job:
+    """Persist a QUEUED job (committed) and nudge the local worker"""
+
+    job_type = _job_types.get(kind)
+    if job_type is None:
+        raise ValueError(f"Unknown job kind: {kind}")
+
+    job = Job(
+        kind=kind,
+        payload=_jsonable(payload),
+        status=QUEUED,
+        attempts=0,
+        max_attempts=job_type.max_attempts,
+        run_after=_utcnow(),
+        progress=0,
+        cancel_requested=False,
+        created_by=created_by,
+    )
+    db.add(job)
+    await db.commit()
+    await db.refresh(job)
+
+    job_worker.wake()
+    return job
+
+
+async def request_cancel(db: AsyncSession, job: Job) -> Job:
+    """
+    QUEUED jobs are cancelled at once; RUNNING jobs stop at their next
+    progress() call. Finished jobs are left as they are.
+    """
+
+    if job.status == QUEUED:
+        result = await db.execute(
+            update(Job)
+            .where(Job.job_id == job.job_id, Job.status == QUEUED)
+            .values(status=CANCELLED, finished_at=_utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            # Claimed meanwhile: fall through to a cooperative cancel
+            await db.execute(
+                update(Job).where(Job.job_id == job.job_id, Job.status == RUNNING)
+                .values(cancel_requested=True)
+                .execution_options(synchronize_session=False)
+            )
+    elif job.status == RUNNING:
+        await db.execute(
+            update(Job).where(Job.job_id == job.job_id).values(cancel_requested=True)
+            .execution_options(synchronize_session=False)
+        )
+
+    await db.commit()
+    await db.refresh(job)
+    return job
+
+
+# =========================================================
+# HANDLER CONTEXT
+# =========================================================
+
+class JobContext:
+    """Passed to handlers: report progress and observe cancellation"""
+
+    def __init__(self, job_id: int, kind: str, created_by: int | None):
+        self.job_id = job_id
+        self.kind = kind
+        self.created_by = created_by
+        self._last_write = 0.0
+
+    async def progress(self, done: int, total: int | None = None, message: str | None = None):
+        """
+        Record progress (throttled to one write per
+        JOB_PROGRESS_INTERVAL_SECONDS) and raise JobCancelled if an
+        admin cancelled the job.
+        """
+        now = time.monotonic()
+        if now - self._last_write < Config.JOB_PROGRESS_INTERVAL_SECONDS and done != total:
+            return
+        self._last_write = now
+
+        values = {"heartbeat_at": _utcnow()}
+        if total:
+            values["progress"] = min(done / total, 1.0)
+        if message is not None:
+            values["progress_message"] = message[:255]
+
+        async with async_session_maker() as db:
+            await db.execute(update(Job).where(Job.job_id == self.job_id).values(**values))
+            cancel = (await db.execute(select(Job.cancel_requested).where(Job.job_id == self.job_id))).scalar()
+            await db.commit()
+
+        if cancel:
+            raise JobCancelled()
+
+
+# =========================================================
+# WORKER
+# =========================================================
+
+class JobWorker:
+    """
+    Claims QUEUED jobs from the jobs table and runs them as tasks on
+    this process's event loop. Every replica runs one; a conditional
+    UPDATE (plus SKIP LOCKED where supported) makes each claim exclusive.
+
+    poll() is driven by the AsyncIOScheduler and by wake() after an
+    enqueue. It also heartbeats running jobs and re-queues jobs whose
+    worker stopped heartbeating (crashed replica).
+    """
+
+    def __init__(self, concurrency: int):
+        self.concurrency = concurrency
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._tasks: dict[int, asyncio.Task] = {}
+        self._per_kind: Counter = Counter()
+        self._lock = asyncio.Lock()
+        self._accepting = False
+        self._wakeup: asyncio.Task | None = None
+        # time.monotonic() of the last poll() call, and of the last one
+        # that got through to the database (read by the health probes)
+        self.last_tick: float | None = None
+        self.last_success: float | None = None
+
+    def running(self) -> dict[str, int]:
+        return dict(self._per_kind)
+
+    def start(self):
+        self._accepting = True
+        self.last_tick = self.last_success = time.monotonic()
+
+    def wake(self):
+        if self._accepting:
+            self._wakeup = asyncio.get_running_loop().create_task(self.poll())
+
+    async def poll(self):
+        if not self._accepting:
+            return
+        self.last_tick = time.monotonic()
+        if self._lock.locked():
+            return
+
+        async with self._lock:
+            now = _utcnow()
+            async with async_session_maker() as db:
+                await self._heartbeat(db, now)
+                await self._recover_stale(db, now)
+                claimed = await self._claim(db, now)
+                await db.commit()
+            self.last_success = time.monotonic()
+
+            for job_id, kind, created_by in claimed:
+                self._tasks[job_id] = asyncio.create_task(self._run(job_id, kind, created_by))
+
+    async def _heartbeat(self, db: AsyncSession, now: datetime):
+        if self._tasks:
+            await db.execute(
+                update(Job).where(Job.job_id.in_(list(self._tasks)), Job.status == RUNNING)
+                .values(heartbeat_at=now)
+            )
+
+    async def _recover_stale(self, db: AsyncSession, now: datetime):
+        stale = now - timedelta(seconds=Config.JOB_STALE_SECONDS)
+        lost = (Job.status == RUNNING, Job.heartbeat_at < stale)
+
+        await db.execute(
+            update(Job).where(*lost, Job.attempts >= Job.max_attempts)
+            .values(status=FAILED, error="Worker stopped responding", finished_at=now)
+        )
+        await db.execute(
+            update(Job).where(*lost, Job.attempts < Job.max_attempts)
+            .values(status=QUEUED, worker_id=None, run_after=now)
+        )
+
+    async def _claim(self, db: AsyncSession, now: datetime) -> list[tuple[int, str, int | None]]:
+        free = self.concurrency - len(self._tasks)
+        kinds = [kind for kind, t in _job_types.items() if self._per_kind[kind] < t.concurrency]
+        if free <= 0 or not kinds:
+            return []
+
+        candidates = (
+            await db.execute(
+                select(Job.job_id, Job.kind, Job.created_by)
+                .where(Job.status == QUEUED, Job.run_after <= now, Job.kind.in_(kinds))
+                .order_by(Job.job_id)
+                .limit(free * 2)
+                .with_for_update(skip_locked=True)
+            )
+        ).all()
+
+        claimed = []
+        for job_id, kind, created_by in candidates:
+            if len(claimed) >= free or self._per_kind[kind] >= _job_types[kind].concurrency:
+                continue
+            result = await db.execute(
+                update(Job)
+                .where(Job.job_id == job_id, Job.status == QUEUED)
+                .values(
+                    status=RUNNING, worker_id=self.worker_id, attempts=Job.attempts + 1,
+                    started_at=now, heartbeat_at=now, error=None,
+                )
+            )
+            if result.rowcount == 1:
+                self._per_kind[kind] += 1
+                claimed.append((job_id, kind, created_by))
+
+        return claimed
+
+    async def _run(self, job_id: int, kind: str, created_by: int | None):
+        started = time.perf_counter()
+        outcome = FAILED
+        try:
+            async with async_session_maker() as db:
+                payload = (await db.execute(select(Job.payload).where(Job.job_id == job_id))).scalar()
+
+            result = await _job_types[kind].handler(JobContext(job_id, kind, created_by), payload or {})
+            outcome = await self._finish(job_id, SUCCEEDED, result=_jsonable(result), progress=1.0)
+
+        except JobCancelled:
+            outcome = await self._finish(job_id, CANCELLED)
+
+        except asyncio.CancelledError:
+            # Shutdown: hand a retryable job back without spending an attempt.
+            # max_attempts=1 work (e.g. email fan-out) may be half done and
+            # must not run again.
+            if _job_types[kind].max_attempts > 1:
+                outcome = await self._finish(job_id, QUEUED, attempts=Job.attempts - 1, worker_id=None)
+            else:
+                outcome = await self._finish(job_id, FAILED, error="Interrupted by shutdown")
+            raise
+
+        except Exception as exc:
+            logger.exception("Background job %s (%s) failed", job_id, kind)
+            outcome = await self._fail(job_id, kind, f"{type(exc).__name__}: {exc}")
+
+        finally:
+            self._tasks.pop(job_id, None)
+            self._per_kind[kind] -= 1
+            BACKGROUND_JOB_DURATION.observe(time.perf_counter() - started, kind, outcome)
+
+    async def _fail(self, job_id: int, kind: str, error: str) -> str:
+        async with async_session_maker() as db:
+            attempts, max_attempts = (
+                await db.execute(select(Job.attempts, Job.max_attempts).where(Job.job_id == job_id))
+            ).one()
+
+        if attempts < max_attempts:
+            BACKGROUND_JOB_RETRIES.inc(kind)
+            delay = Config.JOB_RETRY_BASE_SECONDS * 2 ** (attempts - 1)
+            return await self._finish(
+                job_id, QUEUED, error=error[:2000], worker_id=None,
+                run_after=_utcnow() + timedelta(seconds=delay),
+            )
+        return await self._finish(job_id, FAILED, error=error[:2000])
+
+    async def _finish(self, job_id: int, status: str, **values) -> str:
+        if status in FINISHED:
+            values["finished_at"] = _utcnow()
+        async with async_session_maker() as db:
+            await db.execute(update(Job).where(Job.job_id == job_id).values(status=status, **values))
+            await db.commit()
+        return status
+
+    async def stop(self, grace_seconds: float):
+        """
+        Stop claiming and let running jobs finish. After grace_seconds the
+        rest are cancelled: retryable jobs go back to the queue, jobs with
+        max_attempts=1 are marked FAILED.
+        """
+        self._accepting = False
+        tasks = list(self._tasks.values())
+        if not tasks:
+            return
+
+        _, pending = await asyncio.wait(tasks, timeout=grace_seconds)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+job_worker = JobWorker(Config.JOB_WORKER_CONCURRENCY)
+
+BACKGROUND_JOBS_RUNNING = Gauge(
+    "background_jobs_running", "Background jobs running in this process", ("kind",),
+    function=lambda: {(kind,): count for kind, count in job_worker.running().items()},
+)
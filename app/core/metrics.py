@@ -0,0 +1,212 @@
+import threading
+import time
+from bisect import bisect_left
+from functools import wraps
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 250)
+JOB_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+
+# =========================================================
+# REGISTRY (Prometheus text exposition format)
+# =========================================================
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format(name: str, labelnames, labels, value, extra: str = "") -> str:
+    pairs = [f'{key}="{_escape(val)}"' for key, val in zip(labelnames, labels)]
+    if extra:
+        pairs.append(extra)
+    label_str = "{" + ",".join(pairs) + "}" if pairs else ""
+    return f"{name}{label_str} {value}"
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(metric.lines())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+class _Metric:
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = (), registry: Registry = REGISTRY):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        registry.register(self)
+
+
+class Counter(_Metric):
+    type = "counter"
+
+    def inc(self, *labels, amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def lines(self):
+        with self._lock:
+            values = list(self._values.items())
+        return [_format(self.name, self.labelnames, labels, value) for labels, value in values]
+
+
+class Gauge(_Metric):
+    """
+    Set/inc/dec gauge, or a callback gauge when `function` is given.
+    The callback returns {label tuple: value} and runs at scrape time.
+    """
+
+    type = "gauge"
+
+    def __init__(self, *args, function=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._function = function
+
+    def set(self, value: float, *labels):
+        with self._lock:
+            self._values[labels] = value
+
+    def inc(self, *labels, amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, *labels, amount: float = 1):
+        self.inc(*labels, amount=-amount)
+
+    def lines(self):
+        if self._function:
+            values = list(self._function().items())
+        else:
+            with self._lock:
+                values = list(self._values.items())
+        return [_format(self.name, self.labelnames, labels, value) for labels, value in values]
+
+
+class Histogram(_Metric):
+    type = "histogram"
+
+    def __init__(self, *args, buckets: tuple = LATENCY_BUCKETS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, *labels):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(labels)
+            if state is None:
+                state = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][index] += 1
+            state[1] += value
+
+    def lines(self):
+        with self._lock:
+            values = [(labels, list(counts), total) for labels, (counts, total) in self._values.items()]
+
+        lines = []
+        for labels, counts, total in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                lines.append(_format(f"{self.name}_bucket", self.labelnames, labels, cumulative, f'le="{bound}"'))
+            cumulative += counts[-1]
+            lines.append(_format(f"{self.name}_bucket", self.labelnames, labels, cumulative, 'le="+Inf"'))
+            lines.append(_format(f"{self.name}_sum", self.labelnames, labels, total))
+            lines.append(_format(f"{self.name}_count", self.labelnames, labels, cumulative))
+        return lines
+
+
+# =========================================================
+# HTTP
+# =========================================================
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "HTTP requests by route template and status", ("method", "route", "status")
+)
+HTTP_LATENCY = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template", ("method", "route")
+)
+HTTP_IN_PROGRESS = Gauge(
+    "http_requests_in_progress", "HTTP requests currently being served", ("method",)
+)
+
+
+# =========================================================
+# DB QUERIES
+# =========================================================
+
+DB_QUERY_LATENCY = Histogram(
+    "db_query_duration_seconds", "Duration of individual SQL statements"
+)
+DB_QUERIES_PER_REQUEST = Histogram(
+    "db_queries_per_request", "SQL statements issued per HTTP request", ("route",), buckets=QUERY_COUNT_BUCKETS
+)
+DB_TIME_PER_REQUEST = Histogram(
+    "db_time_per_request_seconds", "Time spent in SQL per HTTP request", ("route",)
+)
+
+
+DB_N_PLUS_ONE = Counter(
+    "db_n_plus_one_total", "Requests that repeated one statement shape N_PLUS_ONE_THRESHOLD+ times", ("route",)
+)
+DB_SLOW_QUERIES = Counter(
+    "db_slow_queries_total", "Statements slower than SLOW_QUERY_MS"
+)
+
+
+# =========================================================
+# SCHEDULER JOBS
+# =========================================================
+
+JOB_DURATION = Histogram(
+    "scheduler_job_duration_seconds", "Scheduler job run time", ("job",), buckets=JOB_BUCKETS
+)
+JOB_FAILURES = Counter(
+    "scheduler_job_failures_total", "Scheduler job runs that raised", ("job",)
+)
+JOB_LAST_SUCCESS = Gauge(
+    "scheduler_job_last_success_timestamp_seconds", "Unix time of the last successful run", ("job",)
+)
+
+
+def timed_job(name: str):
+    """Record duration, failures and last success of an async scheduler job"""
+
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                result = await func(*args, **kwargs)
+            except Exception:
+                JOB_FAILURES.inc(name)
+                raise
+            finally:
+                JOB_DURATION.observe(time.perf_counter() - start, name)
+            JOB_LAST_SUCCESS.set(time.time(), name)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -1,27 +1,187 @@
-import random
+import secrets
+from abc import ABC, abstractmethod
+from collections import deque
 from datetime import datetime, timedelta
 
-OTP_STORE = {}  # Replace with Redis in production
+from sqlalchemy import select, func, update, delete, insert, literal, false
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import Config
+from app.models.models import OTP, Member
 
-def generate_otp(email: str):
-    otp = str(random.randint(100000, 999999))
-    OTP_STORE[email] = {
-        "otp": otp,
-        "expires": datetime.utcnow() + timedelta(minutes=5),
-    }
-    return otp
 
+class OTPRateLimitError(ValueError):
+    """Member requested more OTPs than allowed in the rate window"""
 
-def verify_otp(email: str, otp: str) -> bool:
-    data = OTP_STORE.get(email)
-    if not data:
-        return False
 
-    if data["otp"] != otp:
-        return False
+def _new_code() -> str:
+    return str(100000 + secrets.randbelow(900000))
 
-    if datetime.utcnow() > data["expires"]:
-        return False
 
-    return True
+class OTPBackend(ABC):
+    """
+    OTP storage contract.
+
+    issue() enforces the per-member send rate limit and supersedes any
+    earlier unused code; verify() consumes the code, so it succeeds once.
+    """
+
+    ttl = timedelta(seconds=Config.OTP_TTL_SECONDS)
+    rate_window = timedelta(seconds=Config.OTP_RATE_WINDOW_SECONDS)
+    max_sends = Config.OTP_MAX_SENDS
+
+    @abstractmethod
+    async def issue(self, db: AsyncSession, member_id: int) -> str:
+        """New code for the member; raises OTPRateLimitError over max_sends"""
+
+    @abstractmethod
+    async def verify(self, db: AsyncSession, member_id: int, otp: str) -> bool:
+        """True once for a live, matching code"""
+
+    @abstractmethod
+    async def purge_expired(self, db: AsyncSession) -> int:
+        """Delete codes nobody can use any more; returns how many"""
+
+
+class InMemoryOTPBackend(OTPBackend):
+    """Single-process stand-in for local development and tests"""
+
+    def __init__(self):
+        self._codes: dict[int, tuple[str, datetime]] = {}
+        self._sends: dict[int, deque[datetime]] = {}
+
+    async def issue(self, db: AsyncSession, member_id: int) -> str:
+        now = datetime.utcnow()
+
+        sends = self._sends.setdefault(member_id, deque())
+        while sends and sends[0] <= now - self.rate_window:
+            sends.popleft()
+
+        if len(sends) >= self.max_sends:
+            raise OTPRateLimitError("Too many OTP requests. Please try again later.")
+
+        otp = _new_code()
+        sends.append(now)
+        self._codes[member_id] = (otp, now + self.ttl)
+
+        return otp
+
+    async def verify(self, db: AsyncSession, member_id: int, otp: str) -> bool:
+        data = self._codes.get(member_id)
+        if not data:
+            return False
+
+        code, expires_at = data
+        if datetime.utcnow() > expires_at:
+            del self._codes[member_id]
+            return False
+
+        if not secrets.compare_digest(code, otp):
+            return False
+
+        del self._codes[member_id]
+        return True
+
+    async def purge_expired(self, db: AsyncSession) -> int:
+        now = datetime.utcnow()
+
+        expired = [member_id for member_id, (_, expires_at) in self._codes.items() if expires_at <= now]
+        for member_id in expired:
+            del self._codes[member_id]
+
+        for member_id in [m for m, sends in self._sends.items() if not sends or sends[-1] <= now - self.rate_window]:
+            del self._sends[member_id]
+
+        return len(expired)
+
+
+class DatabaseOTPBackend(OTPBackend):
+    """
+    Shared `otps` table, safe across workers and replicas.
+
+    Lookups go through idx_otp_member_active, and verification is a single
+    conditional UPDATE, so a code can only be consumed once even when two
+    replicas verify it at the same moment. Issuing locks the member row
+    and inserts only while the rate window has room, in one statement,
+    so concurrent requests cannot both pass the limit.
+    """
+
+    async def issue(self, db: AsyncSession, member_id: int) -> str:
+        now = datetime.utcnow()
+
+        # Serialises issue() per member (FOR UPDATE is a no-op on SQLite,
+        # where the UPDATE below already takes the write lock)
+        await db.execute(select(Member.member_id).where(Member.member_id == member_id).with_for_update())
+
+        await db.execute(
+            update(OTP)
+            .where(OTP.member_id == member_id, OTP.is_used == False)
+            .values(is_used=True)
+            .execution_options(synchronize_session=False)
+        )
+
+        recent = (
+            select(func.count(OTP.otp_id))
+            .where(OTP.member_id == member_id, OTP.created_at > now - self.rate_window)
+            .scalar_subquery()
+        )
+
+        otp = _new_code()
+        result = await db.execute(
+            insert(OTP).from_select(
+                ["member_id", "otp_code", "expires_at", "is_used", "created_at"],
+                select(
+                    literal(member_id),
+                    literal(otp),
+                    literal(now + self.ttl, OTP.expires_at.type),
+                    false(),
+                    literal(now, OTP.created_at.type),
+                ).where(Member.member_id == member_id, recent < self.max_sends),
+            )
+        )
+
+        if result.rowcount != 1:
+            # Also undoes superseding the previous code
+            await db.rollback()
+            raise OTPRateLimitError("Too many OTP requests. Please try again later.")
+
+        await db.commit()
+        return otp
+
+    async def verify(self, db: AsyncSession, member_id: int, otp: str) -> bool:
+        result = await db.execute(
+            update(OTP)
+            .where(
+                OTP.member_id == member_id,
+                OTP.is_used == False,
+                OTP.expires_at > datetime.utcnow(),
+                OTP.otp_code == otp,
+            )
+            .values(is_used=True)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+
+        return result.rowcount == 1
+
+    async def purge_expired(self, db: AsyncSession) -> int:
+        # Rows created inside the rate window still count towards max_sends
+        cutoff = datetime.utcnow() - self.rate_window
+
+        result = await db.execute(
+            delete(OTP)
+            .where(OTP.expires_at < cutoff)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+
+        return result.rowcount
+
+
+def _create_backend() -> OTPBackend:
+    if Config.OTP_BACKEND == "memory":
+        return InMemoryOTPBackend()
+    return DatabaseOTPBackend()
+
+
+otp_store = _create_backend()
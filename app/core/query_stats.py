@@ -0,0 +1,145 @@
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+
+from sqlalchemy import event
+
+from app.core.config import Config
+from app.core.metrics import DB_QUERY_LATENCY, DB_SLOW_QUERIES
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(AssertionError):
+    """More statements were issued than a query_budget allows"""
+
+
+# =========================================================
+# STATEMENT SHAPES
+# =========================================================
+
+_WHITESPACE = re.compile(r"\s+")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:%s|\?|:\w+)(?:\s*,\s*(?:%s|\?|:\w+))*\s*\)")
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+
+@lru_cache(maxsize=4096)
+def statement_shape(statement: str) -> str:
+    """SQL with literals and IN-list lengths folded, so repeats compare equal"""
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    shape = _LITERAL.sub("?", shape)
+    return _PLACEHOLDER_LIST.sub("(?)", shape)
+
+
+def _redacted(parameters) -> str:
+    if not parameters:
+        return "none"
+    if isinstance(parameters, (list, tuple)) and parameters and isinstance(parameters[0], (list, tuple, dict)):
+        return f"<{len(parameters)} rows redacted>"
+    return f"<{len(parameters)} values redacted>"
+
+
+# =========================================================
+# REQUEST-SCOPED STATS
+# =========================================================
+
+class QueryStats:
+    """
+    Statements issued inside one scope (a request, a job, a query_budget).
+    Nested scopes also report into their parent.
+    """
+
+    __slots__ = ("count", "seconds", "shapes", "parent")
+
+    def __init__(self, parent: "QueryStats | None" = None):
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes = Counter()
+        self.parent = parent
+
+    def record(self, shape: str, elapsed: float):
+        stats = self
+        while stats is not None:
+            stats.count += 1
+            stats.seconds += elapsed
+            stats.shapes[shape] += 1
+            stats = stats.parent
+
+    def repeated(self, threshold: int = Config.N_PLUS_ONE_THRESHOLD) -> list[tuple[str, int]]:
+        """Statement shapes issued at least `threshold` times (likely N+1)"""
+        return [(shape, count) for shape, count in self.shapes.most_common() if count >= threshold]
+
+    def header(self) -> str:
+        most = self.shapes.most_common(1)
+        return (
+            f"count={self.count}; time_ms={self.seconds * 1000:.1f}; "
+            f"shapes={len(self.shapes)}; max_repeat={most[0][1] if most else 0}"
+        )
+
+
+current_query_stats: ContextVar[QueryStats | None] = ContextVar("current_query_stats", default=None)
+
+
+@contextmanager
+def track_queries():
+    """Collect QueryStats for the statements issued inside the block"""
+    stats = QueryStats(parent=current_query_stats.get())
+    token = current_query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        current_query_stats.reset(token)
+
+
+@contextmanager
+def query_budget(max_queries: int, label: str = ""):
+    """
+    Fail (QueryBudgetExceeded) when the block issues more than
+    `max_queries` statements, e.g. around a test client call:
+
+        with query_budget(3, "GET /members/"):
+            await client.get("/members/")
+    """
+    with track_queries() as stats:
+        yield stats
+
+    if stats.count > max_queries:
+        repeats = ", ".join(f"{count}x {shape[:120]}" for shape, count in stats.repeated(2)) or "none"
+        raise QueryBudgetExceeded(
+            f"{label or 'block'} issued {stats.count} queries (budget {max_queries}); repeated: {repeats}"
+        )
+
+
+# =========================================================
+# ENGINE HOOKS
+# =========================================================
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info["query_start"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info.pop("query_start", time.perf_counter())
+    DB_QUERY_LATENCY.observe(elapsed)
+
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.record(statement_shape(statement), elapsed)
+
+    if elapsed * 1000 >= Config.SLOW_QUERY_MS:
+        DB_SLOW_QUERIES.inc()
+        logger.warning(
+            "Slow query (%.1f ms): %s | params: %s",
+            elapsed * 1000, statement_shape(statement), _redacted(parameters),
+        )
+
+
+def instrument_engine(engine):
+    """Time and count every statement run through an (async) engine"""
+    sync_engine = getattr(engine, "sync_engine", engine)
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,47 @@
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.models.models import Base
+
+
+# =========================================================
+# SCHEMA MIGRATION (python -m scripts.migrate)
+# =========================================================
+# create_all only adds missing tables; indexes declared later on tables
+# that already exist are added by ensure_indexes.
+
+def _existing_indexes(sync_conn) -> dict[str, set[str]]:
+    inspector = inspect(sync_conn)
+    tables = set(inspector.get_table_names())
+    return {
+        table: {index["name"] for index in inspector.get_indexes(table)}
+        for table in Base.metadata.tables
+        if table in tables
+    }
+
+
+async def ensure_indexes(conn: AsyncConnection, dry_run: bool = False) -> list[str]:
+    """Create every declared index missing from an existing table"""
+
+    existing = await conn.run_sync(_existing_indexes)
+    created = []
+
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing:
+            continue
+        for index in table.indexes:
+            if index.name in existing[table.name]:
+                continue
+            if dry_run:
+                print(f"CREATE INDEX {index.name} ON {table.name} ({', '.join(c.name for c in index.columns)});")
+            else:
+                await conn.run_sync(index.create)
+            created.append(index.name)
+
+    return created
+
+
+async def migrate(conn: AsyncConnection) -> list[str]:
+    """Create missing tables, then missing indexes. Safe to re-run."""
+    await conn.run_sync(Base.metadata.create_all)
+    return await ensure_indexes(conn)
@@ -1,13 +1,30 @@
+import asyncio
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
+from app.core.cache import TTLCache
 from app.core.config import Config
 
 # ================= PASSWORD HASHING =================
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=Config.BCRYPT_ROUNDS,
+)
+
+# bcrypt releases the GIL, so a small dedicated pool hashes in parallel
+# without blocking the event loop or starving the default executor.
+# Requests beyond its size queue in the executor.
+password_executor = ThreadPoolExecutor(
+    max_workers=Config.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash",
+)
 
 
 def hash_password(password: str) -> str:
@@ -20,6 +37,18 @@ def verify_password(password: str, hashed: str) -> bool:
     return pwd_context.verify(password, hashed)
 
 
+async def hash_password_async(password: str) -> str:
+    """hash_password on the password executor"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(password_executor, hash_password, password)
+
+
+async def verify_password_async(password: str, hashed: str) -> bool:
+    """verify_password on the password executor"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(password_executor, verify_password, password, hashed)
+
+
 # ================= JWT TOKEN =================
 def create_access_token(data: Dict[str, Any]) -> str:
     """
@@ -41,17 +70,35 @@ def create_access_token(data: Dict[str, Any]) -> str:
     return encoded_jwt
 
 
+# Verified payloads keyed by SHA-256 of the token, each kept until its exp.
+# Only successfully verified tokens are cached.
+token_cache = TTLCache(
+    maxsize=Config.TOKEN_CACHE_MAX_SIZE,
+    ttl=Config.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+
+
 def decode_access_token(token: str) -> Optional[Dict[str, Any]]:
     """
     Decode JWT token safely
     Returns payload if valid, otherwise None
     """
+    key = hashlib.sha256(token.encode()).digest()
+
+    payload = token_cache.get(key)
+    if payload is not None:
+        return dict(payload)
+
     try:
         payload = jwt.decode(
             token,
             Config.SECRET_KEY,
             algorithms=[Config.ALGORITHM],
         )
-        return payload
     except JWTError:
         return None
+
+    exp = payload.get("exp")
+    token_cache.set(key, payload, ttl=exp - time.time() if exp else None)
+
+    return dict(payload)
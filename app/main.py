@@ -1,21 +1,29 @@
+import asyncio
 import logging
-from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse
+from datetime import datetime
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from pyinstrument import Profiler
  
 from app.core.config import Config
 from app.core.logging import setup_logging
 from app.core.database import engine, check_database_connection
-from app.models.models import Base
+from app.core.schema import migrate
 from app.routes.auth import router as auth_router
-from app.routes import election, location, meta, member, candidate, notification, result, nomination
-from app.tasks.scheduler import start_scheduler
+from app.routes import election, location, meta, member, candidate, notification, result, nomination, system, jobs
+from app.tasks.scheduler import start_scheduler, claim_scheduler_role
  
 from app.tasks.scheduler import scheduler
 from app.tasks.election_tasks import run_status_update
 from app.services.result_scheduler import start_result_scheduler
 from app.tasks.election_tasks import run_status_update
+from app.tasks.otp_tasks import run_otp_purge
+from app.tasks.nomination_tasks import run_nomination_stats_backfill, run_nomination_stats_repair
+from app.tasks.background_jobs import start_job_worker
+from app.core.jobs import job_worker
+from app.core.cpu_executor import cpu_executor
+from app.core.email import email_queue
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.profiling import ProfilingMiddleware
  
  
 # ================= LOGGING =================
@@ -42,24 +50,14 @@ app.add_middleware(
 )
  
  
-# ================= PROFILING MIDDLEWARE =================
-# Enabled ONLY in development
-if Config.APP_ENV == "development":
- 
-    @app.middleware("http")
-    async def profile_requests(request: Request, call_next):
-        profiler = Profiler()
-        profiler.start()
- 
-        response = await call_next(request)
+# ================= METRICS MIDDLEWARE =================
+app.add_middleware(MetricsMiddleware)
  
-        profiler.stop()
  
-        # Show profiling in browser when ?profile=1
-        if request.query_params.get("profile") == "1":
-            return HTMLResponse(profiler.output_html())
- 
-        return response
+# ================= PROFILING MIDDLEWARE =================
+# Profiles only requests that ask for it (admins) or are sampled
+if Config.PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
  
  
 # ================= STARTUP EVENT (MERGED) =================
@@ -70,12 +68,12 @@ async def on_startup():
     # 1️⃣ Check DB connection
     await check_database_connection()
  
-    # 2️⃣ Create tables ONLY IF NOT EXISTS
-    logger.info("Creating database tables (if not exist)")
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
- 
-    logger.info("Database tables are ready")
+    # 2️⃣ Schema: `python -m scripts.migrate` per deploy, here only with AUTO_MIGRATE
+    if Config.AUTO_MIGRATE:
+        logger.info("AUTO_MIGRATE: creating missing tables and indexes")
+        async with engine.begin() as conn:
+            await migrate(conn)
+        logger.info("Database tables are ready")
  
     # 3️⃣ Start schedulers
     start_scheduler()
@@ -87,21 +85,67 @@ async def on_startup():
 @app.on_event("startup")
 async def startup():
  
-    # STATUS JOB
-    scheduler.add_job(
-        run_status_update,
-        "interval",
-        minutes=1,
-        id="status_job",
-        replace_existing=True,
-    )
- 
-    # RESULT JOB
-    start_result_scheduler()
+    # Periodic maintenance: one process per host (see claim_scheduler_role)
+    if claim_scheduler_role():
+ 
+        # STATUS JOB
+        scheduler.add_job(
+            run_status_update,
+            "interval",
+            minutes=1,
+            id="status_job",
+            replace_existing=True,
+        )
+ 
+        # RESULT JOB
+        start_result_scheduler()
+ 
+        # OTP PURGE JOB
+        scheduler.add_job(
+            run_otp_purge,
+            "interval",
+            minutes=Config.OTP_PURGE_INTERVAL_MINUTES,
+            id="otp_purge_job",
+            replace_existing=True,
+        )
+ 
+        # NOMINATION STATS (counter rows for new elections now, drift repair daily)
+        scheduler.add_job(
+            run_nomination_stats_backfill,
+            "date",
+            run_date=datetime.now(),
+            id="nomination_stats_backfill_job",
+            replace_existing=True,
+        )
+        if Config.NOMINATION_STATS_REPAIR_HOURS:
+            scheduler.add_job(
+                run_nomination_stats_repair,
+                "interval",
+                hours=Config.NOMINATION_STATS_REPAIR_HOURS,
+                id="nomination_stats_repair_job",
+                replace_existing=True,
+            )
+ 
+    # BACKGROUND JOB WORKER (polls the jobs table; every process claims jobs)
+    start_job_worker()
  
     if not scheduler.running:
         scheduler.start()
  
+    # EMAIL QUEUE (warm SMTP connections)
+    email_queue.start()
+ 
+    # CPU EXECUTOR (warm worker processes for search and analytics)
+    cpu_executor.start()
+ 
+ 
+@app.on_event("shutdown")
+async def shutdown():
+    # Jobs may still be mailing: stop them before the email queue
+    await job_worker.stop(Config.JOB_SHUTDOWN_GRACE_SECONDS)
+    await asyncio.to_thread(email_queue.stop)
+    await cpu_executor.stop()
+ 
  
  
 # ================= ROUTERS =================
@@ -114,6 +158,10 @@ app.include_router(candidate.router)
 app.include_router(notification.router)
 app.include_router(result.router)
 app.include_router(nomination.router)
+app.include_router(jobs.router)
+app.include_router(system.router)
+app.include_router(system.metrics_router)
+app.include_router(system.health_router)
  
  
 # ================= ROOT =================
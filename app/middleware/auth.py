@@ -1,8 +1,12 @@
+from dataclasses import dataclass
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
+from app.core.cache import TTLCache
+from app.core.config import Config
 from app.core.database import get_db
 from app.core.security import decode_access_token
 from app.models.models import Admin
@@ -10,6 +14,47 @@ from app.models.models import Admin
 security = HTTPBearer()
 
 
+@dataclass(frozen=True)
+class AdminPrincipal:
+    """Authenticated admin as seen by routes (detached from any session)"""
+
+    admin_id: int
+    admin_level: str
+    assembly_id: int | None
+    name: str
+    email: str
+    is_active: bool
+
+
+# Active admins by admin_id. Deactivation is picked up immediately on this
+# process via invalidate_admin() and within the TTL on other replicas.
+admin_cache = TTLCache(
+    maxsize=Config.ADMIN_CACHE_MAX_SIZE,
+    ttl=Config.ADMIN_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_admin(admin_id: int) -> None:
+    admin_cache.pop(admin_id)
+
+
+async def _load_admin(db: AsyncSession, admin_id: int) -> AdminPrincipal | None:
+    row = (
+        await db.execute(
+            select(
+                Admin.admin_id,
+                Admin.admin_level,
+                Admin.assembly_id,
+                Admin.name,
+                Admin.email,
+                Admin.is_active,
+            ).where(Admin.admin_id == admin_id)
+        )
+    ).one_or_none()
+
+    return AdminPrincipal(*row) if row else None
+
+
 async def get_current_admin(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db),
@@ -24,8 +69,12 @@ async def get_current_admin(
     if not admin_id:
         raise HTTPException(status_code=401, detail="Invalid token payload")
 
-    result = await db.execute(select(Admin).where(Admin.admin_id == admin_id))
-    admin = result.scalar_one_or_none()
+    admin = admin_cache.get(admin_id)
+
+    if admin is None:
+        admin = await _load_admin(db, admin_id)
+        if admin and admin.is_active:
+            admin_cache.set(admin_id, admin)
 
     if not admin or not admin.is_active:
         raise HTTPException(status_code=403, detail="Admin not active")
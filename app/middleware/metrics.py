@@ -0,0 +1,74 @@
+import logging
+import time
+
+from app.core.config import Config
+from app.core.metrics import (
+    HTTP_REQUESTS, HTTP_LATENCY, HTTP_IN_PROGRESS,
+    DB_QUERIES_PER_REQUEST, DB_TIME_PER_REQUEST, DB_N_PLUS_ONE,
+)
+from app.core.query_stats import QueryStats, current_query_stats
+
+logger = logging.getLogger(__name__)
+
+
+QUERY_HEADER = b"x-db-queries"
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware: latency, status and SQL usage per route template.
+
+    Labels use the matched route path (e.g. /results/admin/publish/{election_id}),
+    never the raw URL, so label cardinality stays bounded. With
+    QUERY_DEBUG_HEADER on, responses carry the request's SQL summary in
+    X-DB-Queries (statements issued before the response started).
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.debug_header = Config.QUERY_DEBUG_HEADER
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        stats = QueryStats(parent=current_query_stats.get())
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.debug_header:
+                    message["headers"] = [*message.get("headers", []), (QUERY_HEADER, stats.header().encode())]
+            await send(message)
+
+        token = current_query_stats.set(stats)
+        HTTP_IN_PROGRESS.inc(method)
+        start = time.perf_counter()
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            HTTP_IN_PROGRESS.dec(method)
+            current_query_stats.reset(token)
+
+            route = getattr(scope.get("route"), "path", None)
+            template = route or "unmatched"
+
+            HTTP_REQUESTS.inc(method, template, str(status_code))
+            HTTP_LATENCY.observe(elapsed, method, template)
+            DB_QUERIES_PER_REQUEST.observe(stats.count, template)
+            DB_TIME_PER_REQUEST.observe(stats.seconds, template)
+
+            repeated = stats.repeated()
+            if repeated:
+                DB_N_PLUS_ONE.inc(template)
+                shape, count = repeated[0]
+                logger.warning(
+                    "Possible N+1 on %s %s: %d queries, statement repeated %dx: %s",
+                    method, template, stats.count, count, shape[:300],
+                )
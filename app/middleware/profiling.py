@@ -0,0 +1,125 @@
+import asyncio
+import logging
+import random
+import re
+import time
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import parse_qs
+
+from app.core.config import Config
+from app.core.security import decode_access_token
+
+logger = logging.getLogger(__name__)
+
+
+PROFILE_HEADER = b"x-profile"
+
+
+def _header(scope, name: bytes) -> str:
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return ""
+
+
+def _is_admin(scope) -> bool:
+    authorization = _header(scope, b"authorization")
+    if not authorization.lower().startswith("bearer "):
+        return False
+    payload = decode_access_token(authorization[7:])
+    return bool(payload and payload.get("admin_id"))
+
+
+def _prune(directory: Path, keep: int):
+    """Delete the oldest profiles beyond `keep`"""
+    profiles = sorted(directory.glob("*.html"), key=lambda path: path.stat().st_mtime)
+    for path in profiles[:max(len(profiles) - keep, 0)]:
+        path.unlink(missing_ok=True)
+
+
+def _save(directory: Path, name: str, html: str, keep: int):
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / name).write_text(html, encoding="utf-8")
+    _prune(directory, keep)
+
+
+class ProfilingMiddleware:
+    """
+    On-demand pyinstrument profiling.
+
+    A request is profiled when it asks for it (`?profile=1` or `X-Profile: 1`)
+    and comes from an admin (anyone in development), or when it is picked by
+    PROFILE_SAMPLE_RATE. Every profile is written to PROFILE_DIR as
+    `<time>_<method>_<route>_<ms>ms.html`, keeping the newest PROFILE_MAX_FILES.
+    `?profile=1` additionally returns the HTML report instead of the response.
+    Requests that are not profiled only pay for the checks above.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.directory = Path(Config.PROFILE_DIR)
+        self.sample_rate = Config.PROFILE_SAMPLE_RATE
+        self.max_files = Config.PROFILE_MAX_FILES
+        self.open_access = Config.APP_ENV == "development"
+
+    def _requested(self, scope) -> tuple[bool, bool]:
+        """(profile this request, return the report as the response)"""
+
+        query_string = scope.get("query_string", b"")
+        as_html = (
+            b"profile=" in query_string
+            and parse_qs(query_string.decode("latin-1")).get("profile", [""])[0] == "1"
+        )
+        requested = as_html or _header(scope, PROFILE_HEADER) == "1"
+
+        if requested and (self.open_access or _is_admin(scope)):
+            return True, as_html
+
+        return self.sample_rate > 0 and random.random() < self.sample_rate, False
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile, as_html = self._requested(scope)
+        if not profile:
+            await self.app(scope, receive, send)
+            return
+
+        from pyinstrument import Profiler
+
+        async def swallow(message):
+            pass
+
+        profiler = Profiler(async_mode="enabled")
+        start = time.perf_counter()
+        profiler.start()
+        try:
+            await self.app(scope, receive, swallow if as_html else send)
+        finally:
+            profiler.stop()
+            elapsed_ms = int((time.perf_counter() - start) * 1000)
+
+            route = getattr(scope.get("route"), "path", None) or scope["path"]
+            slug = re.sub(r"[^A-Za-z0-9]+", "-", route).strip("-")[:80] or "root"
+            name = f"{datetime.now():%Y%m%d-%H%M%S-%f}_{scope['method']}_{slug}_{elapsed_ms}ms.html"
+            html = profiler.output_html()
+
+            try:
+                await asyncio.to_thread(_save, self.directory, name, html, self.max_files)
+            except OSError:
+                logger.warning("Could not write profile %s", name, exc_info=True)
+
+        if as_html:
+            body = html.encode("utf-8")
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"text/html; charset=utf-8"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
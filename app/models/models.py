@@ -1,6 +1,6 @@
 from sqlalchemy import (
     Column, Integer, String, Boolean, DateTime, Float,
-    ForeignKey, UniqueConstraint, Index, Enum
+    ForeignKey, UniqueConstraint, Index, Enum, JSON, Text
 )
 from sqlalchemy.orm import relationship, declarative_base
 from sqlalchemy.sql import func
@@ -288,6 +288,13 @@ class Vote(Base):
 
     voted_at = Column(DateTime, server_default=func.now())
 
+    __table_args__ = (
+        # Covering for tallies: GROUP BY candidate_id WHERE election_id = ?
+        Index("idx_vote_election_candidate", "election_id", "candidate_id"),
+        # Covering for "has voted" lookups: member_id IN (SELECT member_id FROM votes)
+        Index("idx_vote_member_election", "member_id", "election_id"),
+    )
+
     election = relationship("Election", back_populates="votes")
     member = relationship("Member", back_populates="votes")
     candidate = relationship("Candidate", back_populates="votes")
@@ -306,6 +313,11 @@ class OTP(Base):
  
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, onupdate=func.now())
+
+    __table_args__ = (
+        Index("idx_otp_member_active", "member_id", "is_used", "expires_at"),
+        Index("idx_otp_expires", "expires_at"),
+    )
  
     member = relationship("Member")
  
@@ -376,8 +388,72 @@ class Nomination(Base):
 
     applied_at = Column(DateTime, server_default=func.now())
 
+    __table_args__ = (
+        # Keyset pagination: ORDER BY applied_at DESC, nomination_id DESC
+        Index("idx_nomination_applied", "applied_at", "nomination_id"),
+    )
+
     # relationships
     candidate = relationship("Candidate", back_populates="nomination")
     member = relationship("Member", back_populates="nominations")
     reviewed_admin = relationship("Admin")
-    election = relationship("Election", back_populates="nominations")
\ No newline at end of file
+    election = relationship("Election", back_populates="nominations")
+
+# =========================================================
+# NOMINATION STATS (maintained counters)
+# =========================================================
+
+# Updated in the same transaction as each review; rebuilt periodically
+# from candidates/nominations (app/services/nomination_stats_service.py)
+class NominationStats(Base):
+    __tablename__ = "nomination_stats"
+
+    election_id = Column(Integer, ForeignKey("elections.election_id", ondelete="CASCADE"), primary_key=True)
+    event_id = Column(Integer, ForeignKey("election_events.event_id", ondelete="CASCADE"), nullable=True)
+
+    pending = Column(Integer, nullable=False, default=0)
+    approved = Column(Integer, nullable=False, default=0)
+    rejected = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index("idx_nomination_stats_event", "event_id"),
+    )
+
+
+# =========================================================
+# BACKGROUND JOBS (app/core/jobs.py)
+# =========================================================
+
+class Job(Base):
+    __tablename__ = "jobs"
+
+    job_id = Column(Integer, primary_key=True)
+    kind = Column(String(50), nullable=False)
+    payload = Column(JSON, nullable=False)
+
+    # QUEUED → RUNNING → SUCCEEDED | FAILED | CANCELLED (RUNNING → QUEUED on retry)
+    status = Column(String(20), nullable=False, default="QUEUED")
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    run_after = Column(DateTime, nullable=False)
+
+    progress = Column(Float, nullable=False, default=0)
+    progress_message = Column(String(255))
+    result = Column(JSON)
+    error = Column(Text)
+    cancel_requested = Column(Boolean, nullable=False, default=False)
+
+    worker_id = Column(String(100))
+    heartbeat_at = Column(DateTime)
+    created_by = Column(Integer, ForeignKey("admins.admin_id", ondelete="SET NULL"))
+    created_at = Column(DateTime, server_default=func.now())
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+
+    __table_args__ = (
+        # Claim query: WHERE status = 'QUEUED' AND run_after <= now ORDER BY job_id
+        Index("idx_job_claim", "status", "run_after", "job_id"),
+        Index("idx_job_creator", "created_by", "job_id"),
+    )
@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.otp import OTPRateLimitError
 from app.services.auth_service import (
     admin_register,
     admin_login,
@@ -51,7 +52,10 @@ async def member_send_otp(
     data: MemberSendOTPRequest,
     db: AsyncSession = Depends(get_db),
 ):
-    result = await send_member_otp(db, data.member_number)
+    try:
+        result = await send_member_otp(db, data.member_number)
+    except OTPRateLimitError as e:
+        raise HTTPException(status_code=429, detail=str(e))
     if not result:
         raise HTTPException(status_code=404, detail="Member not found or inactive")
     return result
@@ -1,19 +1,24 @@
 from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.cpu_executor import CpuExecutorBusy, CpuTaskTimeout
+from app.core.database import get_read_db
 from app.middleware.auth import get_current_admin
+from app.schemas.nomination import BulkReviewRequest
+from app.core.database import get_db
 
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_read_db
 from app.services.candidate_service import search_candidates_service
 from app.services.candidate_service import (
     
     get_candidate_details,
     reject_candidate,
     get_nominations,
+    get_nomination_stats,
+    bulk_review_candidates,
     
     approve_candidate
 )
@@ -30,25 +35,28 @@ router = APIRouter(
 
 @router.get("/all")
 async def list_nominations(
-    status: str | None = Query("ALL", description="ALL | APPROVED | REJECTED"),
+    status: str | None = Query("ALL", description="ALL | PENDING | APPROVED | REJECTED"),
     election_id: int | None = Query(None, description="Filter by election"),
     assembly_id: int | None = Query(None, description="Filter by assembly"),
-    db: AsyncSession = Depends(get_db),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    db: AsyncSession = Depends(get_read_db),
     current_admin = Depends(get_current_admin)
 ):
     """
-    View all nomination decisions (approval/rejection history).
+    View all nominations and their review decisions.
     
     Shows:
-    - All reviewed candidates
-    - Their status (APPROVED or REJECTED)
+    - All nominations, pending ones included
+    - Their status (PENDING, APPROVED or REJECTED)
     - Admin who reviewed
     - Rejection/approval notes
     - Timestamp
     
     Returns:
-        - Total nominations
-        - Nomination records with details
+        - total matching the filters (first page only)
+        - Nomination records with details, newest application first
+        - next_cursor for the following page (null on the last page)
     
     Authorization: ADMIN only
     """
@@ -57,7 +65,9 @@ async def list_nominations(
             db,
             status=status,
             election_id=election_id,
-            assembly_id=assembly_id
+            assembly_id=assembly_id,
+            limit=limit,
+            cursor=cursor,
         )
         return result
     except ValueError as e:
@@ -69,9 +79,54 @@ async def list_nominations(
 
 
 
+@router.post("/bulk-review")
+async def bulk_review(
+    payload: BulkReviewRequest,
+    db: AsyncSession = Depends(get_db),
+    current_admin = Depends(get_current_admin)
+):
+    """
+    Approve or reject many PENDING candidates in one transaction.
+    
+    Returns:
+        - Per-candidate outcome (nomination_id, or why it was skipped)
+    
+    Authorization: ADMIN only
+    """
+    try:
+        return await bulk_review_candidates(
+            db,
+            payload.ids,
+            payload.decision,
+            current_admin.admin_id,
+            rejection_reason=payload.reason,
+            approval_notes=payload.notes,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/stats")
+async def nomination_stats(
+    election_id: int | None = Query(None, description="Filter by election"),
+    event_id: int | None = Query(None, description="Filter by election event"),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """
+    Pending / approved / rejected counts for the admin dashboard,
+    read from the maintained per-election counters.
+    """
+    return await get_nomination_stats(db, election_id=election_id, event_id=event_id)
+
+
 @router.get("/search/candidates")
 async def search_candidates(
     q: str = Query(..., description="Search candidate by name or election"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    return await search_candidates_service(db, q)
+    try:
+        return await search_candidates_service(db, q)
+    except CpuExecutorBusy as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    except CpuTaskTimeout as e:
+        raise HTTPException(status_code=504, detail=str(e))
@@ -4,12 +4,14 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
 from app.schemas.election import ElectionCreate
 from app.services.election_service import create_election, get_elections
-from app.middleware.auth import get_current_admin
-from app.models.models import Admin
+from app.middleware.auth import get_current_admin, AdminPrincipal
 from fastapi import APIRouter, Depends
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.services.results import calculate_election_winner
+from app.core.jobs import enqueue, job_to_dict
+from app.services.result_engine import calculate_election_result
 
 router = APIRouter(
     prefix="/elections",
@@ -20,15 +22,26 @@ router = APIRouter(
 @router.post("/admin/calculate-result/{election_id}")
 async def calculate_result(
     election_id: int,
+    recalculate: bool = Query(False, description="Recompute even if already calculated"),
+    background: bool = Query(False, description="Run as a background job and return 202 with its status_url"),
     db: AsyncSession = Depends(get_db),
+    admin: AdminPrincipal = Depends(get_current_admin),
 ):
-    return await calculate_election_winner(db, election_id)
+    if background:
+        job = await enqueue(
+            db, "results.calculate",
+            {"election_id": election_id, "recalculate": recalculate},
+            created_by=admin.admin_id,
+        )
+        return JSONResponse(status_code=202, content=jsonable_encoder(job_to_dict(job)))
+
+    return await calculate_election_result(db, election_id, recalculate)
 # ========= POST =========
 @router.post("/")
 async def create_new_election(
     data: ElectionCreate,
     db: AsyncSession = Depends(get_db),
-    admin: Admin = Depends(get_current_admin),  # 🔐 Get real admin from JWT
+    admin: AdminPrincipal = Depends(get_current_admin),  # 🔐 Get real admin from JWT
 ):
     """
     Create election using logged-in admin
@@ -0,0 +1,65 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.core.jobs import job_to_dict, request_cancel
+from app.middleware.auth import get_current_admin, AdminPrincipal
+from app.models.models import Job
+
+
+router = APIRouter(
+    prefix="/jobs",
+    tags=["Jobs"],
+    dependencies=[Depends(get_current_admin)],
+)
+
+
+async def _own_job(db: AsyncSession, job_id: int, admin_id: int) -> Job:
+    job = await db.get(Job, job_id)
+    if not job or job.created_by != admin_id:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@router.get("/")
+async def list_jobs(
+    status: str | None = Query(None, description="QUEUED | RUNNING | SUCCEEDED | FAILED | CANCELLED"),
+    kind: str | None = Query(None),
+    limit: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_db),
+    admin: AdminPrincipal = Depends(get_current_admin),
+):
+    """Background jobs started by the current admin, newest first"""
+    query = select(Job).where(Job.created_by == admin.admin_id)
+    if status:
+        query = query.where(Job.status == status.upper())
+    if kind:
+        query = query.where(Job.kind == kind)
+
+    jobs = (await db.execute(query.order_by(Job.job_id.desc()).limit(limit))).scalars().all()
+    return {"jobs": [job_to_dict(job) for job in jobs]}
+
+
+@router.get("/{job_id}")
+async def get_job(
+    job_id: int,
+    db: AsyncSession = Depends(get_db),
+    admin: AdminPrincipal = Depends(get_current_admin),
+):
+    """Status, progress and (once finished) result or error of a job"""
+    return job_to_dict(await _own_job(db, job_id, admin.admin_id))
+
+
+@router.post("/{job_id}/cancel")
+async def cancel_job(
+    job_id: int,
+    db: AsyncSession = Depends(get_db),
+    admin: AdminPrincipal = Depends(get_current_admin),
+):
+    """
+    Cancel a queued job, or ask a running one to stop at its next
+    progress update. Finished jobs are returned unchanged.
+    """
+    job = await _own_job(db, job_id, admin.admin_id)
+    return job_to_dict(await request_cancel(db, job))
@@ -1,13 +1,16 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, HTTPException
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.cpu_executor import CpuExecutorBusy, CpuTaskTimeout
+from app.core.database import get_db, get_read_db
 from app.middleware.auth import get_current_admin
-from app.services.member_service import get_members
+from app.schemas.member import MemberBulkUpsertRequest
+from app.services.member_service import get_members, bulk_upsert_members
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_read_db
 from app.services.member_service import search_members_service
 
 
@@ -23,7 +26,7 @@ async def list_members(
     district_id: int | None = Query(None),
     status: str | None = Query(None, description="active | inactive"),
     voted: str | None = Query(None, description="yes | no"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Returns:
@@ -39,7 +42,7 @@ async def list_members(
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_read_db
 from app.services.member_service import search_members_service
 
 
@@ -48,6 +51,31 @@ from app.services.member_service import search_members_service
 @router.get("/search/members")
 async def search_members(
     q: str = Query(..., description="Search member by name or location"),
+    db: AsyncSession = Depends(get_read_db),
+):
+    try:
+        return await search_members_service(db, q)
+    except CpuExecutorBusy as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    except CpuTaskTimeout as e:
+        raise HTTPException(status_code=504, detail=str(e))
+
+
+@router.post("/bulk-upsert")
+async def bulk_upsert(
+    payload: MemberBulkUpsertRequest,
     db: AsyncSession = Depends(get_db),
 ):
-    return await search_members_service(db, q)
\ No newline at end of file
+    """
+    Sync up to 10k members from the membership system, keyed on
+    member_number. Returns per-row outcomes; rejected rows do not
+    block the rest of the batch.
+    """
+    try:
+        return await bulk_upsert_members(db, payload.members)
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=409,
+            detail="Batch conflicts with a concurrent change to the same members; retry it",
+        )
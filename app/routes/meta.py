@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_read_db
 from app.middleware.auth import get_current_admin
 from app.models.models import Admin
 from app.services import meta_service
@@ -31,13 +31,13 @@ async def notification_types():
 
 # 🔹 All States
 @router.get("/states")
-async def states(db: AsyncSession = Depends(get_db)):
+async def states(db: AsyncSession = Depends(get_read_db)):
     return await meta_service.get_states(db)
 
 
 # 🔹 All Assemblies
 @router.get("/assemblies")
-async def assemblies(db: AsyncSession = Depends(get_db)):
+async def assemblies(db: AsyncSession = Depends(get_read_db)):
     return await meta_service.get_all_assemblies(db)
 
 
@@ -45,12 +45,12 @@ async def assemblies(db: AsyncSession = Depends(get_db)):
 @router.get("/villages/by-assembly/{assembly_id}")
 async def villages_by_assembly(
     assembly_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     return await meta_service.get_villages_by_assembly(db, assembly_id)
 
 
 
 @router.get("/elections/events")
-async def fetch_events(db: AsyncSession = Depends(get_db)):
+async def fetch_events(db: AsyncSession = Depends(get_read_db)):
     return await meta_service.get_all_events_with_elections(db)
\ No newline at end of file
@@ -2,25 +2,46 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.services.nomination_service import create_nomination_notification
+from app.core.jobs import enqueue, job_to_dict
+from app.models.models import ElectionEvent
 
-from fastapi import APIRouter, Depends, Body
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.middleware.auth import get_current_admin
+from app.schemas.nomination import BulkReviewRequest, RejectRequest
 from app.services.nomination_service import (
     get_all_nominations,
     approve_nomination,
     reject_nomination,
+    bulk_review_nominations,
 )
 
 
 router = APIRouter(prefix="/nominations", tags=["Nominations"])
 
 
+# ==============================
+# Bulk approve / reject
+# (declared before POST /{event_id}, which would otherwise match it)
+# ==============================
+@router.post("/bulk-review")
+async def bulk_review(
+    payload: BulkReviewRequest,
+    db: AsyncSession = Depends(get_db),
+    admin=Depends(get_current_admin),
+):
+    """
+    Approve or reject many PENDING nominations in one transaction.
+    Returns an outcome per id.
+    """
+    return await bulk_review_nominations(
+        db, payload.ids, payload.decision, admin.admin_id, payload.reason,
+    )
 
-@router.post("/{event_id}")
+
+@router.post("/{event_id}", status_code=202)
 async def send_nomination_notification(
     event_id: int,
     db: AsyncSession = Depends(get_db),
@@ -28,15 +49,15 @@ async def send_nomination_notification(
 ):
     """
     Admin triggers nomination notification for an ElectionEvent.
+    Emails go out from a background job; poll status_url.
     """
-    try:
-        return await create_nomination_notification(
-            db=db,
-            event_id=event_id,
-            admin_id=current_admin.admin_id,
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e))
+    if not await db.get(ElectionEvent, event_id):
+        raise HTTPException(status_code=404, detail="Election event not found")
+
+    job = await enqueue(
+        db, "notification.nomination", {"event_id": event_id}, created_by=current_admin.admin_id,
+    )
+    return job_to_dict(job)
 
 
 
@@ -44,10 +65,15 @@ async def send_nomination_notification(
 
 @router.get("/")
 async def list_nominations(
-    db: AsyncSession = Depends(get_db),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    db: AsyncSession = Depends(get_read_db),
     admin=Depends(get_current_admin),
 ):
-    return await get_all_nominations(db)
+    try:
+        return await get_all_nominations(db, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 # ==============================
@@ -68,11 +94,11 @@ async def approve(
 @router.post("/{nomination_id}/reject")
 async def reject(
     nomination_id: int,
-    reason: str = Body(..., embed=True),
+    payload: RejectRequest,
     db: AsyncSession = Depends(get_db),
     admin=Depends(get_current_admin),
 ):
-    return await reject_nomination(db, nomination_id, admin.admin_id, reason)
+    return await reject_nomination(db, nomination_id, admin.admin_id, payload.reason)
 
 
 
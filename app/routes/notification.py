@@ -1,15 +1,16 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.jobs import enqueue, job_to_dict
 from app.middleware.auth import get_current_admin
-from app.services.notification_service import get_notifications , create_notification_for_assembly
+from app.services.notification_service import get_notifications
 
 from app.schemas.notification import NotificationCreate
 
 
 
-from app.models.models import NotificationType
+from app.models.models import Assembly, NotificationType
 
 
 router = APIRouter(
@@ -41,17 +42,28 @@ async def list_notifications(
 
 
 
-@router.post("/create")
+@router.post("/create", status_code=202)
 async def create_notification(
     data: NotificationCreate,
     db: AsyncSession = Depends(get_db),
     admin=Depends(get_current_admin),
 ):
-    return await create_notification_for_assembly(
-        db=db,
-        admin_id=admin.admin_id,
-        assembly_id=data.assembly_id,
-        type=data.type,
-        title=data.title,
-        message=data.message,
-    )
\ No newline at end of file
+    """
+    Queue the notification and its emails as a background job.
+    Poll status_url for progress and the sent/failed counts.
+    """
+    if not await db.get(Assembly, data.assembly_id):
+        raise HTTPException(status_code=404, detail="Assembly not found")
+
+    job = await enqueue(
+        db,
+        "notification.assembly",
+        {
+            "assembly_id": data.assembly_id,
+            "type": data.type.value,
+            "title": data.title,
+            "message": data.message,
+        },
+        created_by=admin.admin_id,
+    )
+    return job_to_dict(job)
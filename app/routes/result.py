@@ -1,11 +1,11 @@
-from fastapi import APIRouter, Depends, Query, HTTPException, status
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 
-from app.core.database import get_db
-from app.middleware.auth import get_current_admin
-from app.schemas.result import ResultPublishRequest
-from app.models.models import Admin
+from app.core.database import get_db, get_read_db, read_session_maker_for
+from app.middleware.auth import get_current_admin, AdminPrincipal
+from app.schemas.result import ResultPublishRequest, ResultBulkPublishRequest
 
 
 router = APIRouter(
@@ -23,8 +23,8 @@ async def admin_get_all_results_endpoint(
     district_id: Optional[int] = Query(None, description="Filter by district ID"),
     assembly_id: Optional[int] = Query(None, description="Filter by assembly ID"),
     election_level: Optional[str] = Query(None, description="Filter by election level"),
-    db: AsyncSession = Depends(get_db),
-    admin: Admin = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_read_db),
+    admin: AdminPrincipal = Depends(get_current_admin),
 ):
     
     from app.services.result_service import admin_get_all_results, AdminResultsFilterParams
@@ -45,13 +45,76 @@ async def admin_get_all_results_endpoint(
 
 
 
+@router.get("/admin/analytics")
+async def admin_get_result_analytics_endpoint(
+    assembly_id: Optional[int] = Query(None, description="Filter by assembly ID"),
+    district_id: Optional[int] = Query(None, description="Filter by district ID"),
+    db: AsyncSession = Depends(get_read_db),
+    admin: AdminPrincipal = Depends(get_current_admin),
+):
+
+    from app.core.cpu_executor import CpuExecutorBusy, CpuTaskTimeout
+    from app.services.analytics_service import admin_get_result_analytics
+
+    try:
+        return await admin_get_result_analytics(db, admin.admin_id, assembly_id, district_id)
+    except CpuExecutorBusy as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    except CpuTaskTimeout as e:
+        raise HTTPException(status_code=504, detail=str(e))
+
+
+
+
+
+@router.get("/admin/export")
+async def admin_export_results_endpoint(
+    request: Request,
+    format: str = Query("csv", pattern="^(csv|ndjson)$", description="csv | ndjson"),
+    gzip: bool = Query(False, description="Gzip the stream on the fly"),
+    state_id: Optional[int] = Query(None, description="Filter by state ID"),
+    district_id: Optional[int] = Query(None, description="Filter by district ID"),
+    assembly_id: Optional[int] = Query(None, description="Filter by assembly ID"),
+    election_level: Optional[str] = Query(None, description="Filter by election level"),
+    admin: AdminPrincipal = Depends(get_current_admin),
+):
+
+    from app.services.result_service import admin_export_results, AdminResultsFilterParams
+
+    filters = AdminResultsFilterParams(
+        state_id=state_id,
+        district_id=district_id,
+        assembly_id=assembly_id,
+        election_level=election_level,
+    )
+
+    filename = f"results.{format}"
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+
+    if gzip:
+        filename += ".gz"
+        media_type = "application/gzip"
+
+    return StreamingResponse(
+        admin_export_results(
+            admin.admin_id, filters, format, gzip,
+            session_maker=read_session_maker_for(request),
+        ),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+
+
+
 @router.get("/admin/assembly/{assembly_id}")
 async def admin_get_results_by_assembly_endpoint(
     assembly_id: int,
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(10, ge=1, le=100, description="Results per page"),
-    db: AsyncSession = Depends(get_db),
-    admin: Admin = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_read_db),
+    admin: AdminPrincipal = Depends(get_current_admin),
 ):
     
     from app.services.result_service import admin_get_results_by_assembly
@@ -80,7 +143,7 @@ async def admin_get_results_by_assembly_endpoint(
 async def admin_publish_single_election(
     election_id: int,
     db: AsyncSession = Depends(get_db),
-    admin: Admin = Depends(get_current_admin),
+    admin: AdminPrincipal = Depends(get_current_admin),
 ):
    
     from app.services.result_service import admin_publish_election_result
@@ -108,11 +171,29 @@ async def admin_publish_single_election(
 
 
 
+@router.post("/admin/publish-bulk", status_code=202)
+async def admin_bulk_publish_elections(
+    data: ResultBulkPublishRequest,
+    db: AsyncSession = Depends(get_db),
+    admin: AdminPrincipal = Depends(get_current_admin),
+):
+    """Publish runs as a background job; poll status_url for the summary"""
+
+    from app.core.jobs import enqueue, job_to_dict
+
+    job = await enqueue(
+        db, "results.publish_bulk", {"election_ids": data.election_ids}, created_by=admin.admin_id,
+    )
+    return job_to_dict(job)
+
+
+
+
 @router.post("/admin/unpublish/{election_id}")
 async def admin_unpublish_single_election(
     election_id: int,
     db: AsyncSession = Depends(get_db),
-    admin: Admin = Depends(get_current_admin),
+    admin: AdminPrincipal = Depends(get_current_admin),
 ):
     
     from app.services.result_service import admin_unpublish_election_result
@@ -0,0 +1,60 @@
+import secrets
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from app.core.config import Config
+from app.core.database import pool_stats, engine, read_engine
+from app.core.metrics import REGISTRY, CONTENT_TYPE
+from app.middleware.auth import get_current_admin
+from app.services.health_service import check_liveness, check_readiness
+
+
+router = APIRouter(
+    prefix="/system",
+    tags=["System"],
+    dependencies=[Depends(get_current_admin)],
+)
+
+# Scraped by Prometheus, which cannot log in as an admin
+metrics_router = APIRouter(tags=["System"])
+
+# Kubernetes probes, unauthenticated like /metrics
+health_router = APIRouter(prefix="/health", tags=["System"])
+
+
+@router.get("/db-pool")
+async def db_pool_endpoint():
+    """Connection pool usage of this process"""
+    return {
+        "primary": pool_stats(engine),
+        "read": pool_stats(read_engine) if read_engine is not engine else None,
+    }
+
+
+@metrics_router.get("/metrics", response_class=PlainTextResponse)
+async def metrics_endpoint(authorization: str | None = Header(None)):
+    """Prometheus text format; requires `Bearer METRICS_TOKEN` when one is configured"""
+
+    if Config.METRICS_TOKEN and not secrets.compare_digest(
+        authorization or "", f"Bearer {Config.METRICS_TOKEN}"
+    ):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid metrics token")
+
+    return PlainTextResponse(REGISTRY.render(), media_type=CONTENT_TYPE)
+
+
+def _probe_response(report: dict) -> JSONResponse:
+    return JSONResponse(status_code=200 if report["ok"] else 503, content=report)
+
+
+@health_router.get("/live")
+async def liveness_endpoint():
+    """503 → restart the pod (event loop or scheduler stuck)"""
+    return _probe_response(check_liveness())
+
+
+@health_router.get("/ready")
+async def readiness_endpoint():
+    """503 → stop routing traffic here until the checks pass again"""
+    return _probe_response(await check_readiness())
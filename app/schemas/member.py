@@ -0,0 +1,10 @@
+from pydantic import BaseModel, Field
+
+
+MAX_BULK_UPSERT = 10_000
+
+
+class MemberBulkUpsertRequest(BaseModel):
+    # Rows stay untyped here so one bad row is reported in its outcome
+    # instead of failing the whole batch with a 422
+    members: list[dict] = Field(..., min_length=1, max_length=MAX_BULK_UPSERT)
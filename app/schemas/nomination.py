@@ -0,0 +1,37 @@
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+
+MAX_BULK_REVIEW = 5000
+MIN_REJECTION_REASON = 5
+
+
+def check_rejection_reason(reason: str | None) -> str:
+    """The stripped reason; ValueError unless it has MIN_REJECTION_REASON characters"""
+    reason = (reason or "").strip()
+    if len(reason) < MIN_REJECTION_REASON:
+        raise ValueError(f"Rejection reason is required (minimum {MIN_REJECTION_REASON} characters)")
+    return reason
+
+
+class RejectRequest(BaseModel):
+    reason: str
+
+    @field_validator("reason")
+    @classmethod
+    def _reason(cls, reason: str) -> str:
+        return check_rejection_reason(reason)
+
+
+class BulkReviewRequest(BaseModel):
+    ids: list[int] = Field(..., min_length=1, max_length=MAX_BULK_REVIEW)
+    decision: Literal["APPROVED", "REJECTED"]
+    reason: Optional[str] = None    # required to reject
+    notes: Optional[str] = None     # approval notes (candidates)
+
+    @model_validator(mode="after")
+    def _reason_to_reject(self):
+        if self.decision == "REJECTED":
+            self.reason = check_rejection_reason(self.reason)
+        return self
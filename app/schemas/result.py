@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional
 
 
@@ -7,4 +7,8 @@ class ResultPublishRequest(BaseModel):
     assembly_id: Optional[int] = None
     mandal_id: Optional[int] = None
     village_id: Optional[int] = None
-    ward_id: Optional[int] = None
\ No newline at end of file
+    ward_id: Optional[int] = None
+
+
+class ResultBulkPublishRequest(BaseModel):
+    election_ids: list[int] = Field(..., min_length=1)
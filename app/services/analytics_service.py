@@ -0,0 +1,209 @@
+from itertools import chain
+
+import numpy as np
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cpu_executor import cpu_executor
+from app.models.models import (
+    Election, Candidate, Member,
+    Ward, Village, Mandal, Assembly,
+)
+
+
+# Bucket edges (in %) shared by the vote share and margin histograms
+HISTOGRAM_BINS = np.arange(0, 101, 10)
+
+# Elections decided by less than this margin (in %) count as competitive
+COMPETITIVE_MARGIN = 5.0
+
+
+# =========================================================
+# COLUMNAR FETCH
+# =========================================================
+
+async def fetch_result_columns(
+    db: AsyncSession,
+    admin_id: int,
+    assembly_id: int | None = None,
+    district_id: int | None = None,
+):
+    """
+    One query → (election_id, candidate_id, vote_count, eligible_voters)
+    for every candidate of the admin's completed elections, as int64 arrays.
+    """
+
+    voters_subq = (
+        select(
+            Member.ward_id,
+            func.count(Member.member_id).label("eligible_voters"),
+        )
+        .where(Member.is_eligible_to_vote == True)
+        .group_by(Member.ward_id)
+        .subquery()
+    )
+
+    query = (
+        select(
+            Candidate.election_id,
+            Candidate.candidate_id,
+            func.coalesce(Candidate.vote_count, 0),
+            func.coalesce(voters_subq.c.eligible_voters, 0),
+        )
+        .join(Election, Election.election_id == Candidate.election_id)
+        .outerjoin(voters_subq, voters_subq.c.ward_id == Election.ward_id)
+        .where(
+            Election.status == "COMPLETED",
+            Election.admin_id == admin_id,
+        )
+    )
+
+    if assembly_id or district_id:
+        query = (
+            query
+            .join(Ward, Ward.ward_id == Election.ward_id)
+            .join(Village, Village.village_id == Ward.village_id)
+            .join(Mandal, Mandal.mandal_id == Village.mandal_id)
+        )
+
+    if assembly_id:
+        query = query.where(Mandal.assembly_id == assembly_id)
+
+    if district_id:
+        query = (
+            query
+            .join(Assembly, Assembly.assembly_id == Mandal.assembly_id)
+            .where(Assembly.district_id == district_id)
+        )
+
+    rows = (await db.execute(query)).tuples().all()
+
+    flat = np.fromiter(chain.from_iterable(rows), dtype=np.int64, count=len(rows) * 4)
+    columns = flat.reshape(len(rows), 4)
+
+    return columns[:, 0], columns[:, 1], columns[:, 2], columns[:, 3]
+
+
+# =========================================================
+# VECTORIZED STATISTICS
+# =========================================================
+
+def _distribution(values: np.ndarray) -> dict:
+    values = values[~np.isnan(values)]
+    if not values.size:
+        return {"count": 0, "mean": None, "median": None, "p10": None, "p90": None}
+
+    p10, median, p90 = np.percentile(values, [10, 50, 90])
+    return {
+        "count": int(values.size),
+        "mean": round(float(values.mean()), 2),
+        "median": round(float(median), 2),
+        "p10": round(float(p10), 2),
+        "p90": round(float(p90), 2),
+    }
+
+
+def _histogram(values: np.ndarray) -> list[dict]:
+    counts, edges = np.histogram(values[~np.isnan(values)], bins=HISTOGRAM_BINS)
+    return [
+        {"from": int(edges[i]), "to": int(edges[i + 1]), "count": int(counts[i])}
+        for i in range(counts.size)
+    ]
+
+
+def compute_result_analytics(
+    election_ids: np.ndarray,
+    candidate_ids: np.ndarray,
+    vote_counts: np.ndarray,
+    eligible_voters: np.ndarray,
+) -> dict:
+    """
+    Turnout, vote share, margin and competitiveness statistics from
+    per-candidate columns. Pure NumPy, no Python loop over elections.
+    """
+
+    if not election_ids.size:
+        return {
+            "elections": 0,
+            "candidates": 0,
+            "turnout": _distribution(np.empty(0)),
+            "winner_share": _distribution(np.empty(0)),
+            "margin": _distribution(np.empty(0)),
+            "vote_share_histogram": _histogram(np.empty(0)),
+            "margin_histogram": _histogram(np.empty(0)),
+            "competitiveness": {
+                "competitive": 0,
+                "ties": 0,
+                "uncontested": 0,
+                "no_votes": 0,
+                "mean_effective_candidates": None,
+            },
+        }
+
+    # Group by election, highest vote count first inside each group
+    order = np.lexsort((-vote_counts, election_ids))
+    election_ids = election_ids[order]
+    votes = vote_counts[order].astype(np.float64)
+    eligible = eligible_voters[order].astype(np.float64)
+
+    starts = np.flatnonzero(np.r_[True, election_ids[1:] != election_ids[:-1]])
+    sizes = np.diff(np.r_[starts, election_ids.size])
+
+    totals = np.add.reduceat(votes, starts)
+    top = votes[starts]
+    has_runner_up = sizes > 1
+    runner_up = np.where(has_runner_up, votes[np.minimum(starts + 1, votes.size - 1)], 0)
+    ward_eligible = eligible[starts]
+    voted = totals > 0
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        turnout = np.where(ward_eligible > 0, totals / ward_eligible * 100, np.nan)
+        winner_share = np.where(voted, top / totals * 100, np.nan)
+        margin = np.where(voted & has_runner_up, (top - runner_up) / totals * 100, np.nan)
+
+        shares = votes / np.repeat(totals, sizes)
+        concentration = np.add.reduceat(np.nan_to_num(shares) ** 2, starts)
+        effective_candidates = np.where(voted, 1 / concentration, np.nan)
+
+    contested = voted & has_runner_up
+
+    return {
+        "elections": int(starts.size),
+        "candidates": int(candidate_ids.size),
+        "turnout": _distribution(turnout),
+        "winner_share": _distribution(winner_share),
+        "margin": _distribution(margin),
+        "vote_share_histogram": _histogram(shares * 100),
+        "margin_histogram": _histogram(margin),
+        "competitiveness": {
+            "competitive": int(np.count_nonzero(contested & (margin < COMPETITIVE_MARGIN))),
+            "ties": int(np.count_nonzero(contested & (top == runner_up))),
+            "uncontested": int(np.count_nonzero(~has_runner_up)),
+            "no_votes": int(np.count_nonzero(~voted)),
+            "mean_effective_candidates": (
+                round(float(np.nanmean(effective_candidates)), 2) if voted.any() else None
+            ),
+        },
+    }
+
+
+# =========================================================
+# ADMIN SERVICE - RESULT ANALYTICS
+# =========================================================
+
+async def admin_get_result_analytics(
+    db: AsyncSession,
+    admin_id: int,
+    assembly_id: int | None = None,
+    district_id: int | None = None,
+):
+    """Turnout and candidate breakdown across completed elections"""
+
+    columns = await fetch_result_columns(db, admin_id, assembly_id, district_id)
+    analytics = await cpu_executor.run(compute_result_analytics, *columns)
+
+    return {
+        "assembly_id": assembly_id,
+        "district_id": district_id,
+        **analytics,
+    }
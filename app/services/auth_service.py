@@ -2,9 +2,11 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.models import Admin, Member, Assembly
-from app.core.security import verify_password, hash_password, create_access_token
-from app.core.otp import generate_otp, verify_otp
-from app.core.email import send_email
+from app.core.security import verify_password_async, hash_password_async, create_access_token
+from app.core.config import Config
+from app.core.otp import otp_store
+from app.core.email import queue_otp_email
+from app.middleware.auth import invalidate_admin
 
 
 async def admin_register(db: AsyncSession, data):
@@ -30,7 +32,7 @@ async def admin_register(db: AsyncSession, data):
         name=data.name,
         email=data.email,
         mobile=data.mobile,
-        password_hash=hash_password(data.password),
+        password_hash=await hash_password_async(data.password),
         admin_level=data.admin_level,
         assembly_id=data.assembly_id if data.admin_level == "ASSEMBLY" else None,
         is_active=True,
@@ -49,9 +51,10 @@ async def admin_login(db: AsyncSession, email: str, password: str):
     result = await db.execute(select(Admin).where(Admin.email == email))
     admin = result.scalar_one_or_none()
 
-    if not admin or not verify_password(password, admin.password_hash):
+    if not admin or not await verify_password_async(password, admin.password_hash):
         return None
     if not admin.is_active:
+        invalidate_admin(admin.admin_id)
         return None
     token = create_access_token({"admin_id": admin.admin_id})
 
@@ -69,12 +72,13 @@ async def send_member_otp(db: AsyncSession, member_number: str):
     if not member or not member.is_active or not member.is_eligible_to_vote:
         return None
 
-    otp = generate_otp(member.email)
+    otp = await otp_store.issue(db, member.member_id)
 
-    send_email(
+    # Delivered by the OTP email lane; the request does not wait for SMTP
+    queue_otp_email(
         to_email=member.email,
         subject="Your OTP - Political Voting System",
-        body=f"Your OTP is {otp}. Valid for 5 minutes.",
+        body=f"Your OTP is {otp}. Valid for {Config.OTP_TTL_SECONDS // 60} minutes.",
     )
 
     return {"message": "OTP sent to registered email"}
@@ -88,7 +92,7 @@ async def member_verify_otp(db: AsyncSession, member_number: str, otp: str):
     if not member:
         return None
 
-    if not verify_otp(member.email, otp):
+    if not await otp_store.verify(db, member.member_id, otp):
         return None
 
     token = create_access_token({"sub": str(member.member_id), "role": "member"})
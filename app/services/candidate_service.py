@@ -8,7 +8,7 @@ from app.models.models import (
     Candidate, Member, Election, ElectionEvent,
     Ward, Village, Mandal, Assembly, District
 )
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import select, func, and_, or_, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 from datetime import datetime
@@ -21,7 +21,10 @@ from app.models.models import (
 
 
 
-from app.utils.nlp_search import rank_by_similarity
+from app.utils.nlp_search import search_index
+from app.services.nomination_stats_service import record_review, record_reviews, read_nomination_stats
+from app.utils.pagination import after_cursor, keyset_order, page_of
+from app.schemas.nomination import check_rejection_reason
 
 IST = pytz.timezone("Asia/Kolkata")
 
@@ -84,6 +87,7 @@ async def approve_candidate(
     candidate.status = "APPROVED"
     
     db.add(nomination)
+    await record_review(db, candidate.election_id, "APPROVED", was_pending_candidate=True)
     await db.commit()
     await db.refresh(nomination)
     
@@ -179,8 +183,7 @@ async def reject_candidate(
         ValueError: If candidate not found, already reviewed, etc.
     """
     
-    if not rejection_reason or len(rejection_reason.strip()) < 5:
-        raise ValueError("Rejection reason is required (minimum 5 characters)")
+    rejection_reason = check_rejection_reason(rejection_reason)
     
     # Get candidate
     result = await db.execute(
@@ -219,6 +222,7 @@ async def reject_candidate(
     candidate.status = "REJECTED"
     
     db.add(nomination)
+    await record_review(db, candidate.election_id, "REJECTED", was_pending_candidate=True)
     await db.commit()
     await db.refresh(nomination)
     
@@ -240,59 +244,74 @@ async def get_nominations(
     status: str | None = "ALL",
     election_id: int | None = None,
     assembly_id: int | None = None,
+    limit: int = 50,
+    cursor: str | None = None,
 ):
     """
-    Get all nominations (approved/rejected) - Admin history view.
+    All nominations, pending ones included - Admin history view.
+    Newest application first; keyset pagination on (applied_at,
+    nomination_id). total (matching the filters) is on the first page only.
     """
     
     query = (
-        select(Nomination)
-        .options(
-            joinedload(Nomination.member),
-            joinedload(Nomination.candidate),
-            joinedload(Nomination.election).joinedload(Election.event),
-            joinedload(Nomination.reviewed_admin)
+        select(
+            Nomination.nomination_id, Nomination.candidate_id, Nomination.member_id,
+            Nomination.status, Nomination.applied_at, Nomination.reviewed_at,
+            Nomination.rejection_reason, Nomination.approval_notes,
+            Member.name.label("member_name"), Member.mobile,
+            Admin.name.label("reviewed_by"),
+            ElectionEvent.title.label("election"),
         )
+        .outerjoin(Member, Member.member_id == Nomination.member_id)
+        .outerjoin(Admin, Admin.admin_id == Nomination.reviewed_by)
+        .outerjoin(Election, Election.election_id == Nomination.election_id)
+        .outerjoin(ElectionEvent, ElectionEvent.event_id == Election.event_id)
     )
+    filters = []
     
     # Status filter
     if status and status != "ALL":
-        query = query.where(Nomination.status == status.upper())
+        filters.append(Nomination.status == status.upper())
     
     # Election filter
     if election_id:
-        query = query.where(Nomination.election_id == election_id)
+        filters.append(Nomination.election_id == election_id)
     
     # Assembly filter
     if assembly_id:
-        query = query.join(Nomination.member)\
-                     .join(Member.ward)\
-                     .join(Ward.village)\
-                     .join(Village.mandal)\
-                     .where(Mandal.assembly_id == assembly_id)
+        filters.append(
+            Nomination.member_id.in_(
+                select(Member.member_id)
+                .join(Ward, Ward.ward_id == Member.ward_id)
+                .join(Village, Village.village_id == Ward.village_id)
+                .join(Mandal, Mandal.mandal_id == Village.mandal_id)
+                .where(Mandal.assembly_id == assembly_id)
+            )
+        )
+    
+    # Total count (first page only)
+    total = None
+    if cursor is None:
+        total = (
+            await db.execute(select(func.count(Nomination.nomination_id)).where(*filters))
+        ).scalar_one()
     
-    result = await db.execute(query.order_by(Nomination.reviewed_at.desc()))
-    nominations = result.scalars().all()
+    # Page
+    query = query.where(*filters)
+    if cursor:
+        query = query.where(after_cursor(Nomination.applied_at, Nomination.nomination_id, cursor))
+    
+    result = await db.execute(
+        query.order_by(*keyset_order(Nomination.applied_at, Nomination.nomination_id)).limit(limit + 1)
+    )
+    nominations, next_cursor = page_of(
+        [row._asdict() for row in result], limit, "applied_at", "nomination_id",
+    )
     
     return {
-        "total": len(nominations),
-        "nominations": [
-            {
-                "nomination_id": n.nomination_id,
-                "candidate_id": n.candidate_id,
-                "member_name": n.member.name,
-                "member_id": n.member_id,
-                "mobile": n.member.mobile,
-                "status": n.status,
-                "applied_at": n.applied_at,
-                "reviewed_at": n.reviewed_at,
-                "reviewed_by": n.reviewed_admin.name if n.reviewed_admin else None,
-                "rejection_reason": n.rejection_reason,
-                "approval_notes": n.approval_notes,
-                "election": n.election.event.title if n.election and n.election.event else None,
-            }
-            for n in nominations
-        ]
+        "total": total,
+        "next_cursor": next_cursor,
+        "nominations": nominations,
     }
 
 
@@ -304,45 +323,9 @@ async def get_nomination_stats(
 ):
     """
     Get statistics for admin dashboard.
+    Reads the maintained per-election counters (nomination_stats).
     """
-    
-    query_pending = select(func.count(Candidate.candidate_id)).where(
-        and_(
-            Candidate.status == "PENDING",
-            ~Candidate.nomination.has()
-        )
-    )
-    
-    query_approved = select(func.count(Nomination.nomination_id)).where(
-        Nomination.status == "APPROVED"
-    )
-    
-    query_rejected = select(func.count(Nomination.nomination_id)).where(
-        Nomination.status == "REJECTED"
-    )
-    
-    # Apply filters
-    if election_id:
-        query_pending = query_pending.where(Candidate.election_id == election_id)
-        query_approved = query_approved.where(Nomination.election_id == election_id)
-        query_rejected = query_rejected.where(Nomination.election_id == election_id)
-    
-    if event_id:
-        query_pending = query_pending.join(Election).where(Election.event_id == event_id)
-        query_approved = query_approved.join(Election).where(Election.event_id == event_id)
-        query_rejected = query_rejected.join(Election).where(Election.event_id == event_id)
-    
-    pending_count = (await db.execute(query_pending)).scalar() or 0
-    approved_count = (await db.execute(query_approved)).scalar() or 0
-    rejected_count = (await db.execute(query_rejected)).scalar() or 0
-    
-    return {
-        "pending": pending_count,
-        "approved": approved_count,
-        "rejected": rejected_count,
-        "total_reviewed": approved_count + rejected_count,
-        "total_applications": pending_count + approved_count + rejected_count
-    }
+    return await read_nomination_stats(db, election_id, event_id)
 
 
 
@@ -369,7 +352,7 @@ async def search_candidates_service(db: AsyncSession, query: str):
         text = f"{c.member.name} {c.election.title if c.election else ''}"
         documents.append(text)
 
-    ranked_indices = rank_by_similarity(query, documents)
+    ranked_indices = await search_index("candidates", query, documents)
 
     # ---------- RETURN FULL RESPONSE ----------
     return {
@@ -397,4 +380,109 @@ async def search_candidates_service(db: AsyncSession, query: str):
             }
             for i in ranked_indices
         ],
-    }
\ No newline at end of file
+    }
+
+# =========================================================
+# BULK REVIEW (one transaction)
+# =========================================================
+async def bulk_review_candidates(
+    db: AsyncSession,
+    candidate_ids: list[int],
+    decision: str,
+    admin_id: int,
+    rejection_reason: str | None = None,
+    approval_notes: str | None = None,
+):
+    """
+    Approve or reject many PENDING candidates with set-based statements
+    and a single commit. Same rules as approve_candidate /
+    reject_candidate; ids that fail them are reported, not raised.
+    
+    Raises:
+        ValueError: If rejecting without a reason
+    """
+    
+    if decision == "REJECTED":
+        rejection_reason = check_rejection_reason(rejection_reason)
+    
+    candidate_ids = list(dict.fromkeys(candidate_ids))
+    outcomes = {cid: {"candidate_id": cid, "status": "skipped", "error": "Candidate not found"} for cid in candidate_ids}
+    
+    # Validate: status and existing nomination in one query
+    rows = (
+        await db.execute(
+            select(
+                Candidate.candidate_id, Candidate.status, Candidate.election_id, Candidate.member_id,
+                Nomination.status.label("nomination_status"),
+            )
+            .outerjoin(Nomination, Nomination.candidate_id == Candidate.candidate_id)
+            .where(Candidate.candidate_id.in_(candidate_ids))
+        )
+    ).all()
+    
+    accepted = []
+    for row in rows:
+        if row.status != "PENDING":
+            outcomes[row.candidate_id]["error"] = f"Candidate status is {row.status}, not PENDING"
+        elif row.nomination_status is not None:
+            outcomes[row.candidate_id]["error"] = f"Candidate already reviewed with status: {row.nomination_status}"
+        else:
+            accepted.append(row)
+    
+    if accepted:
+        reviewed_at = datetime.now(IST)
+        accepted_ids = [r.candidate_id for r in accepted]
+        connection = await db.connection()
+        
+        # Nomination records (multi-row insert)
+        await connection.execute(
+            insert(Nomination.__table__),
+            [
+                {
+                    "candidate_id": r.candidate_id,
+                    "election_id": r.election_id,
+                    "member_id": r.member_id,
+                    "status": decision,
+                    "approval_notes": approval_notes if decision == "APPROVED" else None,
+                    "rejection_reason": rejection_reason if decision == "REJECTED" else None,
+                    "reviewed_by": admin_id,
+                    "reviewed_at": reviewed_at,
+                }
+                for r in accepted
+            ],
+        )
+        
+        # Candidate status (one UPDATE)
+        await connection.execute(
+            update(Candidate.__table__)
+            .where(Candidate.__table__.c.candidate_id.in_(accepted_ids))
+            .values(status=decision)
+        )
+        
+        nomination_ids = dict(
+            (
+                await connection.execute(
+                    select(Nomination.candidate_id, Nomination.nomination_id)
+                    .where(Nomination.candidate_id.in_(accepted_ids))
+                )
+            ).tuples().all()
+        )
+        
+        await record_reviews(db, [(r.election_id, decision, True) for r in accepted])
+        await db.commit()
+        
+        for r in accepted:
+            outcomes[r.candidate_id] = {
+                "candidate_id": r.candidate_id,
+                "status": decision,
+                "nomination_id": nomination_ids.get(r.candidate_id),
+            }
+    
+    succeeded = len(accepted)
+    return {
+        "decision": decision,
+        "requested": len(outcomes),
+        "succeeded": succeeded,
+        "skipped": len(outcomes) - succeeded,
+        "results": list(outcomes.values()),
+    }
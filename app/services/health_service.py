@@ -0,0 +1,113 @@
+import asyncio
+import time
+
+from sqlalchemy import text
+
+from app.core.cache import TTLCache
+from app.core.config import Config
+from app.core.cpu_executor import cpu_executor
+from app.core.database import engine, read_engine
+from app.core.email import email_queue, OTP_LANE, BULK_LANE
+from app.core.jobs import job_worker
+from app.tasks.scheduler import scheduler
+
+
+# Probes every few seconds from every kubelet share one check per window
+readiness_cache = TTLCache(maxsize=1, ttl=Config.HEALTH_CACHE_SECONDS)
+_readiness_lock = asyncio.Lock()
+
+
+def _scheduler_check(mark: float | None) -> dict:
+    age = None if mark is None else round(time.monotonic() - mark, 1)
+    return {
+        "ok": scheduler.running and age is not None and age <= Config.HEALTH_TICK_MAX_AGE_SECONDS,
+        "running": scheduler.running,
+        "age_seconds": age,
+    }
+
+
+# =========================================================
+# LIVENESS
+# =========================================================
+
+def check_liveness() -> dict:
+    """
+    In-memory only: the event loop answers and the scheduler still ticks.
+    Never touches the database, so an outage does not restart every pod.
+    """
+    checks = {"scheduler": _scheduler_check(job_worker.last_tick)}
+    return {"ok": all(c["ok"] for c in checks.values()), "checks": checks}
+
+
+# =========================================================
+# READINESS
+# =========================================================
+
+async def _database_check(target) -> dict:
+    """Free connection in the pool, then SELECT 1 within HEALTH_DB_TIMEOUT_SECONDS"""
+
+    pool = target.pool
+    limit = pool.size() + Config.DB_MAX_OVERFLOW
+    stats = {"in_use": pool.checkedout(), "limit": limit}
+    if stats["in_use"] >= limit:
+        return {"ok": False, "error": "Connection pool exhausted", **stats}
+
+    started = time.perf_counter()
+    try:
+        async with asyncio.timeout(Config.HEALTH_DB_TIMEOUT_SECONDS):
+            async with target.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+    except TimeoutError:
+        return {"ok": False, "error": "Timed out", **stats}
+    except Exception as exc:
+        return {"ok": False, "error": type(exc).__name__, **stats}
+
+    return {"ok": True, "latency_ms": round((time.perf_counter() - started) * 1000, 1), **stats}
+
+
+def _email_check() -> dict:
+    # Only the OTP lane blocks logins; bulk backlog is reported, not fatal
+    otp = email_queue.qsize(OTP_LANE)
+    return {
+        "ok": otp <= Config.HEALTH_OTP_BACKLOG_MAX,
+        "otp_backlog": otp,
+        "bulk_backlog": email_queue.qsize(BULK_LANE),
+    }
+
+
+def _warmup_check() -> dict:
+    # "warming" still serves (the first search waits for its worker);
+    # only a worker that failed to start takes the pod out
+    state = cpu_executor.warm_state()
+    return {"ok": state != "failed", "cpu_executor": state}
+
+
+async def _run_readiness_checks() -> dict:
+    checks = {"database": await _database_check(engine)}
+    if read_engine is not engine:
+        checks["read_database"] = await _database_check(read_engine)
+    checks["scheduler"] = _scheduler_check(job_worker.last_success)
+    checks["email"] = _email_check()
+    checks["warmup"] = _warmup_check()
+
+    return {"ok": all(c["ok"] for c in checks.values()), "checks": checks}
+
+
+async def check_readiness() -> dict:
+    """
+    Database reachable with a free connection, job worker polling it,
+    OTP email backlog bounded and CPU workers started. Cached for
+    HEALTH_CACHE_SECONDS (failures for up to 1 s); concurrent probes
+    wait for one check.
+    """
+    report = readiness_cache.get("ready")
+    if report is not None:
+        return report
+
+    async with _readiness_lock:
+        report = readiness_cache.get("ready")
+        if report is None:
+            report = await _run_readiness_checks()
+            # Recheck a failing pod sooner so it rejoins quickly
+            readiness_cache.set("ready", report, None if report["ok"] else min(1.0, Config.HEALTH_CACHE_SECONDS))
+    return report
@@ -0,0 +1,473 @@
+import csv
+import gzip
+import json
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Iterator
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import State, District, Assembly, Mandal, Village, Ward, Member
+
+
+# Rows validated and committed per transaction (also the checkpoint step)
+IMPORT_CHUNK_SIZE = 5000
+
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+# =========================================================
+# ENTITIES
+# =========================================================
+
+# Natural key of each geography level, outermost first
+HIERARCHY = [
+    (State, "state_code", State.state_code, State.state_id, None),
+    (District, "district_name", District.district_name, District.district_id, District.state_id),
+    (Assembly, "assembly_name", Assembly.assembly_name, Assembly.assembly_id, Assembly.district_id),
+    (Mandal, "mandal_name", Mandal.mandal_name, Mandal.mandal_id, Mandal.assembly_id),
+    (Village, "village_name", Village.village_name, Village.village_id, Village.mandal_id),
+    (Ward, "ward_number", Ward.ward_number, Ward.ward_id, Ward.village_id),
+]
+
+
+def _text(value) -> str | None:
+    value = str(value).strip() if value is not None else ""
+    return value or None
+
+
+def _int(value) -> int | None:
+    value = _text(value)
+    return int(value) if value is not None else None
+
+
+def _float(value) -> float | None:
+    value = _text(value)
+    return float(value) if value is not None else None
+
+
+def _bool(value) -> bool | None:
+    value = _text(value)
+    if value is None:
+        return None
+    if value.lower() in ("1", "true", "yes", "y"):
+        return True
+    if value.lower() in ("0", "false", "no", "n"):
+        return False
+    raise ValueError(f"not a boolean: {value!r}")
+
+
+@dataclass(frozen=True, eq=False)
+class ImportEntity:
+    model: type
+    depth: int                      # index in HIERARCHY of the parent level (-1: none)
+    parent_fk: str | None
+    conflict_columns: tuple         # unique key used by ON CONFLICT (SQLite/PostgreSQL)
+    fields: dict[str, Callable]     # input column → converter
+    required: tuple
+    # Other unique columns: a value owned by a different row rejects the
+    # row (MySQL's ON DUPLICATE KEY UPDATE would otherwise overwrite that row)
+    unique_columns: tuple = ()
+
+
+ENTITIES = {
+    "states": ImportEntity(
+        State, -1, None, ("state_code",),
+        {"state_code": _text, "state_name": _text, "capital": _text},
+        ("state_code", "state_name"),
+    ),
+    "districts": ImportEntity(
+        District, 0, "state_id", ("state_id", "district_name"),
+        {"district_name": _text, "district_code": _text, "headquarters": _text},
+        ("district_name",),
+    ),
+    "assemblies": ImportEntity(
+        Assembly, 1, "district_id", ("district_id", "assembly_name"),
+        {"assembly_name": _text, "assembly_code": _text, "assembly_type": _text},
+        ("assembly_name",),
+    ),
+    "mandals": ImportEntity(
+        Mandal, 2, "assembly_id", ("assembly_id", "mandal_name"),
+        {"mandal_name": _text, "mandal_code": _text},
+        ("mandal_name",),
+    ),
+    "villages": ImportEntity(
+        Village, 3, "mandal_id", ("mandal_id", "village_name"),
+        {
+            "village_name": _text, "village_code": _text, "postal_code": _text,
+            "population": _int, "area_sq_km": _float,
+        },
+        ("village_name",),
+    ),
+    "wards": ImportEntity(
+        Ward, 4, "village_id", ("village_id", "ward_number"),
+        {"ward_number": _int, "ward_name": _text, "is_active": _bool},
+        ("ward_number", "ward_name"),
+    ),
+    # Keyed by member_number; mobile and email must also be unique
+    "members": ImportEntity(
+        Member, 5, "ward_id", ("member_number",),
+        {
+            "member_number": _text, "name": _text, "mobile": _text, "email": _text,
+            "photo_url": _text, "is_active": _bool, "is_eligible_to_vote": _bool,
+        },
+        ("member_number", "name", "mobile", "email"),
+        ("mobile", "email"),
+    ),
+}
+
+
+def _parent_columns(entity: ImportEntity) -> list[str]:
+    """Input columns that identify the parent row (its natural key path)"""
+    return [name for _, name, _, _, _ in HIERARCHY[:entity.depth + 1]]
+
+
+async def load_parent_map(db: AsyncSession, depth: int) -> dict[tuple, int]:
+    """
+    {natural key path: id} for every row of HIERARCHY[depth], in one query.
+    E.g. depth 2 → {(state_code, district_name, assembly_name): assembly_id}.
+    """
+
+    levels = HIERARCHY[:depth + 1]
+    query = select(*[key for _, _, key, _, _ in levels], levels[-1][3]).select_from(levels[0][0])
+
+    for (model, _, _, _, fk), (_, _, _, parent_pk, _) in zip(levels[1:], levels):
+        query = query.join(model, fk == parent_pk)
+
+    rows = (await db.execute(query)).tuples().all()
+    return {tuple(row[:-1]): row[-1] for row in rows}
+
+
+# =========================================================
+# READERS
+# =========================================================
+
+def iter_rows(path: str) -> Iterator[dict]:
+    """Stream dict rows from .csv / .ndjson / .jsonl (optionally .gz) or .parquet"""
+
+    name = path[:-3] if path.endswith(".gz") else path
+    opener = gzip.open if path.endswith(".gz") else open
+
+    if name.endswith(".csv"):
+        with opener(path, "rt", encoding="utf-8", newline="") as f:
+            yield from csv.DictReader(f)
+
+    elif name.endswith((".ndjson", ".jsonl")):
+        with opener(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    elif name.endswith(".parquet"):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise ValueError("Parquet input needs pyarrow (pip install pyarrow)") from exc
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=IMPORT_CHUNK_SIZE):
+            yield from batch.to_pylist()
+
+    else:
+        raise ValueError(f"Unsupported input format: {path}")
+
+
+# =========================================================
+# UPSERT
+# =========================================================
+
+@lru_cache(maxsize=64)
+def upsert_statement(dialect: str, entity: ImportEntity, columns: tuple[str, ...]):
+    """
+    INSERT that updates rows whose unique key already exists. Executed
+    with a list of rows, so it compiles once and the driver batches it
+    (MySQL executemany becomes multi-row INSERT ... ON DUPLICATE KEY UPDATE).
+    """
+
+    table = entity.model.__table__
+    update_columns = [c for c in columns if c not in entity.conflict_columns]
+
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert
+        statement = insert(table)
+        return statement.on_duplicate_key_update({c: statement.inserted[c] for c in update_columns})
+
+    if dialect in ("sqlite", "postgresql"):
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert
+        statement = insert(table)
+        if not update_columns:
+            return statement.on_conflict_do_nothing(index_elements=list(entity.conflict_columns))
+        return statement.on_conflict_do_update(
+            index_elements=list(entity.conflict_columns),
+            set_={c: statement.excluded[c] for c in update_columns},
+        )
+
+    raise ValueError(f"Bulk import does not support the {dialect} dialect")
+
+
+# =========================================================
+# CHECKPOINT
+# =========================================================
+
+@dataclass
+class ImportStats:
+    entity: str
+    source: str
+    rows: int = 0
+    loaded: int = 0
+    rejected: int = 0
+    resumed_from: int = 0
+    started: float = field(default_factory=time.perf_counter)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    @property
+    def rows_per_second(self) -> float:
+        processed = self.rows - self.resumed_from
+        return processed / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "entity": self.entity,
+            "source": self.source,
+            "rows": self.rows,
+            "loaded": self.loaded,
+            "rejected": self.rejected,
+            "resumed_from": self.resumed_from,
+            "elapsed_s": round(self.elapsed, 2),
+            "rows_per_s": round(self.rows_per_second, 1),
+        }
+
+
+def _fingerprint(path: str) -> dict:
+    stat = os.stat(path)
+    return {"source": os.path.abspath(path), "size": stat.st_size, "mtime": stat.st_mtime}
+
+
+def _read_checkpoint(path: str, source: str, entity: str) -> int:
+    """Rows already committed by an earlier run of the same file, else 0"""
+    try:
+        with open(path) as f:
+            saved = json.load(f)
+    except (OSError, ValueError):
+        return 0
+
+    if saved.get("completed") or saved.get("entity") != entity:
+        return 0
+    if any(saved.get(k) != v for k, v in _fingerprint(source).items()):
+        return 0
+    return saved.get("rows_done", 0)
+
+
+def _write_checkpoint(path: str, source: str, stats: ImportStats, completed: bool = False):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump({
+            **_fingerprint(source),
+            "entity": stats.entity,
+            "rows_done": stats.rows,
+            "completed": completed,
+        }, f)
+    os.replace(tmp, path)
+
+
+# =========================================================
+# IMPORT
+# =========================================================
+
+def validate_record(
+    entity: ImportEntity,
+    raw: dict,
+    columns: list[str],
+    parents: dict[tuple, int],
+    parent_ids: set[int],
+) -> dict:
+    record = {}
+    for column in columns:
+        try:
+            record[column] = entity.fields[column](raw.get(column))
+        except ValueError as exc:
+            raise ValueError(f"{column}: {exc}")
+
+    missing = [column for column in entity.required if record.get(column) is None]
+    if missing:
+        raise ValueError(f"missing {', '.join(missing)}")
+
+    if entity.model is Member:
+        if not EMAIL_PATTERN.match(record["email"]):
+            raise ValueError("email: invalid")
+        if not record["mobile"].isdigit() or not 10 <= len(record["mobile"]) <= 15:
+            raise ValueError("mobile: expected 10-15 digits")
+
+    if entity.parent_fk:
+        if entity.model is Member and _text(raw.get("ward_id")):
+            parent_id = _int(raw["ward_id"])
+            if parent_id not in parent_ids:
+                raise ValueError(f"unknown ward_id {parent_id}")
+        else:
+            path = []
+            for column in _parent_columns(entity):
+                value = _text(raw.get(column))
+                path.append(_int(value) if column == "ward_number" else value)
+            parent_id = parents.get(tuple(path))
+            if parent_id is None:
+                raise ValueError(f"unknown parent {'/'.join(str(p) for p in path)}")
+        record[entity.parent_fk] = parent_id
+
+    return record
+
+
+async def _reject_taken(
+    db: AsyncSession,
+    entity: ImportEntity,
+    rows: list[tuple[int, dict, dict]],
+) -> tuple[list[tuple[int, dict, dict]], list[tuple[int, str, dict]]]:
+    """
+    Split (row number, record, raw) rows into those whose unique_columns
+    values are free or already theirs, and rejects (row number, reason, raw)
+    for values held by another row in the chunk or in the database.
+    """
+
+    table = entity.model.__table__
+
+    owners: dict[str, dict] = {}
+    for column in entity.unique_columns:
+        values = list({record[column] for _, record, _ in rows if record.get(column) is not None})
+        result = await db.execute(
+            select(table.c[column], *(table.c[c] for c in entity.conflict_columns))
+            .where(table.c[column].in_(values))
+        ) if values else []
+        owners[column] = {row[0]: tuple(row[1:]) for row in result}
+
+    accepted, rejected = [], []
+    for number, record, raw in rows:
+        key = tuple(record[c] for c in entity.conflict_columns)
+        taken = next(
+            (c for c in entity.unique_columns if owners[c].get(record.get(c), key) != key), None,
+        )
+        if taken:
+            owner = "/".join(str(k) for k in owners[taken][record[taken]])
+            rejected.append((number, f"{taken} already used by {owner}", raw))
+            continue
+        # Claimed for this key: later rows of the chunk cannot take it over
+        for column in entity.unique_columns:
+            if record.get(column) is not None:
+                owners[column][record[column]] = key
+        accepted.append((number, record, raw))
+
+    return accepted, rejected
+
+
+async def _load_chunk(
+    db: AsyncSession,
+    entity: ImportEntity,
+    rows: list[tuple[int, dict, dict]],
+) -> tuple[int, list[tuple[int, str, dict]]]:
+    """Upsert (row number, record, raw) rows and commit; returns (loaded, rejects)"""
+
+    # Later rows win when a key repeats inside the chunk
+    rows = list({tuple(r[c] for c in entity.conflict_columns): (n, r, raw) for n, r, raw in rows}.values())
+
+    rejected = []
+    if entity.unique_columns:
+        rows, rejected = await _reject_taken(db, entity, rows)
+
+    if rows:
+        unique = [record for _, record, _ in rows]
+        connection = await db.connection()
+        await connection.execute(upsert_statement(connection.dialect.name, entity, tuple(unique[0])), unique)
+
+    await db.commit()
+    return len(rows), rejected
+
+
+async def import_file(
+    db: AsyncSession,
+    entity_name: str,
+    path: str,
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+    resume: bool = True,
+    progress: Callable[[ImportStats], None] | None = None,
+) -> dict:
+    """
+    Stream `path` into `entity_name` with chunked validation and
+    multi-row upserts (INSERT ... ON DUPLICATE KEY UPDATE on MySQL).
+
+    Parent rows are resolved by their natural key path (state_code,
+    district_name, ..., ward_number) through one in-memory map; members
+    may give ward_id instead. Each chunk commits on its own and advances
+    `<path>.checkpoint.json`, so a rerun resumes after the last committed
+    chunk (a finished import starts over). Invalid rows, and members
+    whose mobile or email belongs to another member, go to
+    `<path>.rejects.csv` with the reason.
+    """
+
+    entity = ENTITIES[entity_name]
+    checkpoint = f"{path}.checkpoint.json"
+    rejects_path = f"{path}.rejects.csv"
+
+    stats = ImportStats(entity=entity_name, source=path)
+    skip = _read_checkpoint(checkpoint, path, entity_name) if resume else 0
+    stats.resumed_from = skip
+
+    parents = await load_parent_map(db, entity.depth) if entity.depth >= 0 else {}
+    parent_ids = set(parents.values())
+    # The parent map can be large (every ward for members); reads are over
+    await db.commit()
+
+    columns = None
+    records = []
+
+    async def load(rows):
+        loaded, rejected = await _load_chunk(db, entity, rows)
+        stats.loaded += loaded
+        stats.rejected += len(rejected)
+        for number, reason, raw in rejected:
+            rejects.writerow([number, reason, json.dumps(raw, default=str)])
+
+    with open(rejects_path, "a" if skip else "w", encoding="utf-8", newline="") as rejects_file:
+        rejects = csv.writer(rejects_file)
+        if not skip:
+            rejects.writerow(["row", "reason", "data"])
+
+        for number, raw in enumerate(iter_rows(path), start=1):
+            if number <= skip:
+                continue
+
+            if columns is None:
+                columns = [column for column in entity.fields if column in raw]
+
+            try:
+                records.append((number, validate_record(entity, raw, columns, parents, parent_ids), raw))
+            except ValueError as exc:
+                stats.rejected += 1
+                rejects.writerow([number, str(exc), json.dumps(raw, default=str)])
+
+            if number % chunk_size == 0:
+                if records:
+                    await load(records)
+                    records = []
+                stats.rows = number
+                _write_checkpoint(checkpoint, path, stats)
+                rejects_file.flush()
+                if progress:
+                    progress(stats)
+
+            stats.rows = number
+
+        if records:
+            await load(records)
+
+    stats.rows = max(stats.rows, skip)
+    _write_checkpoint(checkpoint, path, stats, completed=True)
+    if progress:
+        progress(stats)
+
+    return stats.as_dict()
@@ -1,6 +1,8 @@
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.models.models import Assembly, District
+from app.core.cache import TTLCache
+from app.core.config import Config
+from app.models.models import Assembly, District, Mandal, Village, Ward
 
 
 async def get_assemblies(db: AsyncSession):
@@ -28,3 +30,63 @@ async def get_districts(db: AsyncSession):
         }
         for d in districts
     ]
+
+
+# =========================================================
+# WARD LOCATION CACHE
+# =========================================================
+# Geography changes rarely (seeding/imports), so ward → location lookups
+# are cached per process and bounded by the TTL.
+
+ward_location_cache = TTLCache(
+    maxsize=Config.GEOGRAPHY_CACHE_MAX_SIZE,
+    ttl=Config.GEOGRAPHY_CACHE_TTL_SECONDS,
+)
+
+
+async def get_ward_locations(db: AsyncSession, ward_ids) -> dict[int, dict]:
+    """
+    Location names for each ward id, loading all cache misses with one
+    joined query. "location" is the "Ward 3, Village, Mandal, Assembly,
+    District" label used by list views.
+    """
+    locations, missing = {}, set()
+    for ward_id in set(ward_ids):
+        if ward_id is None:
+            continue
+        location = ward_location_cache.get(ward_id)
+        if location is None:
+            missing.add(ward_id)
+        else:
+            locations[ward_id] = location
+
+    if missing:
+        result = await db.execute(
+            select(
+                Ward.ward_id, Ward.ward_number, Village.village_name, Mandal.mandal_name,
+                Assembly.assembly_name, District.district_name,
+            )
+            .join(Village, Village.village_id == Ward.village_id)
+            .join(Mandal, Mandal.mandal_id == Village.mandal_id)
+            .join(Assembly, Assembly.assembly_id == Mandal.assembly_id)
+            .join(District, District.district_id == Assembly.district_id)
+            .where(Ward.ward_id.in_(missing))
+        )
+        for row in result:
+            location = {
+                "ward": row.ward_number,
+                "village": row.village_name,
+                "mandal": row.mandal_name,
+                "assembly": row.assembly_name,
+                "district": row.district_name,
+                "location": ", ".join(
+                    p for p in (
+                        f"Ward {row.ward_number}", row.village_name, row.mandal_name,
+                        row.assembly_name, row.district_name,
+                    ) if p
+                ),
+            }
+            ward_location_cache.set(row.ward_id, location)
+            locations[row.ward_id] = location
+
+    return locations
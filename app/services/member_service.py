@@ -7,7 +7,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.models.models import Member, Ward, Village, Mandal, Assembly
-from app.utils.nlp_search import rank_by_similarity
+from app.utils.nlp_search import search_index
+from collections import Counter
+
+from app.services.import_service import ENTITIES, upsert_statement, validate_record
 
 
 async def get_members(
@@ -155,7 +158,7 @@ async def search_members_service(db: AsyncSession, query: str):
         )
         documents.append(text)
 
-    ranked_indices = rank_by_similarity(query, documents)
+    ranked_indices = await search_index("members", query, documents)
 
     # ---------- RETURN FULL MEMBER DETAILS ----------
     return {
@@ -177,4 +180,158 @@ async def search_members_service(db: AsyncSession, query: str):
             }
             for i in ranked_indices
         ],
-    }
\ No newline at end of file
+    }
+
+# =========================================================
+# BULK UPSERT (membership system sync)
+# =========================================================
+
+MEMBER_COLUMNS = (
+    "member_number", "ward_id", "name", "mobile", "email",
+    "photo_url", "is_active", "is_eligible_to_vote",
+)
+MEMBER_DEFAULTS = {"photo_url": None, "is_active": True, "is_eligible_to_vote": False}
+
+
+async def bulk_upsert_members(db: AsyncSession, rows: list[dict]):
+    """
+    Create or update members keyed on member_number with set-based
+    statements, and report an outcome per input row:
+    created | updated | unchanged | rejected (with error).
+
+    Omitted optional fields keep their stored value. A mobile or email
+    held by another member is rejected, even when that member gives it
+    up in the same batch.
+    """
+
+    entity = ENTITIES["members"]
+    outcomes: list[dict | None] = [None] * len(rows)
+
+    def reject(index: int, row: dict, error: str):
+        outcomes[index] = {
+            "index": index, "member_number": row.get("member_number"), "status": "rejected", "error": error,
+        }
+
+    # =========================================================
+    # VALIDATE ROWS
+    # =========================================================
+    requested_wards = {
+        int(value)
+        for value in (str(row.get("ward_id", "")).strip() for row in rows)
+        if value.isdigit()
+    }
+    known_wards = set(
+        (await db.execute(select(Ward.ward_id).where(Ward.ward_id.in_(requested_wards)))).scalars()
+    ) if requested_wards else set()
+
+    records: dict[int, dict] = {}
+    seen: dict[str, dict[str, int]] = {"member_number": {}, "mobile": {}, "email": {}}
+
+    for index, row in enumerate(rows):
+        if row.get("ward_id") in (None, ""):
+            reject(index, row, "missing ward_id")
+            continue
+
+        try:
+            record = validate_record(entity, row, [c for c in entity.fields if c in row], {}, known_wards)
+        except ValueError as exc:
+            reject(index, row, str(exc))
+            continue
+
+        duplicate = next((key for key, values in seen.items() if record[key] in values), None)
+        if duplicate:
+            reject(index, row, f"duplicate {duplicate} (row {seen[duplicate][record[duplicate]]})")
+            continue
+
+        for key, values in seen.items():
+            values[record[key]] = index
+        records[index] = record
+
+    # =========================================================
+    # EXISTING MEMBERS AND UNIQUE-KEY OWNERS
+    # =========================================================
+    numbers = list(seen["member_number"])
+    existing = {}
+    if numbers:
+        result = await db.execute(
+            select(Member.member_id, *(getattr(Member, c) for c in MEMBER_COLUMNS))
+            .where(Member.member_number.in_(numbers))
+        )
+        existing = {row.member_number: row._asdict() for row in result}
+
+    owners = {"mobile": {}, "email": {}}
+    for key in owners:
+        values = list(seen[key])
+        if values:
+            column = getattr(Member, key)
+            result = await db.execute(select(column, Member.member_number).where(column.in_(values)))
+            owners[key] = dict(result.tuples().all())
+
+    # =========================================================
+    # CLASSIFY
+    # =========================================================
+    changes, created = [], []
+
+    for index, record in records.items():
+        number = record["member_number"]
+
+        taken = next(
+            (key for key in owners if owners[key].get(record[key], number) != number), None,
+        )
+        if taken:
+            reject(index, record, f"{taken} already used by member {owners[taken][record[taken]]}")
+            continue
+
+        current = existing.get(number)
+        base = {c: current[c] for c in MEMBER_COLUMNS} if current else dict(MEMBER_DEFAULTS)
+        merged = {
+            **base,
+            **{c: v for c, v in record.items() if v is not None or c == "photo_url"},
+        }
+
+        if current is None:
+            status = "created"
+            created.append(number)
+        elif merged == base:
+            status = "unchanged"
+        else:
+            status = "updated"
+
+        if status != "unchanged":
+            changes.append({c: merged[c] for c in MEMBER_COLUMNS})
+
+        outcomes[index] = {
+            "index": index,
+            "member_number": number,
+            "status": status,
+            "member_id": current["member_id"] if current else None,
+        }
+
+    # =========================================================
+    # UPSERT
+    # =========================================================
+    created_ids = {}
+    if changes:
+        connection = await db.connection()
+        await connection.execute(upsert_statement(connection.dialect.name, entity, MEMBER_COLUMNS), changes)
+
+        if created:
+            result = await db.execute(
+                select(Member.member_number, Member.member_id).where(Member.member_number.in_(created))
+            )
+            created_ids = dict(result.tuples().all())
+
+        await db.commit()
+
+    for outcome in outcomes:
+        if outcome["status"] == "created":
+            outcome["member_id"] = created_ids.get(outcome["member_number"])
+
+    counts = Counter(outcome["status"] for outcome in outcomes)
+    return {
+        "summary": {
+            "received": len(rows),
+            **{status: counts[status] for status in ("created", "updated", "unchanged", "rejected")},
+        },
+        "results": outcomes,
+    }
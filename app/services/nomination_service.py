@@ -15,19 +15,28 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timezone
 
+from sqlalchemy import insert, update, bindparam
+
 from app.models.models import Nomination, Candidate
+from app.services.nomination_stats_service import record_review, record_reviews
 IST = pytz.timezone("Asia/Kolkata")
 
+NOTIFY_BATCH_SIZE = 200
+
 
 
 async def create_nomination_notification(
     db: AsyncSession,
     event_id: int,
     admin_id: int,
+    progress=None,
 ):
     """
     Send professional Telugu nomination notification
     personalized with member name & ward.
+
+    progress: optional async callback(done, total), e.g. a background
+    job's JobContext.progress
     """
 
     # 1️⃣ Get event
@@ -108,10 +117,15 @@ async def create_nomination_notification(
 ఎన్నికల నిర్వహణ బృందం
 """
 
-        tasks.append(safe_send(member.email, subject, body))
+        tasks.append((member.email, subject, body))
 
-    results = await asyncio.gather(*tasks)
-    success_count = sum(results)
+    # Sent in batches so progress (and cancellation) is observed
+    success_count = 0
+    for start in range(0, len(tasks), NOTIFY_BATCH_SIZE):
+        batch = tasks[start:start + NOTIFY_BATCH_SIZE]
+        success_count += sum(await asyncio.gather(*(safe_send(*email) for email in batch)))
+        if progress:
+            await progress(min(start + NOTIFY_BATCH_SIZE, len(tasks)), len(tasks))
 
     # 7️⃣ Mark email sent
     notification.email_sent = True
@@ -133,161 +147,91 @@ from sqlalchemy import select, func
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from sqlalchemy.orm import joinedload
- 
-from app.models.models import Nomination, Member, Election, Ward, Village, Mandal, Assembly, District
+from app.models.models import Nomination, Member, Election
+from app.services.location_service import get_ward_locations
+from app.utils.pagination import after_cursor, keyset_order, page_of
  
  
-async def get_all_nominations(db: AsyncSession):
- 
-    # -------------------------------
+async def get_all_nominations(db: AsyncSession, limit: int = 50, cursor: str | None = None):
+    """
+    Nominations newest first, one page at a time.
 
-    # Total count
+    Keyset pagination on (applied_at, nomination_id): pass the returned
+    next_cursor to get the following page. Only the needed columns are
+    selected, and location labels come from the ward location cache.
+    """
 
     # -------------------------------
-
-    total_result = await db.execute(select(func.count(Nomination.nomination_id)))
-
-    total = total_result.scalar_one()
- 
+    # Total count (first page only)
     # -------------------------------
-
-    # Fetch nominations with FULL hierarchy
+    total = None
+    if cursor is None:
+        total = (await db.execute(select(func.count(Nomination.nomination_id)))).scalar_one()
 
     # -------------------------------
-
-    result = await db.execute(
-
-        select(Nomination)
-
-        .options(
-
-            joinedload(Nomination.member)
-
-                .joinedload(Member.ward)
-
-                .joinedload(Ward.village)
-
-                .joinedload(Village.mandal)
-
-                .joinedload(Mandal.assembly)
-
-                .joinedload(Assembly.district),
- 
-            joinedload(Nomination.election),
-
+    # Page of nominations (projected)
+    # -------------------------------
+    query = (
+        select(
+            Nomination.nomination_id, Nomination.candidate_id, Nomination.member_id,
+            Nomination.profile_photo_url, Nomination.bio, Nomination.status,
+            Nomination.applied_at, Nomination.reviewed_at, Nomination.reviewed_by,
+            Nomination.rejection_reason, Nomination.approval_notes, Nomination.election_id,
+            Member.name.label("member_name"), Member.mobile, Member.photo_url, Member.ward_id,
+            Election.title.label("election_title"), Election.status.label("election_status"),
         )
+        .outerjoin(Member, Member.member_id == Nomination.member_id)
+        .outerjoin(Election, Election.election_id == Nomination.election_id)
+        .order_by(*keyset_order(Nomination.applied_at, Nomination.nomination_id))
+        .limit(limit + 1)
+    )
+    if cursor:
+        query = query.where(after_cursor(Nomination.applied_at, Nomination.nomination_id, cursor))
 
-        .order_by(Nomination.applied_at.desc())
-
+    rows, next_cursor = page_of(
+        [row._asdict() for row in await db.execute(query)], limit, "applied_at", "nomination_id",
     )
- 
-    nominations = result.scalars().all()
- 
-    # -------------------------------
+    locations = await get_ward_locations(db, (row["ward_id"] for row in rows))
 
+    # -------------------------------
     # Response formatting
-
     # -------------------------------
-
-    response_items = []
- 
-    for n in nominations:
- 
-        # ⭐ Build location string safely
-
-        location = None
-
-        if n.member and n.member.ward:
-
-            ward = n.member.ward
-
-            village = ward.village
-
-            mandal = village.mandal if village else None
-
-            assembly = mandal.assembly if mandal else None
-
-            district = assembly.district if assembly else None
- 
-            parts = [
-
-                f"Ward {ward.ward_number}" if ward else None,
-
-                village.village_name if village else None,
-
-                mandal.mandal_name if mandal else None,
-
-                assembly.assembly_name if assembly else None,
-
-                district.district_name if district else None,
-
-            ]
- 
-            location = ", ".join([p for p in parts if p])
- 
-        response_items.append(
-
+    return {
+        "total": total,
+        "next_cursor": next_cursor,
+        "nominations": [
             {
+                "nomination_id": n["nomination_id"],
+                "candidate_id": n["candidate_id"],
 
-                "nomination_id": n.nomination_id,
-
-                "candidate_id": n.candidate_id,
- 
                 # Member
+                "member_name": n["member_name"],
+                "member_id": n["member_id"],
+                "mobile": n["mobile"],
+                "photo_url": n["photo_url"],
 
-                "member_name": n.member.name if n.member else None,
+                # Combined hierarchy location
+                "location": locations.get(n["ward_id"], {}).get("location"),
 
-                "member_id": n.member_id,
-
-                "mobile": n.member.mobile if n.member else None,
-
-                "photo_url": n.member.photo_url if n.member else None,
- 
-                # ⭐ NEW combined hierarchy location
-
-                "location": location,
- 
                 # Nomination
+                "profile_photo_url": n["profile_photo_url"],
+                "bio": n["bio"],
+                "status": n["status"],
+                "applied_at": n["applied_at"],
+                "reviewed_at": n["reviewed_at"],
+                "reviewed_by": n["reviewed_by"],
+                "rejection_reason": n["rejection_reason"],
+                "approval_notes": n["approval_notes"],
 
-                "profile_photo_url": n.profile_photo_url,
-
-                "bio": n.bio,
-
-                "status": n.status,
-
-                "applied_at": n.applied_at,
-
-                "reviewed_at": n.reviewed_at,
-
-                "reviewed_by": n.reviewed_by,
-
-                "rejection_reason": n.rejection_reason,
-
-                "approval_notes": n.approval_notes,
- 
                 # Election
-
                 "election": {
-
-                    "election_id": n.election.election_id,
-
-                    "title": n.election.title,
-
-                    "status": n.election.status,
-
-                } if n.election else None,
-
+                    "election_id": n["election_id"],
+                    "title": n["election_title"],
+                    "status": n["election_status"],
+                } if n["election_title"] is not None else None,
             }
-
-        )
- 
-    return {
-
-        "total": total,
-
-        "nominations": response_items,
-
+            for n in rows
+        ],
     }
  
 # ==============================
@@ -357,6 +301,8 @@ async def approve_nomination(db: AsyncSession, nomination_id: int, admin_id: int
     nomination.reviewed_by = admin_id
 
     nomination.reviewed_at = datetime.now(timezone.utc)
+
+    await record_review(db, nomination.election_id, "APPROVED", was_pending_candidate=False)
  
     await db.commit()
  
@@ -394,6 +340,168 @@ async def reject_nomination(
     nomination.reviewed_by = admin_id
     nomination.reviewed_at = datetime.now(timezone.utc)
 
+    await record_review(db, nomination.election_id, "REJECTED", was_pending_candidate=False)
+
     await db.commit()
 
-    return {"message": "Nomination rejected"}
\ No newline at end of file
+    return {"message": "Nomination rejected"}
+
+# ==============================
+# Bulk review (one transaction)
+# ==============================
+# Validate-and-write rounds before giving up on ids other reviews keep taking
+BULK_REVIEW_ATTEMPTS = 3
+
+
+async def bulk_review_nominations(
+    db: AsyncSession,
+    nomination_ids: list[int],
+    decision: str,
+    admin_id: int,
+    reason: str | None = None,
+):
+    """
+    Approve or reject many PENDING nominations with set-based statements
+    and a single commit. Same rules as approve_nomination /
+    reject_nomination; ids that fail them are reported, not raised.
+
+    The nominations are locked while validated and only updated while
+    still PENDING, so two overlapping bulk reviews cannot both apply
+    (and count) the same nomination.
+    """
+
+    nomination_ids = list(dict.fromkeys(nomination_ids))
+
+    for _ in range(BULK_REVIEW_ATTEMPTS):
+        outcomes = await _bulk_review_round(db, nomination_ids, decision, admin_id, reason)
+        if outcomes is not None:
+            return _bulk_review_response(decision, outcomes)
+
+    return _bulk_review_response(decision, {
+        nid: {"nomination_id": nid, "status": "skipped", "error": "Reviewed concurrently, retry"}
+        for nid in nomination_ids
+    })
+
+
+async def _bulk_review_round(
+    db: AsyncSession,
+    nomination_ids: list[int],
+    decision: str,
+    admin_id: int,
+    reason: str | None,
+) -> dict | None:
+    """Outcome per id, committed; None (rolled back) when another review won a row meanwhile"""
+
+    outcomes = {nid: {"nomination_id": nid, "status": "skipped", "error": "Nomination not found"} for nid in nomination_ids}
+
+    # -------------------------------
+    # Validate (one query per rule)
+    # -------------------------------
+    rows = (
+        await db.execute(
+            select(Nomination.nomination_id, Nomination.status, Nomination.election_id, Nomination.member_id)
+            .where(Nomination.nomination_id.in_(nomination_ids))
+            .with_for_update()
+        )
+    ).all()
+
+    accepted = []
+    for row in rows:
+        if row.status != "PENDING":
+            outcomes[row.nomination_id]["error"] = "Already reviewed"
+        else:
+            accepted.append(row)
+
+    if decision == "APPROVED" and accepted:
+        taken = set(
+            (
+                await db.execute(
+                    select(Candidate.election_id, Candidate.member_id).where(
+                        Candidate.election_id.in_({r.election_id for r in accepted}),
+                        Candidate.member_id.in_({r.member_id for r in accepted}),
+                    )
+                )
+            ).tuples()
+        )
+        approvable = []
+        for row in accepted:
+            key = (row.election_id, row.member_id)
+            if key in taken:
+                outcomes[row.nomination_id]["error"] = "Member already has an approved nomination for this election"
+            else:
+                taken.add(key)
+                approvable.append(row)
+        accepted = approvable
+
+    if not accepted:
+        await db.rollback()
+        return outcomes
+
+    # -------------------------------
+    # Write (multi-row statements)
+    # -------------------------------
+    reviewed_at = datetime.now(timezone.utc)
+    connection = await db.connection()
+    candidate_ids = {}
+
+    if decision == "APPROVED":
+        await connection.execute(
+            insert(Candidate.__table__),
+            [{"election_id": r.election_id, "member_id": r.member_id, "status": "APPROVED"} for r in accepted],
+        )
+        pairs = {(r.election_id, r.member_id) for r in accepted}
+        result = await connection.execute(
+            select(Candidate.candidate_id, Candidate.election_id, Candidate.member_id).where(
+                Candidate.election_id.in_({e for e, _ in pairs}),
+                Candidate.member_id.in_({m for _, m in pairs}),
+            )
+        )
+        candidate_ids = {(e, m): cid for cid, e, m in result.tuples() if (e, m) in pairs}
+
+    table = Nomination.__table__
+    result = await connection.execute(
+        update(table)
+        .where(table.c.nomination_id == bindparam("b_nomination_id"), table.c.status == "PENDING")
+        .values(
+            status=decision,
+            candidate_id=bindparam("b_candidate_id"),
+            rejection_reason=bindparam("b_reason"),
+            reviewed_by=admin_id,
+            reviewed_at=reviewed_at,
+        ),
+        [
+            {
+                "b_nomination_id": r.nomination_id,
+                "b_candidate_id": candidate_ids.get((r.election_id, r.member_id)),
+                "b_reason": reason if decision == "REJECTED" else None,
+            }
+            for r in accepted
+        ],
+    )
+
+    # Only without row locks (SQLite) can a row stop being PENDING after
+    # the locked read; start over so it is reported as already reviewed
+    if result.rowcount != len(accepted):
+        await db.rollback()
+        return None
+
+    await record_reviews(db, [(r.election_id, decision, False) for r in accepted])
+    await db.commit()
+
+    for r in accepted:
+        outcomes[r.nomination_id] = {"nomination_id": r.nomination_id, "status": decision}
+        if decision == "APPROVED":
+            outcomes[r.nomination_id]["candidate_id"] = candidate_ids.get((r.election_id, r.member_id))
+
+    return outcomes
+
+
+def _bulk_review_response(decision: str, outcomes: dict) -> dict:
+    succeeded = sum(1 for o in outcomes.values() if o["status"] == decision)
+    return {
+        "decision": decision,
+        "requested": len(outcomes),
+        "succeeded": succeeded,
+        "skipped": len(outcomes) - succeeded,
+        "results": list(outcomes.values()),
+    }
@@ -0,0 +1,205 @@
+from sqlalchemy import select, func, event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.models import Candidate, Nomination, Election, NominationStats
+
+
+# Counters are kept in step by deltas applied in the transaction that
+# changes the source rows (reviews, new PENDING candidates). Recounts
+# only fill elections without a counter row and repair drift.
+COUNTERS = ("pending", "approved", "rejected")
+
+
+def _upsert_stats(dialect: str, increment: bool = False):
+    """INSERT ... ON CONFLICT: overwrite the counters, or add to them"""
+
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert
+        statement = insert(NominationStats)
+        new = statement.inserted
+    else:
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert
+        statement = insert(NominationStats)
+        new = statement.excluded
+
+    values = {c: getattr(NominationStats, c) + new[c] if increment else new[c] for c in COUNTERS}
+    values["event_id"] = new.event_id
+
+    if dialect == "mysql":
+        return statement.on_duplicate_key_update(values)
+    return statement.on_conflict_do_update(index_elements=["election_id"], set_=values)
+
+
+# =========================================================
+# REBUILD FROM SOURCE TABLES
+# =========================================================
+
+async def rebuild_nomination_stats(
+    db: AsyncSession,
+    election_ids: list[int] | None = None,
+    missing_only: bool = False,
+) -> int:
+    """
+    Recount pending/approved/rejected per election (all elections, or
+    `election_ids`) and overwrite their counter rows. `missing_only`
+    skips elections that already have one. Does not commit.
+
+    The counter rows are locked first, so reviews committing meanwhile
+    wait instead of being overwritten by an older count; keep the scope
+    (election_ids) small on a busy database.
+
+    Same definitions as the original live counts:
+    pending  = PENDING candidates with no nomination record
+    approved = APPROVED nominations, rejected = REJECTED nominations
+    """
+
+    locked = select(NominationStats.election_id).with_for_update()
+    if election_ids is not None:
+        locked = locked.where(NominationStats.election_id.in_(election_ids))
+    existing = set((await db.execute(locked)).scalars())
+
+    elections = select(Election.election_id, Election.event_id)
+    pending = (
+        select(Candidate.election_id, func.count(Candidate.candidate_id))
+        .outerjoin(Nomination, Nomination.candidate_id == Candidate.candidate_id)
+        .where(Candidate.status == "PENDING", Nomination.nomination_id.is_(None))
+        .group_by(Candidate.election_id)
+    )
+    reviewed = (
+        select(Nomination.election_id, Nomination.status, func.count(Nomination.nomination_id))
+        .where(Nomination.status.in_(("APPROVED", "REJECTED")))
+        .group_by(Nomination.election_id, Nomination.status)
+    )
+
+    if election_ids is not None:
+        elections = elections.where(Election.election_id.in_(election_ids))
+        pending = pending.where(Candidate.election_id.in_(election_ids))
+        reviewed = reviewed.where(Nomination.election_id.in_(election_ids))
+
+    rows = {
+        election_id: {"election_id": election_id, "event_id": event_id, "pending": 0, "approved": 0, "rejected": 0}
+        for election_id, event_id in (await db.execute(elections)).tuples()
+        if not (missing_only and election_id in existing)
+    }
+    if not rows:
+        return 0
+    for election_id, count in (await db.execute(pending)).tuples():
+        if election_id in rows:
+            rows[election_id]["pending"] = count
+    for election_id, status, count in (await db.execute(reviewed)).tuples():
+        if election_id in rows:
+            rows[election_id][status.lower()] = count
+
+    connection = await db.connection()
+    await connection.execute(_upsert_stats(connection.dialect.name), list(rows.values()))
+
+    return len(rows)
+
+
+# =========================================================
+# INCREMENTAL UPDATES
+# =========================================================
+
+def _apply_deltas(session: Session, deltas: dict[int, dict[str, int]]):
+    """Add per-election deltas in one executemany upsert (sync; caller's transaction)"""
+
+    deltas = {election_id: d for election_id, d in deltas.items() if any(d.values())}
+    if not deltas:
+        return
+
+    connection = session.connection()
+    events = {
+        election_id: event_id
+        for election_id, event_id in connection.execute(
+            select(Election.election_id, Election.event_id).where(Election.election_id.in_(deltas))
+        )
+    }
+    connection.execute(
+        _upsert_stats(connection.dialect.name, increment=True),
+        [
+            {"election_id": election_id, "event_id": events.get(election_id), **delta}
+            for election_id, delta in deltas.items()
+            if election_id in events
+        ],
+    )
+
+
+async def record_review(db: AsyncSession, election_id: int, status: str, was_pending_candidate: bool):
+    """
+    Count one review decision (APPROVED | REJECTED) inside the caller's
+    transaction. `was_pending_candidate`: the review resolved a PENDING
+    candidate, so it also leaves the pending count.
+    """
+    await record_reviews(db, [(election_id, status, was_pending_candidate)])
+
+
+async def record_reviews(db: AsyncSession, decisions: list[tuple[int, str, bool]]):
+    """
+    Count many (election_id, status, was_pending_candidate) decisions
+    with one upsert, inside the caller's transaction.
+    """
+
+    deltas: dict[int, dict[str, int]] = {}
+    for election_id, status, was_pending_candidate in decisions:
+        delta = deltas.setdefault(election_id, dict.fromkeys(COUNTERS, 0))
+        delta["approved" if status == "APPROVED" else "rejected"] += 1
+        if was_pending_candidate:
+            delta["pending"] -= 1
+
+    await db.run_sync(_apply_deltas, deltas)
+
+
+@event.listens_for(Session, "after_flush")
+def _count_new_candidates(session: Session, flush_context):
+    """
+    New PENDING candidates enter the pending count in the flush that
+    inserts them, whichever code path adds them through the ORM (one
+    inserted together with its nomination is not pending). Review
+    decisions are counted explicitly by record_review(s).
+    """
+
+    nominated = {obj.candidate_id for obj in session.new if isinstance(obj, Nomination)}
+
+    deltas: dict[int, dict[str, int]] = {}
+    for obj in session.new:
+        if (
+            isinstance(obj, Candidate) and obj.status == "PENDING"
+            and obj.election_id is not None and obj.candidate_id not in nominated
+        ):
+            deltas.setdefault(obj.election_id, dict.fromkeys(COUNTERS, 0))["pending"] += 1
+
+    _apply_deltas(session, deltas)
+
+
+# =========================================================
+# READ
+# =========================================================
+
+async def read_nomination_stats(
+    db: AsyncSession,
+    election_id: int | None = None,
+    event_id: int | None = None,
+) -> dict:
+    query = select(
+        func.coalesce(func.sum(NominationStats.pending), 0),
+        func.coalesce(func.sum(NominationStats.approved), 0),
+        func.coalesce(func.sum(NominationStats.rejected), 0),
+    )
+    if election_id:
+        query = query.where(NominationStats.election_id == election_id)
+    if event_id:
+        query = query.where(NominationStats.event_id == event_id)
+
+    pending, approved, rejected = (await db.execute(query)).one()
+
+    return {
+        "pending": pending,
+        "approved": approved,
+        "rejected": rejected,
+        "total_reviewed": approved + rejected,
+        "total_applications": pending + approved + rejected,
+    }
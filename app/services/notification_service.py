@@ -76,10 +76,14 @@ async def create_notification_for_assembly(
     type: NotificationType,
     title: str,
     message: str,
+    progress=None,
 ):
     """
     Creates notification for ALL members in an assembly
     and sends email to each member.
+
+    progress: optional async callback(done, total), e.g. a background
+    job's JobContext.progress
     """
 
    
@@ -113,12 +117,12 @@ async def create_notification_for_assembly(
     )
 
     db.add(notification)
-    await db.flush()  # get notification_id
+    await db.commit()  # notification_id; nothing held open while mailing
 
    
     success_count = 0
 
-    for member, ward, village, mandal in rows:
+    for sent, (member, ward, village, mandal) in enumerate(rows, 1):
         email_body = f"""
 Dear {member.name},
 
@@ -146,7 +150,10 @@ Election Administration
             success_count += 1
         except Exception:
             # continue even if one email fails
-            continue
+            pass
+
+        if progress:
+            await progress(sent, len(rows))
 
     # --------------------------------------------------
     # 5️⃣ Update email status
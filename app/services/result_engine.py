@@ -0,0 +1,202 @@
+from collections import defaultdict
+from datetime import datetime
+
+from sqlalchemy import select, func, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import Election, ElectionEvent, Candidate, Vote
+
+
+# Elections claimed per transaction by the batch entry point
+RESULT_BATCH_SIZE = 200
+
+
+def _decide(counts: list[tuple[int, int]]) -> dict:
+    """Winner(s), totals and percentage from (candidate_id, votes) pairs"""
+
+    total_votes = sum(count for _, count in counts)
+    max_votes = max((count for _, count in counts), default=0)
+
+    winners = (
+        [candidate_id for candidate_id, count in counts if count == max_votes]
+        if total_votes
+        else []
+    )
+
+    return {
+        "total_votes": total_votes,
+        "max_votes": max_votes,
+        "winner_candidate_ids": winners,
+        "is_tie": len(winners) > 1,
+        "winner_percentage": round((max_votes / total_votes) * 100, 2) if total_votes else 0,
+    }
+
+
+async def _tally(db: AsyncSession, election_ids: list[int]) -> dict[int, list[tuple[int, int]]]:
+    """One grouped COUNT for all requested elections"""
+
+    rows = (
+        await db.execute(
+            select(Vote.election_id, Vote.candidate_id, func.count(Vote.vote_id))
+            .where(Vote.election_id.in_(election_ids))
+            .group_by(Vote.election_id, Vote.candidate_id)
+        )
+    ).all()
+
+    tallies = defaultdict(list)
+    for election_id, candidate_id, count in rows:
+        tallies[election_id].append((candidate_id, count))
+
+    return tallies
+
+
+async def _apply(
+    db: AsyncSession,
+    election_ids: list[int],
+    tallies: dict[int, list[tuple[int, int]]],
+) -> dict[int, dict]:
+    """
+    Write counts with one reset UPDATE plus executemany UPDATEs keyed by
+    primary key, instead of one UPDATE per candidate.
+    """
+
+    decisions = {election_id: _decide(tallies.get(election_id, [])) for election_id in election_ids}
+
+    await db.execute(
+        update(Candidate)
+        .where(Candidate.election_id.in_(election_ids))
+        .values(vote_count=0, is_winner=False)
+        .execution_options(synchronize_session=False)
+    )
+
+    candidate_rows = [
+        {
+            "candidate_id": candidate_id,
+            "vote_count": count,
+            "is_winner": candidate_id in decisions[election_id]["winner_candidate_ids"],
+        }
+        for election_id, counts in tallies.items()
+        for candidate_id, count in counts
+    ]
+
+    if candidate_rows:
+        await db.execute(update(Candidate), candidate_rows)
+
+    await db.execute(
+        update(Election),
+        [
+            {
+                "election_id": election_id,
+                "total_votes": decision["total_votes"],
+                "winner_percentage": decision["winner_percentage"],
+                "status": "COMPLETED",
+                "result_calculated": True,
+            }
+            for election_id, decision in decisions.items()
+        ],
+    )
+
+    return decisions
+
+
+# =========================================================
+# SINGLE ELECTION
+# =========================================================
+
+async def calculate_election_result(
+    db: AsyncSession,
+    election_id: int,
+    recalculate: bool = False,
+):
+    """
+    Calculate (or return the stored) result of one election.
+
+    Blocks on the election row lock, so a concurrent cron run finishes first
+    and its result is returned instead of being computed twice.
+    """
+
+    election = (
+        await db.execute(
+            select(Election)
+            .where(Election.election_id == election_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+    ).scalar_one_or_none()
+
+    if not election:
+        await db.rollback()
+        return {"error": "Election not found"}
+
+    if election.result_calculated and not recalculate:
+        stored = (
+            await db.execute(
+                select(Candidate.candidate_id, Candidate.vote_count)
+                .where(Candidate.election_id == election_id)
+            )
+        ).all()
+        await db.rollback()
+
+        return {
+            "message": "Result already calculated",
+            "election_id": election_id,
+            **_decide([(candidate_id, count or 0) for candidate_id, count in stored]),
+        }
+
+    tallies = await _tally(db, [election_id])
+    decision = (await _apply(db, [election_id], tallies))[election_id]
+
+    await db.commit()
+
+    return {
+        "message": "Winner calculated" if decision["total_votes"] else "No votes cast",
+        "election_id": election_id,
+        **decision,
+    }
+
+
+# =========================================================
+# BATCH (CRON)
+# =========================================================
+
+async def calculate_due_results(
+    db: AsyncSession,
+    now: datetime,
+    batch_size: int = RESULT_BATCH_SIZE,
+) -> int:
+    """
+    Calculate every election whose voting has ended and has no result yet.
+
+    Rows are claimed with FOR UPDATE SKIP LOCKED, so elections being
+    calculated elsewhere are left alone rather than waited on.
+    """
+
+    calculated = 0
+
+    while True:
+        election_ids = (
+            await db.execute(
+                select(Election.election_id)
+                .where(
+                    Election.event_id.in_(
+                        select(ElectionEvent.event_id).where(ElectionEvent.voting_end <= now)
+                    ),
+                    Election.result_calculated == False,
+                )
+                .order_by(Election.election_id)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            )
+        ).scalars().all()
+
+        if not election_ids:
+            await db.rollback()
+            break
+
+        tallies = await _tally(db, election_ids)
+        await _apply(db, election_ids, tallies)
+        await db.commit()
+
+        calculated += len(election_ids)
+
+    return calculated
@@ -1,33 +1,22 @@
 from datetime import datetime
 import pytz
-from sqlalchemy import select
- 
+
 from app.tasks.scheduler import scheduler
 from app.core.database import async_session_maker
-from app.models.models import Election, ElectionEvent
-from app.services.results import calculate_election_winner
+from app.core.metrics import timed_job
+from app.services.result_engine import calculate_due_results
  
 IST = pytz.timezone("Asia/Kolkata")
  
  
+@timed_job("result_job")
 async def auto_complete_and_calculate():
     async with async_session_maker() as db:
         now = datetime.now(IST).replace(tzinfo=None)
         print("RESULT CRON RUN AT:", now)
  
-        elections = (
-            await db.execute(
-                select(Election)
-                .join(ElectionEvent)
-                .where(
-                    ElectionEvent.voting_end <= now,
-                    Election.result_calculated == False,
-                )
-            )
-        ).scalars().all()
- 
-        for election in elections:
-            await calculate_election_winner(db, election.election_id)
+        calculated = await calculate_due_results(db, now)
+        print("RESULTS CALCULATED:", calculated)
  
  
 def start_result_scheduler():
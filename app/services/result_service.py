@@ -1,7 +1,12 @@
-from sqlalchemy import select, func, and_, delete, update
+from sqlalchemy import select, func, and_, delete, update, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 from typing import Optional
+import csv
+import io
+import json
+import time
+import zlib
 from pydantic import BaseModel
 
 from app.models.models import (
@@ -19,6 +24,52 @@ from app.models.models import (
     Ward,
     Admin,
 )
+from app.core.database import async_session_maker
+
+
+# Elections published per UPDATE / notification INSERT round trip.
+# Keeps the IN (...) list and the multi-row INSERT packet bounded
+# on state-wide publishes.
+PUBLISH_CHUNK_SIZE = 1000
+
+
+def _chunked(items: list, size: int):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+async def _publish_rows(db: AsyncSession, rows, now: datetime):
+    """
+    Set-based publish for already locked (election_id, admin_id, title) rows:
+    one UPDATE for the elections and one multi-row INSERT for notifications.
+    """
+    ids = [row.election_id for row in rows]
+
+    await db.execute(
+        update(Election)
+        .where(Election.election_id.in_(ids))
+        .values(result_published=True, result_published_at=now)
+        .execution_options(synchronize_session=False)
+    )
+
+    await db.execute(
+        insert(Notification),
+        [
+            {
+                "admin_id": row.admin_id,
+                "election_id": row.election_id,
+                "assembly_id": None,
+                "type": NotificationType.RESULT,
+                "title": "Election Result Published",
+                "message": f"Results for '{row.title}' are now live.",
+                "recipients_count": 0,
+                "email_sent": False,
+            }
+            for row in rows
+        ],
+    )
+
+    return ids
 
 
 # =========================================================
@@ -290,43 +341,46 @@ async def get_election_result_summary(db: AsyncSession, election_id: int):
 # =========================================================
 
 async def publish_results(db: AsyncSession, data: dict):
-    """Publish completed election results"""
+    """
+    Publish all completed election results.
 
-    elections = (
-        await db.execute(
-            select(Election).where(
-                Election.status == "COMPLETED",
-                Election.result_published == False,
+    MySQL has no UPDATE ... RETURNING, so each chunk locks the next batch of
+    unpublished ids with SELECT ... FOR UPDATE and publishes exactly those.
+    """
+
+    started = time.perf_counter()
+    now = datetime.utcnow()
+    published_ids = []
+
+    while True:
+        rows = (
+            await db.execute(
+                select(Election.election_id, Election.admin_id, Election.title)
+                .where(
+                    Election.status == "COMPLETED",
+                    Election.result_published == False,
+                )
+                .order_by(Election.election_id)
+                .limit(PUBLISH_CHUNK_SIZE)
+                .with_for_update()
             )
-        )
-    ).scalars().all()
+        ).all()
 
-    if not elections:
-        return {"message": "No completed elections to publish", "count": 0}
+        if not rows:
+            break
 
-    count = 0
-
-    for e in elections:
-        e.result_published = True
-        e.result_published_at = datetime.utcnow()
-
-        notification = Notification(
-            admin_id=e.admin_id,
-            election_id=e.election_id,
-            assembly_id=None,
-            type=NotificationType.RESULT,
-            title="Election Result Published",
-            message="Election results are now live.",
-            recipients_count=0,
-            email_sent=False,
-        )
+        published_ids.extend(await _publish_rows(db, rows, now))
 
-        db.add(notification)
-        count += 1
+    if not published_ids:
+        return {"message": "No completed elections to publish", "count": 0}
 
     await db.commit()
 
-    return {"message": "Results published", "count": count}
+    return {
+        "message": "Results published",
+        "count": len(published_ids),
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+    }
 
 
 # =========================================================
@@ -336,83 +390,38 @@ async def publish_results(db: AsyncSession, data: dict):
 async def unpublish_results(db: AsyncSession, data: dict):
     """Unpublish election results"""
 
-    elections = (
-        await db.execute(select(Election).where(Election.result_published == True))
-    ).scalars().all()
-
-    if not elections:
-        return {"message": "No published elections", "count": 0}
-
-    election_ids = [e.election_id for e in elections]
+    started = time.perf_counter()
 
-    for e in elections:
-        e.result_published = False
-        e.result_published_at = None
+    published = select(Election.election_id).where(Election.result_published == True)
 
     await db.execute(
-        delete(Notification).where(
-            Notification.election_id.in_(election_ids),
+        delete(Notification)
+        .where(
+            Notification.election_id.in_(published),
             Notification.type == NotificationType.RESULT,
         )
+        .execution_options(synchronize_session=False)
     )
 
-    await db.commit()
-
-    return {"message": "Results unpublished", "count": len(elections)}
-
-
-# =========================================================
-# PUBLIC SERVICE - CALCULATE WINNER
-# =========================================================
-
-async def calculate_election_winner(db: AsyncSession, election_id: int):
-    """Calculate and determine the winner of an election"""
-
-    election = await db.get(Election, election_id)
-    if not election:
-        return {"error": "Election not found"}
-
-    vote_counts = (
-        await db.execute(
-            select(Vote.candidate_id, func.count(Vote.vote_id))
-            .where(Vote.election_id == election_id)
-            .group_by(Vote.candidate_id)
-        )
-    ).all()
-
-    if not vote_counts:
-        return {"error": "No votes found"}
-
-    await db.execute(
-        update(Candidate)
-        .where(Candidate.election_id == election_id)
-        .values(vote_count=0, is_winner=False)
-    )
-
-    max_votes = max(count for _, count in vote_counts)
-    winners = []
-
-    for candidate_id, count in vote_counts:
-        is_winner = count == max_votes
-
+    count = (
         await db.execute(
-            update(Candidate)
-            .where(Candidate.candidate_id == candidate_id)
-            .values(vote_count=count, is_winner=is_winner)
+            update(Election)
+            .where(Election.result_published == True)
+            .values(result_published=False, result_published_at=None)
+            .execution_options(synchronize_session=False)
         )
+    ).rowcount
 
-        if is_winner:
-            winners.append(candidate_id)
-
-    election.status = "COMPLETED"
+    if not count:
+        await db.rollback()
+        return {"message": "No published elections", "count": 0}
 
     await db.commit()
 
     return {
-        "message": "Winner calculated",
-        "election_id": election_id,
-        "winner_candidate_ids": winners,
-        "max_votes": max_votes,
+        "message": "Results unpublished",
+        "count": count,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
     }
 
 
@@ -424,11 +433,9 @@ from sqlalchemy import select, func
 from collections import defaultdict
  
  
-async def admin_get_all_results(db: AsyncSession, admin_id: int, filters: AdminResultsFilterParams):
- 
-    # =========================================================
-    # 1️⃣ MAIN QUERY → WINNER DATA
-    # =========================================================
+def _admin_results_query(admin_id: int, filters: AdminResultsFilterParams):
+    """Winner rows for an admin's elections, shared by listing and export"""
+
     query = (
         select(
             Election.election_id,
@@ -473,6 +480,16 @@ async def admin_get_all_results(db: AsyncSession, admin_id: int, filters: AdminR
         query = query.where(Assembly.assembly_id == filters.assembly_id)
     if filters.election_level:
         query = query.where(Election.election_level == filters.election_level)
+
+    return query
+
+
+async def admin_get_all_results(db: AsyncSession, admin_id: int, filters: AdminResultsFilterParams):
+ 
+    # =========================================================
+    # 1️⃣ MAIN QUERY → WINNER DATA
+    # =========================================================
+    query = _admin_results_query(admin_id, filters)
  
     # =========================================================
     # 2️⃣ PAGINATION TOTAL
@@ -586,6 +603,94 @@ async def admin_get_all_results(db: AsyncSession, admin_id: int, filters: AdminR
             "pages": (total + filters.limit - 1) // filters.limit,
         },
     }
+# =========================================================
+# ADMIN SERVICE - STREAMING EXPORT
+# =========================================================
+
+# Rows fetched per round trip from the server-side cursor
+EXPORT_CHUNK_SIZE = 2000
+
+EXPORT_COLUMNS = [
+    "election_id",
+    "title",
+    "election_level",
+    "winner_name",
+    "winner_votes",
+    "total_votes",
+    "percentage",
+    "result_published",
+    "result_published_at",
+    "created_at",
+    "state_name",
+    "district_name",
+    "assembly_name",
+    "mandal_name",
+    "village_name",
+    "ward_number",
+]
+
+
+def _export_record(row) -> dict:
+    record = dict(zip(EXPORT_COLUMNS, row))
+    for key in ("result_published_at", "created_at"):
+        if record[key]:
+            record[key] = record[key].isoformat()
+    return record
+
+
+async def admin_export_results(
+    admin_id: int,
+    filters: AdminResultsFilterParams,
+    fmt: str = "csv",
+    compress: bool = False,
+    session_maker=async_session_maker,
+):
+    """
+    Stream every matching result as CSV or NDJSON (optionally gzipped).
+
+    Uses its own session and a server-side cursor so memory stays constant
+    regardless of how many results match.
+    """
+
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS) if compress else None
+
+    def encode(text: str) -> bytes:
+        data = text.encode("utf-8")
+        return compressor.compress(data) if compressor else data
+
+    query = _admin_results_query(admin_id, filters).execution_options(
+        yield_per=EXPORT_CHUNK_SIZE
+    )
+
+    async with session_maker() as db:
+        if fmt == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(EXPORT_COLUMNS)
+            yield encode(buffer.getvalue())
+
+        result = await db.stream(query)
+
+        async for rows in result.partitions():
+            buffer = io.StringIO()
+
+            if fmt == "csv":
+                writer = csv.writer(buffer)
+                for row in rows:
+                    writer.writerow(_export_record(row).values())
+            else:
+                for row in rows:
+                    buffer.write(json.dumps(_export_record(row), ensure_ascii=False))
+                    buffer.write("\n")
+
+            chunk = encode(buffer.getvalue())
+            if chunk:
+                yield chunk
+
+    if compressor:
+        yield compressor.flush()
+
+
 # =========================================================
 # ADMIN SERVICE - GET RESULTS BY DISTRICT
 # =========================================================
@@ -965,48 +1070,39 @@ async def admin_bulk_publish_results(
 ):
     """Admin publishes multiple election results at once"""
 
-    elections = (
-        await db.execute(
-            select(Election).where(
-                Election.election_id.in_(election_ids),
-                Election.admin_id == admin_id,
-                Election.status == "COMPLETED",
-                Election.result_published == False,
-            )
-        )
-    ).scalars().all()
-
-    if not elections:
-        return {"message": "No eligible elections to publish", "count": 0, "status": 200}
-
-    count = 0
+    started = time.perf_counter()
     now = datetime.utcnow()
+    published_ids = []
 
-    for election in elections:
-        election.result_published = True
-        election.result_published_at = now
-
-        notification = Notification(
-            admin_id=election.admin_id,
-            election_id=election.election_id,
-            assembly_id=None,
-            type=NotificationType.RESULT,
-            title="Election Result Published",
-            message=f"Results for '{election.title}' are now live.",
-            recipients_count=0,
-            email_sent=False,
-        )
+    for chunk in _chunked(list(dict.fromkeys(election_ids)), PUBLISH_CHUNK_SIZE):
+        rows = (
+            await db.execute(
+                select(Election.election_id, Election.admin_id, Election.title)
+                .where(
+                    Election.election_id.in_(chunk),
+                    Election.admin_id == admin_id,
+                    Election.status == "COMPLETED",
+                    Election.result_published == False,
+                )
+                .with_for_update()
+            )
+        ).all()
 
-        db.add(notification)
-        count += 1
+        if rows:
+            published_ids.extend(await _publish_rows(db, rows, now))
+
+    if not published_ids:
+        await db.rollback()
+        return {"message": "No eligible elections to publish", "count": 0, "status": 200}
 
     await db.commit()
 
     return {
         "message": "Results published successfully",
-        "count": count,
-        "published_ids": [e.election_id for e in elections],
+        "count": len(published_ids),
+        "published_ids": published_ids,
         "timestamp": now.isoformat(),
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
         "status": 200,
     }
 
@@ -0,0 +1,71 @@
+from app.core.config import Config
+from app.core.database import async_session_maker
+from app.core.jobs import JobContext, job_handler, job_worker
+from app.models.models import NotificationType
+from app.services.nomination_service import create_nomination_notification
+from app.services.notification_service import create_notification_for_assembly
+from app.services.result_engine import calculate_election_result
+from app.services.result_service import admin_bulk_publish_results
+from app.tasks.scheduler import scheduler
+
+
+# =========================================================
+# JOB KINDS
+# =========================================================
+# Handlers open their own session; the HTTP request that enqueued the
+# job has already returned 202.
+
+# Emails must not be sent twice, so fan-out jobs are never retried
+@job_handler("notification.assembly", concurrency=1, max_attempts=1)
+async def notify_assembly(ctx: JobContext, payload: dict):
+    async with async_session_maker() as db:
+        return await create_notification_for_assembly(
+            db=db,
+            admin_id=ctx.created_by,
+            assembly_id=payload["assembly_id"],
+            type=NotificationType(payload["type"]),
+            title=payload["title"],
+            message=payload["message"],
+            progress=ctx.progress,
+        )
+
+
+@job_handler("notification.nomination", concurrency=1, max_attempts=1)
+async def notify_nomination(ctx: JobContext, payload: dict):
+    async with async_session_maker() as db:
+        return await create_nomination_notification(
+            db=db,
+            event_id=payload["event_id"],
+            admin_id=ctx.created_by,
+            progress=ctx.progress,
+        )
+
+
+# Publishing only touches unpublished rows, so a retry is safe
+@job_handler("results.publish_bulk", concurrency=1)
+async def publish_bulk(ctx: JobContext, payload: dict):
+    async with async_session_maker() as db:
+        return await admin_bulk_publish_results(db, ctx.created_by, payload["election_ids"])
+
+
+@job_handler("results.calculate", concurrency=2)
+async def calculate_result(ctx: JobContext, payload: dict):
+    async with async_session_maker() as db:
+        return await calculate_election_result(db, payload["election_id"], payload.get("recalculate", False))
+
+
+# =========================================================
+# WORKER
+# =========================================================
+
+def start_job_worker():
+    job_worker.start()
+    scheduler.add_job(
+        job_worker.poll,
+        "interval",
+        seconds=Config.JOB_POLL_SECONDS,
+        id="job_worker",
+        replace_existing=True,
+        max_instances=1,
+        coalesce=True,
+    )
@@ -4,6 +4,7 @@ from sqlalchemy import update
  
 from app.models.models import Election, ElectionEvent
 from app.core.database import async_session_maker
+from app.core.metrics import timed_job
  
 IST = pytz.timezone("Asia/Kolkata")
  
@@ -58,6 +59,7 @@ async def update_election_status(db):
     await db.commit()
  
  
+@timed_job("status_job")
 async def run_status_update():
     async with async_session_maker() as db:
         await update_election_status(db)
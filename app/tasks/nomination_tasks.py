@@ -0,0 +1,39 @@
+from sqlalchemy import select
+
+from app.core.database import async_session_maker
+from app.core.metrics import timed_job
+from app.models.models import Election
+from app.services.nomination_stats_service import rebuild_nomination_stats
+
+
+# Elections recounted per transaction by the repair; each batch holds
+# its counter rows locked only while it counts
+REPAIR_BATCH = 500
+
+
+@timed_job("nomination_stats_backfill_job")
+async def run_nomination_stats_backfill():
+    """Counter rows for elections that have none yet (runs once at startup)"""
+    async with async_session_maker() as db:
+        elections = await rebuild_nomination_stats(db, missing_only=True)
+        await db.commit()
+        print("NOMINATION STATS BACKFILLED:", elections)
+
+
+@timed_job("nomination_stats_repair_job")
+async def run_nomination_stats_repair():
+    """
+    Recount every election in small locked batches to correct drift
+    (e.g. candidates written by something other than this app). The
+    counters do not depend on it: reviews and new candidates update
+    them in their own transactions.
+    """
+    async with async_session_maker() as db:
+        election_ids = list((await db.execute(select(Election.election_id).order_by(Election.election_id))).scalars())
+
+    for start in range(0, len(election_ids), REPAIR_BATCH):
+        async with async_session_maker() as db:
+            await rebuild_nomination_stats(db, election_ids[start:start + REPAIR_BATCH])
+            await db.commit()
+
+    print("NOMINATION STATS REPAIRED:", len(election_ids))
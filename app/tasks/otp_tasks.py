@@ -0,0 +1,10 @@
+from app.core.database import async_session_maker
+from app.core.metrics import timed_job
+from app.core.otp import otp_store
+
+
+@timed_job("otp_purge_job")
+async def run_otp_purge():
+    async with async_session_maker() as db:
+        purged = await otp_store.purge_expired(db)
+        print("OTP PURGE REMOVED:", purged)
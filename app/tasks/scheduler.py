@@ -1,16 +1,53 @@
+import fcntl
+import logging
+
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from app.tasks.election_tasks import update_election_status
+from app.core.config import Config
 from app.core.database import async_session_maker
+from app.core.metrics import timed_job
+
+logger = logging.getLogger(__name__)
 
 
 scheduler = AsyncIOScheduler()
 
+# Held open for the life of the process; the OS drops the lock on exit
+_scheduler_lock = None
 
+
+@timed_job("status_job")
 async def run_status_update():
     async with async_session_maker() as db:
         await update_election_status(db)
 
 
 def start_scheduler():
-    scheduler.add_job(run_status_update, "interval", minutes=1)
-    scheduler.start()
+    if not scheduler.running:
+        scheduler.start()
+
+
+def claim_scheduler_role() -> bool:
+    """
+    True in the one process per host that should run the periodic
+    maintenance jobs. With several web workers (scripts/serve.py) the
+    first to lock SCHEDULER_LOCK_FILE wins; RUN_SCHEDULER=false opts
+    the whole host out.
+    """
+    global _scheduler_lock
+
+    if not Config.RUN_SCHEDULER:
+        return False
+    if _scheduler_lock is not None:
+        return True
+
+    handle = open(Config.SCHEDULER_LOCK_FILE, "a")
+    try:
+        fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        handle.close()
+        return False
+
+    _scheduler_lock = handle
+    logger.info("This process runs the periodic scheduler jobs")
+    return True
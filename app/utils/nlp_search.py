@@ -1,20 +1,71 @@
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import hashlib
 
+from app.core.cpu_executor import cpu_executor
 
-def rank_by_similarity(query: str, documents: list[str], top_k: int = 10):
+# scikit-learn (and scipy under it) take over a second to import, so they
+# are imported inside the functions: app startup never pays for them,
+# only the CPU executor workers that actually rank.
+
+
+# =========================================================
+# CACHED INDEXES (run inside CPU executor workers)
+# =========================================================
+
+# name -> (fingerprint, fitted vectorizer, L2-normalised document matrix).
+# Module state, so each worker process keeps its own warm copy.
+_indexes: dict[str, tuple[str, object, object]] = {}
+
+
+def corpus_fingerprint(documents: list[str]) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for document in documents:
+        digest.update(document.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def rank_in_index(
+    name: str,
+    fingerprint: str,
+    query: str,
+    documents: list[str] | None,
+    top_k: int = 10,
+) -> list[int] | None:
     """
-    Returns indices of top similar documents using TF-IDF + cosine similarity
+    Rank against the `name` index, fitting it from `documents` only when
+    the fingerprint changed. Returns None when the index is missing or
+    stale and no documents were sent, so the caller can retry with them.
     """
-    if not documents:
-        return []
+    import numpy as np
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    cached = _indexes.get(name)
+    if cached is None or cached[0] != fingerprint:
+        if documents is None:
+            return None
+        vectorizer = TfidfVectorizer(stop_words="english")
+        cached = _indexes[name] = (fingerprint, vectorizer, vectorizer.fit_transform(documents))
 
-    vectorizer = TfidfVectorizer(stop_words="english")
+    _, vectorizer, matrix = cached
+    if matrix.shape[0] == 0:
+        return []
 
-    tfidf_matrix = vectorizer.fit_transform([query] + documents)
+    # Rows are L2-normalised, so the dot product is the cosine similarity
+    similarities = (matrix @ vectorizer.transform([query]).T).toarray().ravel()
+    return np.argsort(-similarities, kind="stable")[:top_k].tolist()
 
-    similarities = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:]).flatten()
 
-    ranked_indices = similarities.argsort()[::-1][:top_k]
+async def search_index(name: str, query: str, documents: list[str], top_k: int = 10) -> list[int]:
+    """
+    Indices of the top_k documents by TF-IDF cosine similarity, ranked on
+    the CPU executor against a per-worker cached index. The corpus is
+    only shipped to a worker whose copy is stale.
+    """
+    if not documents:
+        return []
 
-    return ranked_indices
\ No newline at end of file
+    fingerprint = corpus_fingerprint(documents)
+    ranked = await cpu_executor.run(rank_in_index, name, fingerprint, query, None, top_k)
+    if ranked is None:
+        ranked = await cpu_executor.run(rank_in_index, name, fingerprint, query, documents, top_k)
+    return ranked
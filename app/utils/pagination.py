@@ -0,0 +1,77 @@
+import base64
+import json
+from datetime import datetime
+
+from sqlalchemy import DateTime, and_, func, literal, or_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+
+# =========================================================
+# KEYSET (CURSOR) PAGINATION
+# =========================================================
+# Pages are ordered by (sort_column DESC, id DESC). The cursor is the
+# opaque (sort value, id) of the last row served; the next page is
+# every row strictly after it, which an index on (sort_column, id)
+# serves without OFFSET scans.
+
+
+class sort_key(FunctionElement):
+    """
+    A timestamp as keyset pages compare it. SQLite keeps DATETIME as
+    text, and server_default rows ("YYYY-MM-DD HH:MM:SS") would never
+    equal a bound cursor ("...SS.000000"), so there both sides go
+    through strftime; other databases compare the column itself.
+    """
+
+    type = DateTime()
+    name = "sort_key"
+    inherit_cache = True
+
+
+@compiles(sort_key)
+def _sort_key(element, compiler, **kw):
+    return compiler.process(element.clauses, **kw)
+
+
+@compiles(sort_key, "sqlite")
+def _sort_key_sqlite(element, compiler, **kw):
+    return compiler.process(func.strftime("%Y-%m-%d %H:%M:%f", *element.clauses.clauses), **kw)
+
+
+def encode_cursor(sort_value: datetime, row_id: int) -> str:
+    raw = json.dumps([sort_value.isoformat(), row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sort_value, row_id = json.loads(raw)
+        return datetime.fromisoformat(sort_value), int(row_id)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+
+
+def keyset_order(sort_column, id_column) -> tuple:
+    """ORDER BY for keyset pages; pair it with after_cursor on the same columns"""
+    return sort_key(sort_column).desc(), id_column.desc()
+
+
+def after_cursor(sort_column, id_column, cursor: str):
+    """WHERE clause for the rows following `cursor` in descending order"""
+    sort_value, row_id = decode_cursor(cursor)
+    column, value = sort_key(sort_column), sort_key(literal(sort_value, DateTime()))
+    return or_(column < value, and_(column == value, id_column < row_id))
+
+
+def page_of(rows: list, limit: int, sort_key: str, id_key: str) -> tuple[list, str | None]:
+    """
+    Trim rows fetched with LIMIT limit + 1 to one page and return the
+    cursor for the next page (None on the last page).
+    """
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(last[sort_key], last[id_key])
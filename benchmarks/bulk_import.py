@@ -0,0 +1,117 @@
+"""
+Throughput of the bulk import pipeline.
+
+    python -m benchmarks.bulk_import --members 1000000
+    python -m benchmarks.bulk_import --members 200000 --database-url sqlite+aiosqlite:///import.db
+
+Writes one state of geography (--villages villages, 4 wards each) and
+--members members as CSV files into --workdir, then times each level
+through import_service.import_file and reports rows/s.
+"""
+
+import argparse
+import asyncio
+import csv
+import os
+import time
+
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+from app.core.database import DATABASE_URL
+from app.services.import_service import import_file
+from benchmarks.fixtures import create_schema
+
+
+WARDS_PER_VILLAGE = 4
+
+
+def write_csv(path: str, header: list[str], rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def write_inputs(workdir: str, villages: int, members: int, state_code: str) -> dict[str, str]:
+    os.makedirs(workdir, exist_ok=True)
+    path = {level: os.path.join(workdir, f"{level}.csv") for level in (
+        "states", "districts", "assemblies", "mandals", "villages", "wards", "members",
+    )}
+
+    # 10 districts × 5 assemblies × 4 mandals, villages spread evenly
+    district = lambda v: f"District {v % 10}"
+    assembly = lambda v: f"Assembly {v % 50}"
+    mandal = lambda v: f"Mandal {v % 200}"
+
+    write_csv(path["states"], ["state_code", "state_name"], [(state_code, f"Import State {state_code}")])
+    write_csv(path["districts"], ["state_code", "district_name"], [(state_code, f"District {d}") for d in range(10)])
+    write_csv(
+        path["assemblies"], ["state_code", "district_name", "assembly_name"],
+        [(state_code, district(a), f"Assembly {a}") for a in range(50)],
+    )
+    write_csv(
+        path["mandals"], ["state_code", "district_name", "assembly_name", "mandal_name"],
+        [(state_code, district(m), assembly(m), f"Mandal {m}") for m in range(200)],
+    )
+    write_csv(
+        path["villages"], ["state_code", "district_name", "assembly_name", "mandal_name", "village_name"],
+        [(state_code, district(v), assembly(v), mandal(v), f"Village {v}") for v in range(villages)],
+    )
+
+    key = ["state_code", "district_name", "assembly_name", "mandal_name", "village_name"]
+    write_csv(
+        path["wards"], key + ["ward_number", "ward_name"],
+        [
+            (state_code, district(v), assembly(v), mandal(v), f"Village {v}", w, f"Ward {w}")
+            for v in range(villages)
+            for w in range(1, WARDS_PER_VILLAGE + 1)
+        ],
+    )
+
+    wards = villages * WARDS_PER_VILLAGE
+    write_csv(
+        path["members"], key + ["ward_number", "member_number", "name", "mobile", "email", "is_eligible_to_vote"],
+        (
+            (
+                state_code, district(i % villages), assembly(i % villages), mandal(i % villages),
+                f"Village {i % villages}", i // villages % WARDS_PER_VILLAGE + 1,
+                f"{state_code}{i:09d}", f"Member {i}", f"8{i:010d}", f"{state_code.lower()}{i}@example.com", "true",
+            )
+            for i in range(members)
+        ),
+    )
+
+    print(f"inputs: {villages} villages, {wards} wards, {members} members in {workdir}")
+    return path
+
+
+async def main(args):
+    path = write_inputs(args.workdir, args.villages, args.members, args.state_code)
+
+    engine = create_async_engine(args.database_url)
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await create_schema(conn)
+
+    for level in ("states", "districts", "assemblies", "mandals", "villages", "wards", "members"):
+        started = time.perf_counter()
+        async with session_maker() as db:
+            summary = await import_file(db, level, path[level], chunk_size=args.chunk_size, resume=False)
+        elapsed = time.perf_counter() - started
+        print(
+            f"{level:11} {summary['rows']:>9} rows  {summary['rejected']:>5} rejected  "
+            f"{elapsed:8.2f}s  {summary['rows'] / elapsed if elapsed else 0:>10,.0f} rows/s"
+        )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=DATABASE_URL)
+    parser.add_argument("--members", type=int, default=1_000_000)
+    parser.add_argument("--villages", type=int, default=10_000)
+    parser.add_argument("--state-code", default="ZZ")
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--workdir", default="bench/import")
+    asyncio.run(main(parser.parse_args()))
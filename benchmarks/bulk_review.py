@@ -0,0 +1,116 @@
+"""
+Bulk vs one-at-a-time nomination review.
+
+    python -m benchmarks.bulk_review --decisions 1000
+    python -m benchmarks.bulk_review --decisions 1000 --database-url sqlite+aiosqlite:///bench.db
+
+Seeds one election with --decisions PENDING nominations and --decisions
+PENDING candidates per path, then times:
+- approve_nomination / approve_candidate called once per id (--single ids)
+- bulk_review_nominations / bulk_review_candidates over all ids
+and checks the maintained nomination_stats against a full recount.
+"""
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+from app.core.database import DATABASE_URL
+from app.models.models import Candidate, Nomination
+from app.services.candidate_service import approve_candidate, bulk_review_candidates
+from app.services.nomination_service import approve_nomination, bulk_review_nominations
+from app.services.nomination_stats_service import read_nomination_stats, rebuild_nomination_stats
+from benchmarks.fixtures import create_schema, seed_admin, seed_election, seed_members, seed_ward
+
+
+async def seed_pending(conn, election_id: int, ward_id: int, count: int) -> tuple[list[int], list[int]]:
+    """`count` PENDING nominations and `count` PENDING candidates for fresh members"""
+
+    first = await seed_members(conn, ward_id, count * 2)
+    await conn.execute(insert(Nomination), [
+        {"election_id": election_id, "member_id": first + i, "status": "PENDING"} for i in range(count)
+    ])
+    await conn.execute(insert(Candidate), [
+        {"election_id": election_id, "member_id": first + count + i, "status": "PENDING"} for i in range(count)
+    ])
+
+    nominations = (await conn.execute(
+        select(Nomination.nomination_id).where(
+            Nomination.election_id == election_id, Nomination.status == "PENDING",
+            Nomination.member_id >= first,
+        )
+    )).scalars().all()
+    candidates = (await conn.execute(
+        select(Candidate.candidate_id).where(
+            Candidate.election_id == election_id, Candidate.status == "PENDING",
+            Candidate.member_id >= first,
+        )
+    )).scalars().all()
+    return list(nominations), list(candidates)
+
+
+def report(label: str, count: int, elapsed: float):
+    print(f"{label:34} {count:>6} ids  {elapsed * 1000:9.1f} ms  {elapsed / count * 1000:7.2f} ms/id")
+
+
+async def main(args):
+    engine = create_async_engine(args.database_url)
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await create_schema(conn)
+        ward_id = await seed_ward(conn)
+        admin_id = await seed_admin(conn)
+        election_id = await seed_election(conn, votes=0, candidates=1, ward_id=ward_id, admin_id=admin_id)
+        single_nominations, single_candidates = await seed_pending(conn, election_id, ward_id, args.single)
+        bulk_nominations, bulk_candidates = await seed_pending(conn, election_id, ward_id, args.decisions)
+
+    async with session_maker() as db:
+        await rebuild_nomination_stats(db, [election_id])
+        await db.commit()
+
+    # One id per call (each call is what one HTTP request did)
+    started = time.perf_counter()
+    for nomination_id in single_nominations:
+        async with session_maker() as db:
+            await approve_nomination(db, nomination_id, admin_id)
+    report("approve_nomination (per id)", len(single_nominations), time.perf_counter() - started)
+
+    started = time.perf_counter()
+    for candidate_id in single_candidates:
+        async with session_maker() as db:
+            await approve_candidate(db, candidate_id, admin_id)
+    report("approve_candidate (per id)", len(single_candidates), time.perf_counter() - started)
+
+    # One transaction for the whole list
+    async with session_maker() as db:
+        started = time.perf_counter()
+        summary = await bulk_review_nominations(db, bulk_nominations, "APPROVED", admin_id)
+        report("bulk_review_nominations", len(bulk_nominations), time.perf_counter() - started)
+        assert summary["succeeded"] == len(bulk_nominations), summary["results"][:3]
+
+    async with session_maker() as db:
+        started = time.perf_counter()
+        summary = await bulk_review_candidates(db, bulk_candidates, "REJECTED", admin_id, "bulk benchmark")
+        report("bulk_review_candidates", len(bulk_candidates), time.perf_counter() - started)
+        assert summary["succeeded"] == len(bulk_candidates), summary["results"][:3]
+
+    async with session_maker() as db:
+        maintained = await read_nomination_stats(db, election_id)
+        await rebuild_nomination_stats(db, [election_id])
+        recounted = await read_nomination_stats(db, election_id)
+        await db.rollback()
+    print(f"nomination_stats {'match' if maintained == recounted else 'DRIFT'}: {maintained}")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=DATABASE_URL)
+    parser.add_argument("--decisions", type=int, default=1000)
+    parser.add_argument("--single", type=int, default=200, help="ids reviewed one call at a time")
+    asyncio.run(main(parser.parse_args()))
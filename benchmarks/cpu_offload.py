@@ -0,0 +1,116 @@
+"""
+Event-loop stall of TF-IDF search: inline vs the CPU executor.
+
+    python -m benchmarks.cpu_offload --documents 50000 --searches 20
+    python -m benchmarks.cpu_offload --documents 50000 --workers 4
+
+Builds a synthetic member-search corpus, then runs --searches queries
+(--concurrency at a time) while a probe coroutine measures how late the
+event loop wakes it up every 10 ms:
+- inline:   rank_in_index called on the event loop (cached index)
+- executor: search_index through cpu_executor (cached per-worker index)
+and checks the executor puts first a document with the best score of a
+TF-IDF fit over query + corpus (equal scores may be ordered differently).
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+
+
+NAMES = ["Ravi", "Lakshmi", "Suresh", "Padma", "Kiran", "Anitha", "Venkat", "Sravani", "Mahesh", "Divya"]
+PLACES = ["Narsapuram", "Bhimavaram", "Palakollu", "Tanuku", "Eluru", "Nidadavole", "Undi", "Achanta"]
+
+
+def corpus(count: int, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    return [
+        f"{rng.choice(NAMES)} {rng.choice(NAMES)}{i} Ward {rng.randint(1, 30)} "
+        f"{rng.choice(PLACES)} {rng.choice(PLACES)} Mandal {rng.choice(PLACES)} Assembly West Godavari"
+        for i in range(count)
+    ]
+
+
+async def probe(stop: asyncio.Event, lags: list[float], interval: float = 0.01):
+    while not stop.is_set():
+        expected = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, time.perf_counter() - expected))
+
+
+async def timed(label: str, search, queries: list[str], concurrency: int) -> list:
+    lags: list[float] = []
+    stop = asyncio.Event()
+    prober = asyncio.create_task(probe(stop, lags))
+    limit = asyncio.Semaphore(concurrency)
+
+    async def one(query):
+        async with limit:
+            return await search(query)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(one(q) for q in queries))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await prober
+
+    lags.sort()
+    worst = lags[-1] if lags else 0.0
+    p99 = lags[int(len(lags) * 0.99)] if lags else 0.0
+    print(
+        f"{label:9} {len(queries):>4} searches  {elapsed:7.2f} s  "
+        f"loop lag p99 {p99 * 1000:8.1f} ms  max {worst * 1000:8.1f} ms"
+    )
+    return results
+
+
+def has_best_score(query: str, documents: list[str], index: int) -> bool:
+    """documents[index] scores highest under a TF-IDF fit over query + corpus"""
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    matrix = TfidfVectorizer(stop_words="english").fit_transform([query] + documents)
+    scores = cosine_similarity(matrix[0:1], matrix[1:]).ravel()
+    return abs(scores.max() - scores[index]) < 1e-9
+
+
+async def main(args):
+    from app.core.cpu_executor import cpu_executor
+    from app.utils.nlp_search import corpus_fingerprint, rank_in_index, search_index
+
+    documents = corpus(args.documents)
+    rng = random.Random(1)
+    queries = [f"{rng.choice(NAMES)} {rng.choice(PLACES)}" for _ in range(args.searches)]
+
+    fingerprint = corpus_fingerprint(documents)
+
+    async def inline(query):
+        return rank_in_index("inline", fingerprint, query, documents)
+
+    async def offloaded(query):
+        return await search_index("benchmark", query, documents)
+
+    started = time.perf_counter()
+    await asyncio.gather(*map(asyncio.wrap_future, cpu_executor.start()))
+    print(f"executor start ({cpu_executor.workers} workers): {time.perf_counter() - started:.2f} s")
+
+    await timed("inline", inline, queries, args.concurrency)
+    ranked = await timed("executor", offloaded, queries, args.concurrency)
+    await cpu_executor.stop()
+
+    best = sum(has_best_score(query, documents, r[0]) for query, r in zip(queries, ranked))
+    print(f"best score first for {best}/{len(queries)} queries")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=50000)
+    parser.add_argument("--searches", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=2, help="CPU_WORKERS for the executor run")
+    args = parser.parse_args()
+    os.environ["CPU_WORKERS"] = str(args.workers)
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+    asyncio.run(main(args))
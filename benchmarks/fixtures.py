@@ -0,0 +1,215 @@
+import random
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert, select, func
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.models.models import (
+    Base, State, District, Assembly, Mandal, Village, Ward,
+    Admin, Member, ElectionEvent, Election, Candidate, Vote,
+)
+
+
+# Rows per executemany batch; the MySQL driver rewrites each batch into
+# a multi-row INSERT
+INSERT_BATCH = 10_000
+
+
+async def create_schema(conn: AsyncConnection):
+    await conn.run_sync(Base.metadata.create_all)
+
+
+async def next_id(conn: AsyncConnection, column) -> int:
+    return ((await conn.execute(select(func.max(column)))).scalar() or 0) + 1
+
+
+async def insert_batched(conn: AsyncConnection, model, rows):
+    """Insert an iterable of dicts in INSERT_BATCH sized executemany calls"""
+
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= INSERT_BATCH:
+            await conn.execute(insert(model), batch)
+            batch = []
+
+    if batch:
+        await conn.execute(insert(model), batch)
+
+
+def _code(number: int) -> str:
+    digits = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    return digits[number // 36 % 36] + digits[number % 36]
+
+
+async def seed_ward(conn: AsyncConnection) -> int:
+    """One state → district → assembly → mandal → village → ward chain"""
+
+    state_id = await next_id(conn, State.state_id)
+    await conn.execute(insert(State).values(
+        state_id=state_id, state_code=_code(state_id), state_name=f"Bench State {state_id}",
+    ))
+    district_id = await next_id(conn, District.district_id)
+    await conn.execute(insert(District).values(
+        district_id=district_id, state_id=state_id, district_name=f"Bench District {district_id}",
+    ))
+    assembly_id = await next_id(conn, Assembly.assembly_id)
+    await conn.execute(insert(Assembly).values(
+        assembly_id=assembly_id, district_id=district_id, assembly_name=f"Bench Assembly {assembly_id}",
+    ))
+    mandal_id = await next_id(conn, Mandal.mandal_id)
+    await conn.execute(insert(Mandal).values(
+        mandal_id=mandal_id, assembly_id=assembly_id, mandal_name=f"Bench Mandal {mandal_id}",
+    ))
+    village_id = await next_id(conn, Village.village_id)
+    await conn.execute(insert(Village).values(
+        village_id=village_id, mandal_id=mandal_id, village_name=f"Bench Village {village_id}",
+    ))
+    ward_id = await next_id(conn, Ward.ward_id)
+    await conn.execute(insert(Ward).values(
+        ward_id=ward_id, village_id=village_id, ward_number=1, ward_name=f"Bench Ward {ward_id}",
+    ))
+
+    return ward_id
+
+
+async def seed_admin(conn: AsyncConnection) -> int:
+    admin_id = await next_id(conn, Admin.admin_id)
+    await conn.execute(insert(Admin).values(
+        admin_id=admin_id,
+        admin_level="APP",
+        name="Bench Admin",
+        mobile=f"7{admin_id:011d}",
+        email=f"bench-admin-{admin_id}@example.com",
+        password_hash="-",
+    ))
+    return admin_id
+
+
+async def seed_members(conn: AsyncConnection, ward_id: int, count: int) -> int:
+    """`count` eligible members in a ward; returns the first member_id"""
+
+    first_member = await next_id(conn, Member.member_id)
+    await insert_batched(conn, Member, (
+        {
+            "member_id": member_id,
+            "ward_id": ward_id,
+            "member_number": f"BM{member_id}",
+            "name": f"Voter {member_id}",
+            "mobile": f"9{member_id:011d}",
+            "email": f"voter-{member_id}@example.com",
+            "is_eligible_to_vote": True,
+        }
+        for member_id in range(first_member, first_member + count)
+    ))
+    return first_member
+
+
+async def seed_election(
+    conn: AsyncConnection,
+    votes: int,
+    candidates: int = 5,
+    seed: int = 7,
+    ward_id: int | None = None,
+    admin_id: int | None = None,
+) -> int:
+    """
+    A completed ward election with `votes` distinct voters spread randomly
+    over `candidates` candidates. Returns the election_id.
+    """
+
+    rng = random.Random(seed)
+    ward_id = ward_id or await seed_ward(conn)
+    admin_id = admin_id or await seed_admin(conn)
+
+    now = datetime.utcnow()
+    event_id = await next_id(conn, ElectionEvent.event_id)
+    await conn.execute(insert(ElectionEvent).values(
+        event_id=event_id,
+        title=f"Bench Event {event_id}",
+        nomination_start=now - timedelta(days=4),
+        nomination_end=now - timedelta(days=3),
+        voting_start=now - timedelta(days=2),
+        voting_end=now - timedelta(days=1),
+    ))
+
+    election_id = await next_id(conn, Election.election_id)
+    await conn.execute(insert(Election).values(
+        election_id=election_id,
+        event_id=event_id,
+        ward_id=ward_id,
+        admin_id=admin_id,
+        election_level="WARD",
+        title=f"Bench Election {election_id}",
+        status="COMPLETED",
+    ))
+
+    first_member = await seed_members(conn, ward_id, max(votes, candidates))
+
+    first_candidate = await next_id(conn, Candidate.candidate_id)
+    candidate_ids = [first_candidate + i for i in range(candidates)]
+    await insert_batched(conn, Candidate, (
+        {
+            "candidate_id": candidate_id,
+            "election_id": election_id,
+            "member_id": first_member + i,
+            "status": "APPROVED",
+        }
+        for i, candidate_id in enumerate(candidate_ids)
+    ))
+
+    await insert_batched(conn, Vote, (
+        {
+            "election_id": election_id,
+            "member_id": first_member + i,
+            "candidate_id": rng.choice(candidate_ids),
+        }
+        for i in range(votes)
+    ))
+
+    return election_id
+
+
+async def seed_vote_matrix(
+    conn: AsyncConnection,
+    elections: int,
+    voters: int,
+    candidates: int = 5,
+    seed: int = 11,
+) -> list[int]:
+    """
+    `elections` completed elections in one ward where each of `voters`
+    members votes once per election: elections * voters vote rows.
+    Returns the election ids.
+    """
+
+    rng = random.Random(seed)
+    ward_id = await seed_ward(conn)
+    admin_id = await seed_admin(conn)
+
+    election_ids = [
+        await seed_election(conn, 0, candidates, seed + i, ward_id=ward_id, admin_id=admin_id)
+        for i in range(elections)
+    ]
+    first_member = await seed_members(conn, ward_id, voters)
+
+    candidates_by_election = {}
+    for candidate_id, election_id in (
+        await conn.execute(
+            select(Candidate.candidate_id, Candidate.election_id)
+            .where(Candidate.election_id.in_(election_ids))
+        )
+    ).all():
+        candidates_by_election.setdefault(election_id, []).append(candidate_id)
+
+    await insert_batched(conn, Vote, (
+        {
+            "election_id": election_id,
+            "member_id": first_member + i,
+            "candidate_id": rng.choice(candidates_by_election[election_id]),
+        }
+        for election_id in election_ids
+        for i in range(voters)
+    ))
+
+    return election_ids
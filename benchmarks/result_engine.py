@@ -0,0 +1,55 @@
+"""
+Benchmark the unified result engine on a single large election.
+
+    python -m benchmarks.result_engine --votes 1000000
+    python -m benchmarks.result_engine --votes 100000 --database-url sqlite+aiosqlite:///bench.db
+
+Seeds one completed election with N votes (plus N voter members), then
+times repeated calculate_election_result(recalculate=True) runs.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+from app.core.database import DATABASE_URL
+from app.services.result_engine import calculate_election_result
+from benchmarks.fixtures import create_schema, seed_election
+
+
+async def main(args):
+    engine = create_async_engine(args.database_url)
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    started = time.perf_counter()
+    async with engine.begin() as conn:
+        await create_schema(conn)
+        election_id = await seed_election(conn, args.votes, args.candidates)
+    print(f"seeded election {election_id} with {args.votes} votes in {time.perf_counter() - started:.1f}s")
+
+    timings = []
+    for _ in range(args.runs):
+        async with session_maker() as db:
+            started = time.perf_counter()
+            result = await calculate_election_result(db, election_id, recalculate=True)
+            timings.append((time.perf_counter() - started) * 1000)
+
+    print(f"result: {result}")
+    print(
+        f"calculate_election_result: runs={args.runs} "
+        f"min={min(timings):.1f}ms median={statistics.median(timings):.1f}ms max={max(timings):.1f}ms"
+    )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--votes", type=int, default=1_000_000)
+    parser.add_argument("--candidates", type=int, default=5)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--database-url", default=DATABASE_URL)
+    asyncio.run(main(parser.parse_args()))
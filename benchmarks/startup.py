@@ -0,0 +1,91 @@
+"""
+Startup time: app import and time until a served pod reports ready.
+
+    python -m benchmarks.startup
+    python -m benchmarks.startup --workers 4 --repeat 5
+    python -m benchmarks.startup --database-url sqlite+aiosqlite:///./startup.db
+
+Runs scripts.migrate once, then measures --repeat times:
+- import:  `import app.main` in a fresh interpreter
+- serve:   `python -m scripts.serve` until GET /health/ready returns 200
+and prints the median and worst of each.
+"""
+
+import argparse
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def time_import(env: dict) -> float:
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "import app.main"], env=env, check=True)
+    return time.perf_counter() - started
+
+
+def time_serve(env: dict, timeout: float) -> float:
+    port = free_port()
+    env = {**env, "HOST": "127.0.0.1", "PORT": str(port)}
+    url = f"http://127.0.0.1:{port}/health/ready"
+
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "scripts.serve"], env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            if server.poll() is not None:
+                raise RuntimeError(f"server exited with {server.returncode}")
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - started
+            except OSError:
+                time.sleep(0.05)
+        raise TimeoutError(f"no 200 from {url} within {timeout}s")
+    finally:
+        os.killpg(server.pid, signal.SIGTERM)
+        server.wait(30)
+
+
+def report(label: str, samples: list[float]):
+    print(f"{label:7} median {statistics.median(samples):6.2f} s   worst {max(samples):6.2f} s   (n={len(samples)})")
+
+
+def main(args):
+    env = {
+        **os.environ,
+        "DATABASE_URL": args.database_url,
+        "SECRET_KEY": os.environ.get("SECRET_KEY", "benchmark-secret"),
+        "APP_ENV": "benchmark",
+        "AUTO_MIGRATE": "false",
+        "WEB_CONCURRENCY": str(args.workers),
+        "SCHEDULER_LOCK_FILE": f"/tmp/startup-benchmark-{os.getpid()}.lock",
+    }
+    env.pop("READ_DATABASE_URL", None)
+
+    subprocess.run([sys.executable, "-m", "scripts.migrate", "--database-url", args.database_url], env=env, check=True)
+
+    report("import", [time_import(env) for _ in range(args.repeat)])
+    report("serve", [time_serve(env, args.timeout) for _ in range(args.repeat)])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default="sqlite+aiosqlite:///./startup_benchmark.db")
+    parser.add_argument("--workers", type=int, default=2, help="WEB_CONCURRENCY (0 = allotted cores)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--timeout", type=float, default=60)
+    main(parser.parse_args())
@@ -0,0 +1,374 @@
+"""
+Synthetic geography and electorate generator.
+
+    python -m benchmarks.synthetic --scale medium --database-url sqlite+aiosqlite:///load.db
+
+Builds states → districts → assemblies → mandals → villages → wards, the
+members of every ward, ward elections (mostly finished, some upcoming)
+with approved nominations, candidates and votes, plus notifications, all
+owned by one APP level admin. Row counts per scale are printed by
+--describe; ids continue after whatever is already in the database.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from dataclasses import dataclass, asdict, replace
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from app.core.database import DATABASE_URL
+from app.models.models import (
+    State, District, Assembly, Mandal, Village, Ward,
+    Member, ElectionEvent, Election, Candidate, Nomination, Vote,
+    Notification, NotificationType,
+)
+from benchmarks.fixtures import create_schema, next_id, insert_batched, seed_admin, _code
+
+
+FIRST_NAMES = [
+    "Ravi", "Sita", "Kiran", "Lakshmi", "Suresh", "Anjali", "Venkat", "Padma",
+    "Ramesh", "Divya", "Srinivas", "Kavya", "Naresh", "Swathi", "Mahesh", "Bhavani",
+]
+LAST_NAMES = [
+    "Kumar", "Reddy", "Rao", "Naidu", "Varma", "Chowdary", "Sharma", "Prasad",
+]
+
+
+@dataclass(frozen=True)
+class SyntheticSpec:
+    states: int = 1
+    districts_per_state: int = 2
+    assemblies_per_district: int = 2
+    mandals_per_assembly: int = 3
+    villages_per_mandal: int = 4
+    wards_per_village: int = 3
+    members_per_ward: int = 40
+    eligible_ratio: float = 0.9
+    active_ratio: float = 0.95
+    election_ward_ratio: float = 0.5      # wards holding an election
+    completed_ratio: float = 0.7          # of those, voting already ended
+    candidates_per_election: int = 4
+    turnout: float = 0.6
+    notifications: int = 200
+
+    @property
+    def wards(self) -> int:
+        return (
+            self.states * self.districts_per_state * self.assemblies_per_district
+            * self.mandals_per_assembly * self.villages_per_mandal * self.wards_per_village
+        )
+
+    @property
+    def members(self) -> int:
+        return self.wards * self.members_per_ward
+
+
+SCALES = {
+    "small": SyntheticSpec(),
+    "medium": SyntheticSpec(
+        districts_per_state=5, assemblies_per_district=4, mandals_per_assembly=4,
+        villages_per_mandal=5, wards_per_village=3, members_per_ward=100,
+    ),
+    # ~2M members
+    "large": SyntheticSpec(
+        states=2, districts_per_state=10, assemblies_per_district=8, mandals_per_assembly=5,
+        villages_per_mandal=10, wards_per_village=4, members_per_ward=60, election_ward_ratio=0.25,
+    ),
+}
+
+
+@dataclass
+class SyntheticData:
+    admin_id: int
+    state_ids: list[int]
+    district_ids: list[int]
+    assembly_ids: list[int]
+    election_ids: list[int]
+    members: int
+    votes: int
+
+
+# =========================================================
+# GEOGRAPHY
+# =========================================================
+
+async def _seed_level(conn: AsyncConnection, model, pk, parents: list[int], per_parent: int, row) -> tuple[list[int], list[int]]:
+    """`per_parent` children under each parent id; returns (child ids, their parent ids)"""
+
+    first = await next_id(conn, pk)
+    ids, owners = [], []
+    for offset, parent_id in enumerate(parents):
+        for i in range(per_parent):
+            ids.append(first + offset * per_parent + i)
+            owners.append(parent_id)
+
+    await insert_batched(conn, model, (row(child_id, parent_id) for child_id, parent_id in zip(ids, owners)))
+    return ids, owners
+
+
+async def seed_geography(conn: AsyncConnection, spec: SyntheticSpec) -> dict[str, list[int]]:
+    first_state = await next_id(conn, State.state_id)
+    state_ids = list(range(first_state, first_state + spec.states))
+    await insert_batched(conn, State, (
+        {"state_id": state_id, "state_code": _code(state_id), "state_name": f"State {state_id}"}
+        for state_id in state_ids
+    ))
+
+    district_ids, _ = await _seed_level(
+        conn, District, District.district_id, state_ids, spec.districts_per_state,
+        lambda i, parent: {"district_id": i, "state_id": parent, "district_name": f"District {i}"},
+    )
+    assembly_ids, _ = await _seed_level(
+        conn, Assembly, Assembly.assembly_id, district_ids, spec.assemblies_per_district,
+        lambda i, parent: {"assembly_id": i, "district_id": parent, "assembly_name": f"Assembly {i}"},
+    )
+    mandal_ids, _ = await _seed_level(
+        conn, Mandal, Mandal.mandal_id, assembly_ids, spec.mandals_per_assembly,
+        lambda i, parent: {"mandal_id": i, "assembly_id": parent, "mandal_name": f"Mandal {i}"},
+    )
+    village_ids, _ = await _seed_level(
+        conn, Village, Village.village_id, mandal_ids, spec.villages_per_mandal,
+        lambda i, parent: {"village_id": i, "mandal_id": parent, "village_name": f"Village {i}"},
+    )
+
+    first_ward = await next_id(conn, Ward.ward_id)
+    ward_ids, ward_villages = await _seed_level(
+        conn, Ward, Ward.ward_id, village_ids, spec.wards_per_village,
+        lambda i, parent: {
+            "ward_id": i,
+            "village_id": parent,
+            "ward_number": (i - first_ward) % spec.wards_per_village + 1,
+            "ward_name": f"Ward {i}",
+        },
+    )
+
+    # Assembly of every ward, for events and notifications
+    wards_per_assembly = spec.mandals_per_assembly * spec.villages_per_mandal * spec.wards_per_village
+    ward_assemblies = [assembly_ids[i // wards_per_assembly] for i in range(len(ward_ids))]
+
+    return {
+        "state_ids": state_ids,
+        "district_ids": district_ids,
+        "assembly_ids": assembly_ids,
+        "ward_ids": ward_ids,
+        "ward_assemblies": ward_assemblies,
+    }
+
+
+# =========================================================
+# ELECTORATE
+# =========================================================
+
+async def seed_electorate(conn: AsyncConnection, spec: SyntheticSpec, ward_ids: list[int], rng: random.Random) -> int:
+    """members_per_ward members in every ward; returns the first member_id"""
+
+    first_member = await next_id(conn, Member.member_id)
+
+    def rows():
+        member_id = first_member
+        for ward_id in ward_ids:
+            for _ in range(spec.members_per_ward):
+                yield {
+                    "member_id": member_id,
+                    "ward_id": ward_id,
+                    "member_number": f"M{member_id:09d}",
+                    "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                    "mobile": f"9{member_id:010d}",
+                    "email": f"member-{member_id}@example.com",
+                    "is_active": rng.random() < spec.active_ratio,
+                    "is_eligible_to_vote": rng.random() < spec.eligible_ratio,
+                }
+                member_id += 1
+
+    await insert_batched(conn, Member, rows())
+    return first_member
+
+
+# =========================================================
+# ELECTIONS
+# =========================================================
+
+async def seed_elections(
+    conn: AsyncConnection,
+    spec: SyntheticSpec,
+    geography: dict[str, list[int]],
+    first_member: int,
+    admin_id: int,
+    rng: random.Random,
+) -> tuple[list[int], int]:
+    """Ward elections with nominations, candidates and votes; returns (election ids, votes)"""
+
+    now = datetime.utcnow()
+
+    # One finished and one upcoming event per assembly
+    first_event = await next_id(conn, ElectionEvent.event_id)
+    events = {}
+    event_rows = []
+    for i, assembly_id in enumerate(geography["assembly_ids"]):
+        past, upcoming = first_event + 2 * i, first_event + 2 * i + 1
+        events[assembly_id] = (past, upcoming)
+        event_rows += [
+            {
+                "event_id": past, "assembly_id": assembly_id, "title": f"Ward Elections {past}",
+                "nomination_start": now - timedelta(days=20), "nomination_end": now - timedelta(days=15),
+                "voting_start": now - timedelta(days=3), "voting_end": now - timedelta(days=1),
+            },
+            {
+                "event_id": upcoming, "assembly_id": assembly_id, "title": f"Ward Elections {upcoming}",
+                "nomination_start": now - timedelta(days=2), "nomination_end": now + timedelta(days=5),
+                "voting_start": now + timedelta(days=10), "voting_end": now + timedelta(days=11),
+            },
+        ]
+    await insert_batched(conn, ElectionEvent, event_rows)
+
+    first_election = await next_id(conn, Election.election_id)
+    first_candidate = await next_id(conn, Candidate.candidate_id)
+
+    elections, candidates, nominations = [], [], []
+    ballots = []  # (election_id, first member, candidate ids)
+
+    election_id, candidate_id = first_election, first_candidate
+    for index, (ward_id, assembly_id) in enumerate(zip(geography["ward_ids"], geography["ward_assemblies"])):
+        if rng.random() >= spec.election_ward_ratio:
+            continue
+
+        completed = rng.random() < spec.completed_ratio
+        ward_first_member = first_member + index * spec.members_per_ward
+
+        elections.append({
+            "election_id": election_id,
+            "event_id": events[assembly_id][0 if completed else 1],
+            "ward_id": ward_id,
+            "admin_id": admin_id,
+            "election_level": "WARD",
+            "title": f"Ward {ward_id} Election",
+            "status": "COMPLETED" if completed else "UPCOMING",
+        })
+
+        ids = []
+        for i in range(min(spec.candidates_per_election, spec.members_per_ward)):
+            candidates.append({
+                "candidate_id": candidate_id,
+                "election_id": election_id,
+                "member_id": ward_first_member + i,
+                "status": "APPROVED",
+            })
+            nominations.append({
+                "candidate_id": candidate_id,
+                "election_id": election_id,
+                "member_id": ward_first_member + i,
+                "bio": "Synthetic candidate",
+                "status": "APPROVED",
+                "reviewed_by": admin_id,
+                "reviewed_at": now - timedelta(days=10),
+            })
+            ids.append(candidate_id)
+            candidate_id += 1
+
+        if completed and ids:
+            ballots.append((election_id, ward_first_member, ids))
+
+        election_id += 1
+
+    await insert_batched(conn, Election, elections)
+    await insert_batched(conn, Candidate, candidates)
+    await insert_batched(conn, Nomination, nominations)
+
+    voters = int(spec.members_per_ward * spec.turnout)
+    await insert_batched(conn, Vote, (
+        {
+            "election_id": ballot_election,
+            "member_id": ward_first_member + i,
+            "candidate_id": rng.choice(ids),
+            "voted_at": now - timedelta(days=2),
+        }
+        for ballot_election, ward_first_member, ids in ballots
+        for i in range(voters)
+    ))
+
+    return [row["election_id"] for row in elections], len(ballots) * voters
+
+
+async def seed_notifications(conn: AsyncConnection, spec: SyntheticSpec, assembly_ids: list[int], admin_id: int, rng: random.Random):
+    types = list(NotificationType)
+    await insert_batched(conn, Notification, (
+        {
+            "admin_id": admin_id,
+            "assembly_id": rng.choice(assembly_ids),
+            "type": rng.choice(types),
+            "title": f"Notification {i}",
+            "message": "Synthetic notification",
+            "recipients_count": spec.members_per_ward,
+            "email_sent": True,
+        }
+        for i in range(spec.notifications)
+    ))
+
+
+async def seed_synthetic(conn: AsyncConnection, spec: SyntheticSpec, seed: int = 2024) -> SyntheticData:
+    rng = random.Random(seed)
+
+    admin_id = await seed_admin(conn)
+    geography = await seed_geography(conn, spec)
+    first_member = await seed_electorate(conn, spec, geography["ward_ids"], rng)
+    election_ids, votes = await seed_elections(conn, spec, geography, first_member, admin_id, rng)
+    await seed_notifications(conn, spec, geography["assembly_ids"], admin_id, rng)
+
+    return SyntheticData(
+        admin_id=admin_id,
+        state_ids=geography["state_ids"],
+        district_ids=geography["district_ids"],
+        assembly_ids=geography["assembly_ids"],
+        election_ids=election_ids,
+        members=spec.members,
+        votes=votes,
+    )
+
+
+def spec_from_args(args) -> SyntheticSpec:
+    """--scale preset, with any explicitly passed --<field> overriding it"""
+    spec = SCALES[args.scale]
+    overrides = {
+        field: getattr(args, field)
+        for field in asdict(spec)
+        if getattr(args, field, None) is not None
+    }
+    return replace(spec, **overrides)
+
+
+def add_spec_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    for field, value in asdict(SyntheticSpec()).items():
+        parser.add_argument(f"--{field.replace('_', '-')}", dest=field, type=type(value), default=None)
+
+
+async def main(args):
+    spec = spec_from_args(args)
+    print(f"{args.scale}: {spec.wards} wards, {spec.members} members")
+    if args.describe:
+        return
+
+    engine = create_async_engine(args.database_url)
+    started = time.perf_counter()
+    async with engine.begin() as conn:
+        await create_schema(conn)
+        data = await seed_synthetic(conn, spec, args.seed)
+    await engine.dispose()
+
+    print(
+        f"seeded admin {data.admin_id}: {len(data.assembly_ids)} assemblies, {data.members} members, "
+        f"{len(data.election_ids)} elections, {data.votes} votes in {time.perf_counter() - started:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=DATABASE_URL)
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--describe", action="store_true", help="print the sizes only")
+    add_spec_arguments(parser)
+    asyncio.run(main(parser.parse_args()))
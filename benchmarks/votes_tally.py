@@ -0,0 +1,114 @@
+"""
+Tally latency on the votes table before and after the covering indexes.
+
+    python -m benchmarks.votes_tally --elections 200 --voters 50000      # 10M votes
+    python -m benchmarks.votes_tally --skip-seed                         # reuse seeded data
+
+Times the three hot read shapes: the per-election GROUP BY tally, the
+winner COUNT outer join from result_service, and the member_service
+"has voted" IN (SELECT member_id FROM votes) count.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from sqlalchemy import select, func, and_
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.database import DATABASE_URL
+from app.models.models import Election, Candidate, Member, Vote
+from benchmarks.fixtures import create_schema, seed_vote_matrix
+from scripts.migrate_votes_storage import ensure_vote_indexes, drop_vote_indexes
+
+
+def tally_query(election_id):
+    return (
+        select(Vote.candidate_id, func.count(Vote.vote_id))
+        .where(Vote.election_id == election_id)
+        .group_by(Vote.candidate_id)
+    )
+
+
+def winner_join_query(election_id):
+    return (
+        select(Candidate.candidate_id, func.count(Vote.vote_id))
+        .join(Election, Election.election_id == Candidate.election_id)
+        .outerjoin(
+            Vote,
+            and_(
+                Vote.election_id == Election.election_id,
+                Vote.candidate_id == Candidate.candidate_id,
+            ),
+        )
+        .where(Election.election_id == election_id)
+        .group_by(Candidate.candidate_id)
+    )
+
+
+def voted_members_query(_):
+    return select(func.count(Member.member_id)).where(Member.member_id.in_(select(Vote.member_id)))
+
+
+QUERIES = {
+    "tally": tally_query,
+    "winner_join": winner_join_query,
+    "voted_members": voted_members_query,
+}
+
+
+async def measure(conn, election_ids, runs):
+    rng = random.Random(3)
+    report = {}
+    for name, build in QUERIES.items():
+        timings = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            (await conn.execute(build(rng.choice(election_ids)))).all()
+            timings.append((time.perf_counter() - started) * 1000)
+        report[name] = statistics.median(timings)
+    return report
+
+
+async def main(args):
+    engine = create_async_engine(args.database_url)
+
+    async with engine.begin() as conn:
+        await create_schema(conn)
+        if not args.skip_seed:
+            started = time.perf_counter()
+            await seed_vote_matrix(conn, args.elections, args.voters)
+            print(f"seeded {args.elections * args.voters} votes in {time.perf_counter() - started:.1f}s")
+
+        election_ids = (await conn.execute(select(Vote.election_id).distinct())).scalars().all()
+        total = (await conn.execute(select(func.count(Vote.vote_id)))).scalar()
+        print(f"votes table: {total} rows across {len(election_ids)} elections")
+
+    async with engine.begin() as conn:
+        await drop_vote_indexes(conn)
+    async with engine.connect() as conn:
+        before = await measure(conn, election_ids, args.runs)
+
+    async with engine.begin() as conn:
+        await ensure_vote_indexes(conn)
+    async with engine.connect() as conn:
+        after = await measure(conn, election_ids, args.runs)
+
+    print(f"{'query':<16}{'before (ms)':>14}{'after (ms)':>14}{'speedup':>10}")
+    for name in QUERIES:
+        speedup = before[name] / after[name] if after[name] else float("inf")
+        print(f"{name:<16}{before[name]:>14.1f}{after[name]:>14.1f}{speedup:>9.1f}x")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--elections", type=int, default=200)
+    parser.add_argument("--voters", type=int, default=50_000)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--skip-seed", action="store_true")
+    parser.add_argument("--database-url", default=DATABASE_URL)
+    asyncio.run(main(parser.parse_args()))
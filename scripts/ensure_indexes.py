@@ -0,0 +1,33 @@
+"""
+Create indexes declared on the models that an existing database lacks.
+
+    python -m scripts.ensure_indexes            # create missing indexes
+    python -m scripts.ensure_indexes --dry-run  # print the SQL
+
+create_all only creates missing tables; indexes added to tables that
+already exist (e.g. the nomination pagination indexes) need this once
+per deployment. scripts.migrate runs it as well.
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.database import DATABASE_URL
+from app.core.schema import ensure_indexes
+
+
+async def main(args):
+    engine = create_async_engine(args.database_url)
+    async with engine.begin() as conn:
+        created = await ensure_indexes(conn, args.dry_run)
+    await engine.dispose()
+    print(f"{'would create' if args.dry_run else 'created'} {len(created)} index(es): {', '.join(created) or '-'}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=DATABASE_URL)
+    parser.add_argument("--dry-run", action="store_true")
+    asyncio.run(main(parser.parse_args()))
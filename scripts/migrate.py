@@ -0,0 +1,37 @@
+"""
+Bring the database schema up to date: missing tables, then missing indexes.
+
+    python -m scripts.migrate
+    python -m scripts.migrate --database-url sqlite+aiosqlite:///./primary.db
+
+Run once per deployment before the new pods start (e.g. as a Kubernetes
+Job or init container). App startup no longer does this unless
+AUTO_MIGRATE is on (the default only in development).
+"""
+
+import argparse
+import asyncio
+import time
+
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.database import DATABASE_URL
+from app.core.schema import migrate
+
+
+async def main(args):
+    engine = create_async_engine(args.database_url)
+    started = time.perf_counter()
+    async with engine.begin() as conn:
+        created = await migrate(conn)
+    await engine.dispose()
+    print(
+        f"schema up to date in {time.perf_counter() - started:.2f} s; "
+        f"created {len(created)} index(es): {', '.join(created) or '-'}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=DATABASE_URL)
+    asyncio.run(main(parser.parse_args()))
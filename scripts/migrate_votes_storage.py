@@ -0,0 +1,193 @@
+"""
+Migrate the `votes` table to the tally-friendly storage layout.
+
+    python -m scripts.migrate_votes_storage                    # covering indexes only
+    python -m scripts.migrate_votes_storage --dry-run          # print the SQL
+    python -m scripts.migrate_votes_storage --rollback         # drop the covering indexes again
+    python -m scripts.migrate_votes_storage --partition election --partition-size 50000
+    python -m scripts.migrate_votes_storage --partition voted_at --from-month 2025-01 --months 36
+
+Indexes are safe to add online on any deployment. Partitioning is optional
+and MySQL-only: partitioned InnoDB tables cannot have foreign keys, and the
+partition column must be part of every unique key, so --partition drops the
+votes foreign keys and widens the primary key. Referential integrity for
+votes is then enforced by the application only.
+"""
+
+import argparse
+import asyncio
+from datetime import date
+
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from app.core.database import DATABASE_URL
+from app.models.models import Vote
+
+
+# On MySQL the covering indexes also back the election_id / member_id
+# foreign keys (InnoDB reuses an index led by the FK column), so they can
+# only be dropped while these single-column indexes stand in for them.
+FK_INDEXES = {
+    "idx_vote_election_fk": "election_id",
+    "idx_vote_member_fk": "member_id",
+}
+
+
+def _existing_indexes(sync_conn) -> set[str]:
+    return {index["name"] for index in inspect(sync_conn).get_indexes(Vote.__tablename__)}
+
+
+async def ensure_vote_indexes(conn: AsyncConnection, dry_run: bool = False) -> list[str]:
+    """Create the covering indexes declared on Vote if they are missing"""
+
+    existing = await conn.run_sync(_existing_indexes)
+    created = []
+
+    for index in Vote.__table__.indexes:
+        if index.name in existing:
+            continue
+        if dry_run:
+            print(f"CREATE INDEX {index.name} ON votes ({', '.join(c.name for c in index.columns)});")
+        else:
+            await conn.run_sync(index.create)
+        created.append(index.name)
+
+    # The covering indexes back the foreign keys again: drop the stand-ins
+    if conn.dialect.name == "mysql":
+        for name in FK_INDEXES:
+            if name in existing:
+                if dry_run:
+                    print(f"DROP INDEX {name} ON votes;")
+                else:
+                    await conn.execute(text(f"DROP INDEX {name} ON votes"))
+
+    return created
+
+
+async def drop_vote_indexes(conn: AsyncConnection, dry_run: bool = False) -> list[str]:
+    """
+    Remove the covering indexes again (rollback, and the "before" side of
+    benchmarks/votes_tally.py). On MySQL the foreign keys first get
+    single-column indexes, otherwise DROP INDEX fails with error 1553.
+    """
+
+    existing = await conn.run_sync(_existing_indexes)
+    dropped = []
+
+    if conn.dialect.name == "mysql":
+        for name, column in FK_INDEXES.items():
+            if name not in existing:
+                statement = f"CREATE INDEX {name} ON votes ({column})"
+                if dry_run:
+                    print(f"{statement};")
+                else:
+                    await conn.execute(text(statement))
+
+    for index in Vote.__table__.indexes:
+        if index.name in existing:
+            if dry_run:
+                print(f"DROP INDEX {index.name} ON votes;")
+            else:
+                await conn.run_sync(index.drop)
+            dropped.append(index.name)
+
+    return dropped
+
+
+def _election_partitions(max_election_id: int, size: int) -> list[str]:
+    bounds = range(size, max_election_id + size + 1, size)
+    parts = [f"PARTITION p{bound} VALUES LESS THAN ({bound})" for bound in bounds]
+    parts.append("PARTITION pmax VALUES LESS THAN MAXVALUE")
+    return parts
+
+
+def _month_partitions(first: date, months: int) -> list[str]:
+    parts = []
+    year, month = first.year, first.month
+    for _ in range(months):
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        parts.append(f"PARTITION p{year:04d}{month:02d} VALUES LESS THAN ('{year:04d}-{month:02d}-01')")
+    parts.append("PARTITION pmax VALUES LESS THAN (MAXVALUE)")
+    return parts
+
+
+async def partition_votes(conn: AsyncConnection, args) -> list[str]:
+    """Statements that convert votes into a RANGE partitioned table"""
+
+    foreign_keys = (
+        await conn.execute(
+            text(
+                "SELECT CONSTRAINT_NAME FROM information_schema.REFERENTIAL_CONSTRAINTS "
+                "WHERE CONSTRAINT_SCHEMA = DATABASE() AND TABLE_NAME = 'votes'"
+            )
+        )
+    ).scalars().all()
+
+    statements = [f"ALTER TABLE votes DROP FOREIGN KEY `{name}`" for name in foreign_keys]
+
+    if args.partition == "election":
+        max_election_id = (
+            await conn.execute(text("SELECT COALESCE(MAX(election_id), 0) FROM votes"))
+        ).scalar()
+        statements += [
+            "ALTER TABLE votes DROP PRIMARY KEY, ADD PRIMARY KEY (vote_id, election_id)",
+            "ALTER TABLE votes PARTITION BY RANGE (election_id) (\n    "
+            + ",\n    ".join(_election_partitions(max_election_id, args.partition_size))
+            + "\n)",
+        ]
+    else:
+        first = date.fromisoformat(f"{args.from_month}-01")
+        statements += [
+            "UPDATE votes SET voted_at = CURRENT_TIMESTAMP WHERE voted_at IS NULL",
+            "ALTER TABLE votes MODIFY voted_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+            "ALTER TABLE votes DROP PRIMARY KEY, ADD PRIMARY KEY (vote_id, voted_at)",
+            "ALTER TABLE votes PARTITION BY RANGE COLUMNS (voted_at) (\n    "
+            + ",\n    ".join(_month_partitions(first, args.months))
+            + "\n)",
+        ]
+
+    for statement in statements:
+        if args.dry_run:
+            print(f"{statement};")
+        else:
+            await conn.execute(text(statement))
+
+    return statements
+
+
+async def main(args):
+    engine = create_async_engine(args.database_url)
+
+    async with engine.begin() as conn:
+        if not await conn.run_sync(lambda sync_conn: inspect(sync_conn).has_table(Vote.__tablename__)):
+            raise SystemExit("votes table does not exist; start the app or create the schema first")
+
+        if args.rollback:
+            dropped = await drop_vote_indexes(conn, args.dry_run)
+            print(f"indexes dropped: {dropped or 'none (not present)'}")
+            await engine.dispose()
+            return
+
+        created = await ensure_vote_indexes(conn, args.dry_run)
+        print(f"indexes created: {created or 'none (already present)'}")
+
+        if args.partition != "none":
+            if engine.dialect.name != "mysql":
+                raise SystemExit("Partitioning is only supported on MySQL")
+            statements = await partition_votes(conn, args)
+            print(f"partitioning statements {'printed' if args.dry_run else 'applied'}: {len(statements)}")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=DATABASE_URL)
+    parser.add_argument("--partition", choices=["none", "election", "voted_at"], default="none")
+    parser.add_argument("--partition-size", type=int, default=50_000, help="election ids per partition")
+    parser.add_argument("--from-month", default=f"{date.today():%Y-%m}", help="first voted_at month (YYYY-MM)")
+    parser.add_argument("--months", type=int, default=24, help="monthly voted_at partitions to create")
+    parser.add_argument("--rollback", action="store_true", help="drop the covering indexes (not partitioning)")
+    parser.add_argument("--dry-run", action="store_true")
+    asyncio.run(main(parser.parse_args()))
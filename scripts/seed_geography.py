@@ -0,0 +1,77 @@
+"""
+Bulk load geography from CSV / NDJSON (optionally .gz) or Parquet files.
+
+    python -m scripts.seed_geography --states states.csv --districts districts.csv \
+        --assemblies assemblies.csv --mandals mandals.csv --villages villages.csv --wards wards.csv
+    python -m scripts.seed_geography --villages villages.csv.gz --restart
+
+Levels load top-down, so each file can refer to rows of the previous ones.
+Every row names its parents by natural key:
+
+    states      state_code, state_name[, capital]
+    districts   state_code, district_name[, district_code, headquarters]
+    assemblies  + district_name, assembly_name[, assembly_code, assembly_type]
+    mandals     + assembly_name, mandal_name[, mandal_code]
+    villages    + mandal_name, village_name[, village_code, postal_code, population, area_sq_km]
+    wards       + village_name, ward_number, ward_name[, is_active]
+
+Existing rows are updated in place (upsert on the natural key). An
+interrupted load resumes from its checkpoint unless --restart is given.
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+from app.core.database import DATABASE_URL
+from app.models.models import Base
+from app.services.import_service import import_file, IMPORT_CHUNK_SIZE
+
+
+LEVELS = ["states", "districts", "assemblies", "mandals", "villages", "wards"]
+
+
+def print_progress(stats):
+    print(
+        f"  {stats.entity}: {stats.rows} rows, {stats.loaded} loaded, {stats.rejected} rejected, "
+        f"{stats.rows_per_second:,.0f} rows/s",
+        flush=True,
+    )
+
+
+async def main(args):
+    engine = create_async_engine(args.database_url)
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    for level in LEVELS:
+        path = getattr(args, level)
+        if not path:
+            continue
+
+        print(f"{level} ← {path}")
+        async with session_maker() as db:
+            summary = await import_file(
+                db, level, path,
+                chunk_size=args.chunk_size,
+                resume=not args.restart,
+                progress=print_progress,
+            )
+        print(f"  done: {summary}")
+        if summary["rejected"]:
+            print(f"  rejected rows: {path}.rejects.csv")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=DATABASE_URL)
+    for level in LEVELS:
+        parser.add_argument(f"--{level}", help=f"{level} file")
+    parser.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE)
+    parser.add_argument("--restart", action="store_true", help="ignore checkpoints and load from the first row")
+    asyncio.run(main(parser.parse_args()))
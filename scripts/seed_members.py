@@ -0,0 +1,49 @@
+"""
+Bulk load members from CSV / NDJSON (optionally .gz) or Parquet.
+
+    python -m scripts.seed_members members.csv
+    python -m scripts.seed_members members.ndjson.gz --chunk-size 10000 --restart
+
+Columns: member_number, name, mobile, email[, photo_url, is_active,
+is_eligible_to_vote] plus the ward, either as ward_id or as its natural
+key (state_code, district_name, assembly_name, mandal_name, village_name,
+ward_number). Members are upserted on member_number. Load the geography
+first (scripts.seed_geography).
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+from app.core.database import DATABASE_URL
+from app.services.import_service import import_file, IMPORT_CHUNK_SIZE
+from scripts.seed_geography import print_progress
+
+
+async def main(args):
+    engine = create_async_engine(args.database_url)
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with session_maker() as db:
+        summary = await import_file(
+            db, "members", args.path,
+            chunk_size=args.chunk_size,
+            resume=not args.restart,
+            progress=print_progress,
+        )
+
+    print(f"done: {summary}")
+    if summary["rejected"]:
+        print(f"rejected rows: {args.path}.rejects.csv")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path")
+    parser.add_argument("--database-url", default=DATABASE_URL)
+    parser.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE)
+    parser.add_argument("--restart", action="store_true", help="ignore the checkpoint and load from the first row")
+    asyncio.run(main(parser.parse_args()))
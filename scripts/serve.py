@@ -0,0 +1,60 @@
+"""
+Production server: uvicorn with one worker process per allotted core.
+
+    python -m scripts.serve
+    WEB_CONCURRENCY=4 PORT=8080 python -m scripts.serve
+
+WEB_CONCURRENCY=0 (default) sizes the worker count from the container's
+CPU quota (cgroup cpu.max) or CPU affinity. Unless CPU_WORKERS is set,
+each worker gets an even share of the cores for its CPU executor pool.
+Schema changes are not applied here: run `python -m scripts.migrate`
+first (see AUTO_MIGRATE).
+"""
+
+import math
+import os
+
+import uvicorn
+
+from app.core.config import Config
+
+
+def allotted_cores() -> int:
+    """CPUs this process may use: affinity, capped by a cgroup v2 quota"""
+    if hasattr(os, "sched_getaffinity"):
+        cores = len(os.sched_getaffinity(0))
+    else:
+        cores = os.cpu_count() or 1
+
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            cores = min(cores, math.ceil(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass
+
+    return max(1, cores)
+
+
+def main():
+    cores = allotted_cores()
+    workers = Config.WEB_CONCURRENCY or cores
+
+    # Read by Config in every worker process
+    os.environ.setdefault("CPU_WORKERS", str(max(1, cores // workers)))
+
+    uvicorn.run(
+        "app.main:app",
+        host=Config.HOST,
+        port=Config.PORT,
+        workers=workers,
+        proxy_headers=True,
+        forwarded_allow_ips="*",
+        # Let background jobs hand their work back before the worker exits
+        timeout_graceful_shutdown=Config.JOB_SHUTDOWN_GRACE_SECONDS + 5,
+    )
+
+
+if __name__ == "__main__":
+    main()
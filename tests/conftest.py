@@ -0,0 +1,66 @@
+"""
+App under test: a fresh SQLite file seeded with a small synthetic
+electorate, driven in-process through httpx's ASGI transport.
+
+    pip install -r requirements-dev.txt
+    python -m pytest -q
+"""
+
+import os
+import tempfile
+
+import pytest
+
+from benchmarks.load import configure
+
+_database = os.path.join(tempfile.mkdtemp(prefix="election-tests-"), "test.db")
+
+# Must happen before anything under app/ is imported
+configure(f"sqlite+aiosqlite:///{_database}")
+os.environ["QUERY_DEBUG_HEADER"] = "true"
+os.environ["CPU_WORKERS"] = "0"
+
+TEST_SPEC = dict(
+    districts_per_state=1, assemblies_per_district=2, mandals_per_assembly=2,
+    villages_per_mandal=2, wards_per_village=2, members_per_ward=20, notifications=20,
+)
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    # One event loop for the whole session: the engine's pool is bound to it
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+async def seeded(anyio_backend):
+    from app.core.database import engine
+    from app.services.result_scheduler import auto_complete_and_calculate
+    from benchmarks.fixtures import create_schema
+    from benchmarks.synthetic import SyntheticSpec, seed_synthetic
+
+    async with engine.begin() as conn:
+        await create_schema(conn)
+        data = await seed_synthetic(conn, SyntheticSpec(**TEST_SPEC))
+
+    # Calculates the seeded elections the result routes read
+    await auto_complete_and_calculate()
+
+    yield data
+    await engine.dispose()
+
+
+@pytest.fixture
+async def client(seeded):
+    import httpx
+
+    from app.core.security import create_access_token
+    from app.main import app
+
+    token = create_access_token({"admin_id": seeded.admin_id})
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://test",
+        headers={"authorization": f"Bearer {token}"},
+    ) as client:
+        yield client
@@ -0,0 +1,92 @@
+"""Bulk review: overlapping requests and the shared rejection-reason rule"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def pending(seeded):
+    """(election_id, ids of PENDING nominations by members without a candidacy)"""
+    from sqlalchemy import delete, insert, select
+
+    from app.core.database import async_session_maker
+    from app.models.models import Candidate, Election, Member, Nomination
+    from app.services.nomination_stats_service import rebuild_nomination_stats
+
+    election_id = seeded.election_ids[-2]
+    async with async_session_maker() as db:
+        ward_id = (await db.execute(select(Election.ward_id).where(Election.election_id == election_id))).scalar()
+        member_ids = list((await db.execute(
+            select(Member.member_id)
+            .where(Member.ward_id == ward_id, Member.member_id.not_in(select(Candidate.member_id)))
+            .limit(4)
+        )).scalars())
+        connection = await db.connection()
+        await connection.execute(insert(Nomination.__table__), [
+            {"election_id": election_id, "member_id": m, "status": "PENDING", "applied_at": datetime.utcnow()}
+            for m in member_ids
+        ])
+        nomination_ids = list((await db.execute(
+            select(Nomination.nomination_id).where(Nomination.member_id.in_(member_ids))
+        )).scalars())
+        await rebuild_nomination_stats(db, [election_id])
+        await db.commit()
+
+    yield election_id, nomination_ids
+
+    async with async_session_maker() as db:
+        await db.execute(delete(Nomination).where(Nomination.nomination_id.in_(nomination_ids)))
+        await db.execute(delete(Candidate).where(Candidate.member_id.in_(member_ids)))
+        await rebuild_nomination_stats(db, [election_id])
+        await db.commit()
+
+
+@pytest.mark.parametrize("decision", ["APPROVED", "REJECTED"])
+async def test_overlapping_bulk_reviews_apply_each_nomination_once(pending, seeded, decision):
+    from app.core.database import async_session_maker
+    from app.services.nomination_service import bulk_review_nominations
+    from app.services.nomination_stats_service import read_nomination_stats
+
+    election_id, nomination_ids = pending
+
+    async def review():
+        async with async_session_maker() as db:
+            return await bulk_review_nominations(db, nomination_ids, decision, seeded.admin_id, "Duplicate entry")
+
+    async with async_session_maker() as db:
+        before = await read_nomination_stats(db, election_id=election_id)
+
+    first, second = await asyncio.gather(review(), review())
+
+    assert first["succeeded"] + second["succeeded"] == len(nomination_ids)
+    assert first["skipped"] + second["skipped"] == len(nomination_ids)
+
+    async with async_session_maker() as db:
+        after = await read_nomination_stats(db, election_id=election_id)
+    counter = decision.lower()
+    assert after[counter] == before[counter] + len(nomination_ids)
+
+
+@pytest.mark.parametrize("path", ["/nominations/bulk-review", "/candidates/bulk-review"])
+@pytest.mark.parametrize("reason", [None, "", "   ", "no"])
+async def test_bulk_reject_needs_a_reason(client, path, reason):
+    response = await client.post(path, json={"ids": [1], "decision": "REJECTED", "reason": reason})
+
+    assert response.status_code == 422
+    assert "minimum 5 characters" in response.text
+
+
+async def test_single_reject_uses_the_same_rule(client, pending):
+    _, nomination_ids = pending
+
+    response = await client.post(f"/nominations/{nomination_ids[0]}/reject", json={"reason": "no"})
+    assert response.status_code == 422
+    assert "minimum 5 characters" in response.text
+
+    response = await client.post(f"/nominations/{nomination_ids[0]}/reject", json={"reason": "  Duplicate entry  "})
+    assert response.status_code == 200, response.text
+    assert response.json() == {"message": "Nomination rejected"}
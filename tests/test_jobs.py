@@ -0,0 +1,55 @@
+"""JobWorker shutdown: what happens to jobs still running after the grace period"""
+
+import asyncio
+
+import pytest
+
+from app.core.jobs import FAILED, QUEUED, JobWorker, enqueue, job_handler
+
+pytestmark = pytest.mark.anyio
+
+
+_started: dict[int, asyncio.Event] = {}
+
+
+async def _hang(ctx, payload):
+    _started.setdefault(ctx.job_id, asyncio.Event()).set()
+    await asyncio.Event().wait()
+
+
+job_handler("test.hang_once", max_attempts=1)(_hang)
+job_handler("test.hang_retryable", max_attempts=3)(_hang)
+
+
+async def _interrupt(kind: str):
+    from app.core.database import async_session_maker
+    from app.models.models import Job
+
+    async with async_session_maker() as db:
+        job_id = (await enqueue(db, kind, {})).job_id
+
+    worker = JobWorker(concurrency=2)
+    worker.start()
+    await worker.poll()
+    await asyncio.wait_for(_started.setdefault(job_id, asyncio.Event()).wait(), 5)
+    await worker.stop(grace_seconds=0.01)
+
+    async with async_session_maker() as db:
+        return await db.get(Job, job_id)
+
+
+async def test_shutdown_fails_job_that_must_not_repeat(seeded):
+    job = await _interrupt("test.hang_once")
+
+    assert job.status == FAILED
+    assert job.error == "Interrupted by shutdown"
+    assert job.attempts == 1
+    assert job.finished_at is not None
+
+
+async def test_shutdown_requeues_retryable_job(seeded):
+    job = await _interrupt("test.hang_retryable")
+
+    assert job.status == QUEUED
+    assert job.attempts == 0
+    assert job.worker_id is None
@@ -0,0 +1,115 @@
+"""nomination_stats counters kept in step with candidates and reviews"""
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def election(seeded):
+    """(election_id, member ids in its ward without a candidacy), stats backfilled"""
+    from sqlalchemy import delete, select
+
+    from app.core.database import async_session_maker
+    from app.models.models import Candidate, Election, Member
+    from app.services.nomination_stats_service import rebuild_nomination_stats
+
+    election_id = seeded.election_ids[-1]
+    async with async_session_maker() as db:
+        ward_id = (await db.execute(select(Election.ward_id).where(Election.election_id == election_id))).scalar()
+        member_ids = list((await db.execute(
+            select(Member.member_id)
+            .where(Member.ward_id == ward_id, Member.member_id.not_in(select(Candidate.member_id)))
+            .limit(3)
+        )).scalars())
+        await rebuild_nomination_stats(db, [election_id])
+        await db.commit()
+
+    yield election_id, member_ids
+
+    async with async_session_maker() as db:
+        await db.execute(delete(Candidate).where(Candidate.member_id.in_(member_ids)))
+        await rebuild_nomination_stats(db, [election_id])
+        await db.commit()
+
+
+async def _stats(election_id: int) -> dict:
+    from app.core.database import async_session_maker
+    from app.services.nomination_stats_service import read_nomination_stats
+
+    async with async_session_maker() as db:
+        return await read_nomination_stats(db, election_id=election_id)
+
+
+async def _recounted(election_id: int) -> dict:
+    """What a full recount would say, without keeping it"""
+    from app.core.database import async_session_maker
+    from app.services.nomination_stats_service import read_nomination_stats, rebuild_nomination_stats
+
+    async with async_session_maker() as db:
+        await rebuild_nomination_stats(db, [election_id])
+        stats = await read_nomination_stats(db, election_id=election_id)
+        await db.rollback()
+    return stats
+
+
+async def test_new_pending_candidate_counts_in_same_transaction(election):
+    from app.core.database import async_session_maker
+    from app.models.models import Candidate
+
+    election_id, member_ids = election
+    before = await _stats(election_id)
+
+    async with async_session_maker() as db:
+        db.add_all([Candidate(election_id=election_id, member_id=m) for m in member_ids[:2]])
+        await db.rollback()
+    assert await _stats(election_id) == before
+
+    async with async_session_maker() as db:
+        db.add_all([Candidate(election_id=election_id, member_id=m) for m in member_ids[:2]])
+        await db.commit()
+
+    after = await _stats(election_id)
+    assert after["pending"] == before["pending"] + 2
+    assert after == await _recounted(election_id)
+
+
+async def test_review_moves_candidate_out_of_pending(election, seeded):
+    from app.core.database import async_session_maker
+    from app.models.models import Candidate
+    from app.services.candidate_service import approve_candidate, reject_candidate
+
+    election_id, member_ids = election
+    async with async_session_maker() as db:
+        candidates = [Candidate(election_id=election_id, member_id=m) for m in member_ids[:2]]
+        db.add_all(candidates)
+        await db.commit()
+        first, second = (c.candidate_id for c in candidates)
+    before = await _stats(election_id)
+
+    async with async_session_maker() as db:
+        await approve_candidate(db, first, seeded.admin_id)
+    async with async_session_maker() as db:
+        await reject_candidate(db, second, seeded.admin_id, "Incomplete documents")
+
+    after = await _stats(election_id)
+    assert after["pending"] == before["pending"] - 2
+    assert after["approved"] == before["approved"] + 1
+    assert after["rejected"] == before["rejected"] + 1
+    assert after == await _recounted(election_id)
+
+
+async def test_backfill_leaves_existing_counters_alone(election):
+    from sqlalchemy import update
+
+    from app.core.database import async_session_maker
+    from app.models.models import NominationStats
+    from app.services.nomination_stats_service import rebuild_nomination_stats
+
+    election_id, _ = election
+    async with async_session_maker() as db:
+        await db.execute(update(NominationStats).where(NominationStats.election_id == election_id).values(pending=99))
+        assert await rebuild_nomination_stats(db, [election_id], missing_only=True) == 0
+        await db.commit()
+
+    assert (await _stats(election_id))["pending"] == 99
@@ -0,0 +1,93 @@
+"""GET /candidates/all and GET /nominations/: filters, total and keyset pages"""
+
+from datetime import datetime
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def pending_nomination(seeded):
+    from sqlalchemy import delete, insert, select
+
+    from app.core.database import engine
+    from app.models.models import Election, Member, Nomination
+
+    election_id = seeded.election_ids[0]
+    async with engine.begin() as conn:
+        ward_id = (await conn.execute(select(Election.ward_id).where(Election.election_id == election_id))).scalar()
+        member_id = (await conn.execute(select(Member.member_id).where(Member.ward_id == ward_id).limit(1))).scalar()
+        nomination_id = (await conn.execute(insert(Nomination).values(
+            election_id=election_id,
+            member_id=member_id,
+            status="PENDING",
+            applied_at=datetime.utcnow(),
+        ))).inserted_primary_key[0]
+
+    yield nomination_id
+
+    async with engine.begin() as conn:
+        await conn.execute(delete(Nomination).where(Nomination.nomination_id == nomination_id))
+
+
+# Far more pages than the seeded data has; a cursor that stops advancing
+# fails here instead of hanging the run
+MAX_PAGES = 100
+
+
+async def _walk(client, url: str) -> tuple[int, list[dict]]:
+    response = await client.get(url)
+    assert response.status_code == 200, response.text
+    page = response.json()
+    total, rows = page["total"], page["nominations"]
+
+    for _ in range(MAX_PAGES):
+        if not page["next_cursor"]:
+            break
+        response = await client.get(f"{url}&cursor={page['next_cursor']}")
+        assert response.status_code == 200, response.text
+        page = response.json()
+        assert page["total"] is None
+        rows += page["nominations"]
+    else:
+        pytest.fail(f"{url}: cursor still set after {MAX_PAGES} pages")
+
+    return total, rows
+
+
+async def test_lists_pending_nominations_with_real_total(client, seeded, pending_nomination):
+    total, rows = await _walk(client, f"/candidates/all?election_id={seeded.election_ids[0]}&limit=2")
+
+    ids = [row["nomination_id"] for row in rows]
+    assert pending_nomination in ids
+    assert len(ids) == len(set(ids)) == total
+    assert total > 2
+
+
+async def test_status_filter_applies_to_total(client, seeded, pending_nomination):
+    total, rows = await _walk(client, f"/candidates/all?election_id={seeded.election_ids[0]}&status=PENDING")
+
+    assert total == 1
+    assert [row["nomination_id"] for row in rows] == [pending_nomination]
+
+
+async def test_assembly_filter_total_matches_pages(client, seeded):
+    total, rows = await _walk(client, f"/candidates/all?assembly_id={seeded.assembly_ids[0]}&limit=3")
+
+    assert total == len(rows) > 0
+
+
+async def test_nominations_pages_cover_every_nomination_once(client, pending_nomination):
+    from sqlalchemy import select, func
+
+    from app.core.database import engine
+    from app.models.models import Nomination
+
+    async with engine.connect() as conn:
+        count = (await conn.execute(select(func.count(Nomination.nomination_id)))).scalar()
+
+    total, rows = await _walk(client, "/nominations/?limit=7")
+
+    ids = [row["nomination_id"] for row in rows]
+    assert len(ids) == len(set(ids)) == total == count
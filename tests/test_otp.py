@@ -0,0 +1,58 @@
+"""DatabaseOTPBackend: rate limit, superseding and one-time verification"""
+
+import asyncio
+
+import pytest
+
+from app.core.otp import DatabaseOTPBackend, OTPBackend, OTPRateLimitError
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def member_id(seeded):
+    from sqlalchemy import delete, select, func
+
+    from app.core.database import engine
+    from app.models.models import Member, OTP
+
+    async with engine.begin() as conn:
+        member_id = (await conn.execute(select(func.max(Member.member_id)))).scalar()
+        await conn.execute(delete(OTP).where(OTP.member_id == member_id))
+    return member_id
+
+
+def test_backend_is_abstract():
+    with pytest.raises(TypeError):
+        OTPBackend()
+
+
+async def test_issue_stops_at_max_sends(member_id):
+    from app.core.database import async_session_maker
+
+    backend = DatabaseOTPBackend()
+    async with async_session_maker() as db:
+        codes = [await backend.issue(db, member_id) for _ in range(backend.max_sends)]
+        with pytest.raises(OTPRateLimitError):
+            await backend.issue(db, member_id)
+
+        # Only the newest code is live, and only once
+        assert codes[0] == codes[-1] or not await backend.verify(db, member_id, codes[0])
+        assert await backend.verify(db, member_id, codes[-1])
+        assert not await backend.verify(db, member_id, codes[-1])
+
+
+async def test_concurrent_issue_respects_max_sends(member_id):
+    from app.core.database import async_session_maker
+
+    backend = DatabaseOTPBackend()
+
+    async def issue():
+        async with async_session_maker() as db:
+            try:
+                return await backend.issue(db, member_id)
+            except OTPRateLimitError:
+                return None
+
+    issued = await asyncio.gather(*(issue() for _ in range(backend.max_sends * 3)))
+    assert sum(code is not None for code in issued) == backend.max_sends
@@ -0,0 +1,93 @@
+"""
+Statement budgets for the list endpoints that used to be N+1, checked
+with query_budget, plus the X-DB-Queries header the middleware adds.
+Budgets include the admin lookup of a cold auth cache.
+"""
+
+import re
+
+import pytest
+
+from app.core.query_stats import QueryBudgetExceeded, query_budget, track_queries
+
+pytestmark = pytest.mark.anyio
+
+
+# (url, budget); a row-count independent budget is what catches an N+1
+ENDPOINT_BUDGETS = [
+    ("/members/", 5),
+    ("/members/?voted=yes", 5),
+    ("/members/?district_id={district_id}", 5),
+    ("/nominations/?limit=50", 3),
+    ("/nominations/?limit=5", 3),
+    ("/candidates/all?election_id={election_id}", 3),
+    ("/candidates/all?assembly_id={assembly_id}&status=ALL", 3),
+    ("/results/admin/all?page=1&limit=20", 3),
+    ("/results/admin/assembly/{assembly_id}?page=1&limit=20", 3),
+]
+
+
+def _url(template: str, seeded) -> str:
+    return template.format(
+        district_id=seeded.district_ids[0],
+        assembly_id=seeded.assembly_ids[0],
+        election_id=seeded.election_ids[0],
+    )
+
+
+def _header_count(response) -> int:
+    match = re.match(r"count=(\d+);", response.headers["x-db-queries"])
+    assert match, response.headers["x-db-queries"]
+    return int(match.group(1))
+
+
+@pytest.mark.parametrize("template, budget", ENDPOINT_BUDGETS)
+async def test_endpoint_within_query_budget(client, seeded, template, budget):
+    url = _url(template, seeded)
+
+    with query_budget(budget, f"GET {url}"):
+        response = await client.get(url)
+
+    assert response.status_code == 200, response.text
+
+
+async def test_nominations_queries_do_not_grow_with_page_size(client):
+    counts = []
+    for limit in (1, 10, 50):
+        with track_queries() as stats:
+            response = await client.get(f"/nominations/?limit={limit}")
+        assert response.status_code == 200, response.text
+        counts.append(stats.count)
+
+    assert len(set(counts[1:])) == 1, counts
+
+
+@pytest.mark.parametrize("template, budget", ENDPOINT_BUDGETS)
+async def test_query_header_matches_statements_issued(client, seeded, template, budget):
+    url = _url(template, seeded)
+
+    with track_queries() as stats:
+        response = await client.get(url)
+
+    assert response.status_code == 200, response.text
+    assert _header_count(response) == stats.count
+    assert f"shapes={len(stats.shapes)}" in response.headers["x-db-queries"]
+
+
+async def test_query_budget_raises_when_exceeded(client):
+    with pytest.raises(QueryBudgetExceeded, match=r"GET /members/ issued \d+ queries \(budget 0\)"):
+        with query_budget(0, "GET /members/"):
+            await client.get("/members/")
+
+
+async def test_query_budget_reports_repeated_statements(seeded):
+    from sqlalchemy import select
+
+    from app.core.database import engine
+    from app.models.models import Member
+
+    with pytest.raises(QueryBudgetExceeded, match=r"repeated: 3x SELECT"):
+        with query_budget(2):
+            async with engine.connect() as conn:
+                for member_id in range(1, 4):
+                    await conn.execute(select(Member.name).where(Member.member_id == member_id))